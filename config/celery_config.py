@@ -1,6 +1,8 @@
 import os
 from celery import Celery
+from celery.signals import worker_process_init
 from kombu import Queue
+from config.settings import NOTIFICATION_OUTBOX_DISPATCH_INTERVAL_SECONDS, RECONCILIATION_INTERVAL_SECONDS
 
 # Configuração do Redis
 REDIS_HOST = os.getenv('REDIS_HOST', 'payment-microservice-redis')
@@ -20,7 +22,12 @@ celery_app = Celery(
     'payment_microservice',
     broker=REDIS_URL,
     backend=REDIS_URL,
-    include=['src.adapters.driven.notification_providers.celery_notification_service']
+    include=[
+        'src.adapters.driven.notification_providers.celery_notification_service',
+        'src.adapters.driven.notification_providers.celery_notification_outbox',
+        'src.adapters.driven.webhook_queue.celery_webhook_queue',
+        'src.adapters.driven.reconciliation.celery_payment_reconciliation',
+    ]
 )
 
 # Configurações do Celery
@@ -39,6 +46,9 @@ celery_app.conf.update(
         'send_payment_notification_task': {
             'queue': 'notifications'
         },
+        'dispatch_payment_notifications_task': {
+            'queue': 'notifications'
+        },
     },
     task_default_queue='default',
     task_queues=(
@@ -56,6 +66,27 @@ celery_app.conf.update(
     # Configuração de retry para conexão
     broker_connection_retry_on_startup=True,
     broker_connection_retry=True,
+    # Tarefas periódicas (executadas pelo serviço celery-beat)
+    beat_schedule={
+        'reconcile-pending-payments': {
+            'task': 'reconcile_pending_payments_task',
+            'schedule': RECONCILIATION_INTERVAL_SECONDS,
+            # Rodadas atrasadas são descartadas em vez de se acumularem na fila
+            'options': {'expires': RECONCILIATION_INTERVAL_SECONDS},
+        },
+        'dispatch-payment-notifications': {
+            'task': 'dispatch_payment_notifications_task',
+            'schedule': NOTIFICATION_OUTBOX_DISPATCH_INTERVAL_SECONDS,
+            'options': {'expires': NOTIFICATION_OUTBOX_DISPATCH_INTERVAL_SECONDS},
+        },
+    },
 )
 
 celery_app.autodiscover_tasks()
+
+
+@worker_process_init.connect
+def init_worker_db_connection(**kwargs):
+    """Conecta cada processo worker ao MongoDB (necessário para processar webhooks enfileirados)"""
+    from config.database import connect_db
+    connect_db()
@@ -1,5 +1,6 @@
 from ast import alias
 from mongoengine import connect, disconnect
+from pymongo import AsyncMongoClient
 import os
 
 DELETE_MODE = os.getenv('DELETE_MODE', 'soft').lower()  # Default to 'soft' delete mode
@@ -86,4 +87,32 @@ def get_db():
     return mongoengine_get_db()
 
 
-__all__ = ['MongoDBConfig', 'connect_db', 'disconnect_db', 'get_db']
+_async_client: AsyncMongoClient | None = None
+
+
+def connect_async_db() -> AsyncMongoClient:
+    """Create the shared async MongoDB client used by the async repositories"""
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncMongoClient(MongoDBConfig.get_connection_string())
+        print("Async MongoDB client created")
+    return _async_client
+
+
+async def disconnect_async_db():
+    """Close the shared async MongoDB client"""
+    global _async_client
+    if _async_client is not None:
+        await _async_client.close()
+        _async_client = None
+        print("Async MongoDB client closed")
+
+
+def get_async_db():
+    """
+    Get the async MongoDB database used by the async repositories
+    """
+    return connect_async_db()[os.getenv('MONGO_DB', 'payment_service')]
+
+
+__all__ = ['MongoDBConfig', 'connect_db', 'disconnect_db', 'get_db', 'connect_async_db', 'disconnect_async_db', 'get_async_db']
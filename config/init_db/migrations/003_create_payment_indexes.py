@@ -0,0 +1,62 @@
+# Obtém a conexão com o banco de dados MongoDB config/database.py e cria os índices da coleção de pagamentos.
+# índices: external_reference (único), transaction_id (único e esparso), (payment_status, created_at),
+# (payment_status, _id) e (payment_method, _id)
+
+from config.database import connect_db
+from src.adapters.driven.repositories.models.payment_model import PaymentModel
+
+revision: str = '003'
+down_revision: str = '002'
+branch_labels: str | None = None
+depends_on: str | None = None
+
+unique_fields = ['external_reference', 'transaction_id']
+
+def find_duplicates(field: str) -> list:
+    """
+    Retorna os valores repetidos de um campo, que impediriam a criação de um índice único.
+    """
+    pipeline = [
+        {'$match': {field: {'$exists': True, '$ne': None}}},
+        {'$group': {'_id': f'${field}', 'count': {'$sum': 1}}},
+        {'$match': {'count': {'$gt': 1}}},
+        {'$limit': 10},
+    ]
+    return [item['_id'] for item in PaymentModel._get_collection().aggregate(pipeline)]
+
+def upgrade() -> None:
+    """
+    Cria em background os índices declarados em PaymentModel.
+    """
+    # Ensure database connection
+    connect_db()
+
+    for field in unique_fields:
+        duplicates = find_duplicates(field)
+        if duplicates:
+            raise RuntimeError(f"Valores duplicados em '{field}' impedem o índice único: {duplicates}")
+
+    missing = PaymentModel.missing_indexes()
+    if not missing:
+        print("Payment indexes already exist, skipping creation.")
+        return
+
+    PaymentModel.ensure_indexes()
+    for index in missing:
+        print(f"Payment index {index} created successfully.")
+
+def downgrade() -> None:
+    """
+    Remove os índices criados na migração de upgrade.
+    """
+    # Ensure database connection
+    connect_db()
+
+    collection = PaymentModel._get_collection()
+    existing = collection.index_information()
+    for spec in PaymentModel._meta['index_specs']:
+        if spec['name'] in existing:
+            collection.drop_index(spec['name'])
+            print(f"Payment index '{spec['name']}' removed successfully.")
+        else:
+            print(f"Payment index '{spec['name']}' not found, skipping removal.")
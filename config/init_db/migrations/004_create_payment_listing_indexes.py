@@ -0,0 +1,50 @@
+# Obtém a conexão com o banco de dados MongoDB config/database.py e cria os índices da listagem paginada de pagamentos.
+# índices: (created_at, _id), (payment_status, created_at, _id) e (payment_method, created_at, _id), decrescentes;
+# (payment_status, created_at) da migração 003 é removido, pois é prefixo de (payment_status, created_at, _id)
+
+from pymongo import ASCENDING
+
+from config.database import connect_db
+from src.adapters.driven.repositories.models.payment_model import PaymentModel
+
+revision: str = '004'
+down_revision: str = '003'
+branch_labels: str | None = None
+depends_on: str | None = None
+
+listing_indexes = ['created_at_id', 'payment_status_created_at_id', 'payment_method_created_at_id']
+replaced_index = 'payment_status_created_at'
+
+def upgrade() -> None:
+    """
+    Cria em background os índices da listagem e remove o índice substituído.
+    """
+    # Ensure database connection
+    connect_db()
+
+    PaymentModel.ensure_indexes()
+    print(f"Payment indexes {listing_indexes} created successfully.")
+
+    collection = PaymentModel._get_collection()
+    if replaced_index in collection.index_information():
+        collection.drop_index(replaced_index)
+        print(f"Payment index '{replaced_index}' removed successfully.")
+
+def downgrade() -> None:
+    """
+    Remove os índices da listagem e recria o índice (payment_status, created_at).
+    """
+    # Ensure database connection
+    connect_db()
+
+    collection = PaymentModel._get_collection()
+    collection.create_index(
+        [('payment_status', ASCENDING), ('created_at', ASCENDING)], name=replaced_index, background=True
+    )
+    existing = collection.index_information()
+    for name in listing_indexes:
+        if name in existing:
+            collection.drop_index(name)
+            print(f"Payment index '{name}' removed successfully.")
+        else:
+            print(f"Payment index '{name}' not found, skipping removal.")
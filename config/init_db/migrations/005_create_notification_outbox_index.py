@@ -0,0 +1,37 @@
+# Obtém a conexão com o banco de dados MongoDB config/database.py e cria o índice do outbox de notificações.
+# índice: notification_pending, parcial (apenas documentos com notification_pending = true), para que o
+# despachante encontre as notificações pendentes sem percorrer os pagamentos já notificados
+
+from config.database import connect_db
+from src.adapters.driven.repositories.models.payment_model import PaymentModel
+
+revision: str = '005'
+down_revision: str = '004'
+branch_labels: str | None = None
+depends_on: str | None = None
+
+outbox_index = 'notification_pending_partial'
+
+def upgrade() -> None:
+    """
+    Cria em background o índice parcial do outbox de notificações.
+    """
+    # Ensure database connection
+    connect_db()
+
+    PaymentModel.ensure_indexes()
+    print(f"Payment index '{outbox_index}' created successfully.")
+
+def downgrade() -> None:
+    """
+    Remove o índice parcial do outbox de notificações.
+    """
+    # Ensure database connection
+    connect_db()
+
+    collection = PaymentModel._get_collection()
+    if outbox_index in collection.index_information():
+        collection.drop_index(outbox_index)
+        print(f"Payment index '{outbox_index}' removed successfully.")
+    else:
+        print(f"Payment index '{outbox_index}' not found, skipping removal.")
@@ -19,3 +19,83 @@ MERCADO_PAGO_USER_ID = os.getenv('MERCADO_PAGO_USER_ID')
 MERCADO_PAGO_POS_ID = os.getenv('MERCADO_PAGO_POS_ID')
 
 WEBHOOK_URL = os.getenv('WEBHOOK_URL')
+
+# Cache de dados de referência (status e métodos de pagamento)
+REFERENCE_DATA_CACHE_TTL_SECONDS = float(os.getenv("REFERENCE_DATA_CACHE_TTL_SECONDS", 300))
+REFERENCE_DATA_CACHE_PUBSUB_ENABLED = os.getenv("REFERENCE_DATA_CACHE_PUBSUB_ENABLED", "false").lower() in ("true", "1")
+
+# Cliente HTTP assíncrono do Mercado Pago (pool de conexões e timeouts por fase, em segundos)
+MERCADO_PAGO_HTTP2_ENABLED = os.getenv("MERCADO_PAGO_HTTP2_ENABLED", "false").lower() in ("true", "1")
+MERCADO_PAGO_HTTP_MAX_CONNECTIONS = int(os.getenv("MERCADO_PAGO_HTTP_MAX_CONNECTIONS", 100))
+MERCADO_PAGO_HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("MERCADO_PAGO_HTTP_MAX_KEEPALIVE_CONNECTIONS", 20))
+MERCADO_PAGO_HTTP_KEEPALIVE_EXPIRY = float(os.getenv("MERCADO_PAGO_HTTP_KEEPALIVE_EXPIRY", 30))
+MERCADO_PAGO_HTTP_CONNECT_TIMEOUT = float(os.getenv("MERCADO_PAGO_HTTP_CONNECT_TIMEOUT", 5))
+MERCADO_PAGO_HTTP_READ_TIMEOUT = float(os.getenv("MERCADO_PAGO_HTTP_READ_TIMEOUT", 15))
+MERCADO_PAGO_HTTP_WRITE_TIMEOUT = float(os.getenv("MERCADO_PAGO_HTTP_WRITE_TIMEOUT", 5))
+MERCADO_PAGO_HTTP_POOL_TIMEOUT = float(os.getenv("MERCADO_PAGO_HTTP_POOL_TIMEOUT", 5))
+
+# Consultas simultâneas ao mesmo recurso do Mercado Pago são agrupadas; o resultado é reaproveitado por este tempo (segundos)
+MERCADO_PAGO_VERIFY_CACHE_TTL_SECONDS = float(os.getenv("MERCADO_PAGO_VERIFY_CACHE_TTL_SECONDS", 2))
+
+# Idempotência de webhooks: por quanto tempo (em segundos) uma entrega processada é lembrada
+WEBHOOK_IDEMPOTENCY_TTL_SECONDS = float(os.getenv("WEBHOOK_IDEMPOTENCY_TTL_SECONDS", 86400))
+
+# Criação de pagamentos em lote: tamanho máximo do lote e chamadas simultâneas ao provedor
+PAYMENT_BATCH_MAX_SIZE = int(os.getenv("PAYMENT_BATCH_MAX_SIZE", 100))
+PAYMENT_BATCH_MAX_CONCURRENCY = int(os.getenv("PAYMENT_BATCH_MAX_CONCURRENCY", 10))
+
+# Reprocessamento em lote de webhooks: consultas simultâneas ao provedor
+WEBHOOK_REPLAY_MAX_CONCURRENCY = int(os.getenv("WEBHOOK_REPLAY_MAX_CONCURRENCY", 10))
+
+# Exportação de pagamentos em streaming: documentos por lote do cursor do MongoDB
+PAYMENT_EXPORT_BATCH_SIZE = int(os.getenv("PAYMENT_EXPORT_BATCH_SIZE", 1000))
+
+# Listagem paginada de pagamentos: tamanho padrão e máximo da página
+PAYMENT_LIST_DEFAULT_LIMIT = int(os.getenv("PAYMENT_LIST_DEFAULT_LIMIT", 50))
+PAYMENT_LIST_MAX_LIMIT = int(os.getenv("PAYMENT_LIST_MAX_LIMIT", 200))
+
+# Conciliação de pagamentos pendentes com o provedor (Celery beat)
+RECONCILIATION_INTERVAL_SECONDS = int(os.getenv("RECONCILIATION_INTERVAL_SECONDS", 300))
+RECONCILIATION_PENDING_OLDER_THAN_MINUTES = int(os.getenv("RECONCILIATION_PENDING_OLDER_THAN_MINUTES", 15))
+RECONCILIATION_BATCH_SIZE = int(os.getenv("RECONCILIATION_BATCH_SIZE", 200))
+RECONCILIATION_MAX_CONCURRENCY = int(os.getenv("RECONCILIATION_MAX_CONCURRENCY", 5))
+RECONCILIATION_RATE_LIMIT_PER_SECOND = float(os.getenv("RECONCILIATION_RATE_LIMIT_PER_SECOND", 10))
+RECONCILIATION_MAX_PAYMENTS_PER_RUN = int(os.getenv("RECONCILIATION_MAX_PAYMENTS_PER_RUN", 5000))
+
+# Outbox de notificações de pagamento: intervalo do despachante (Celery beat), tamanho do lote,
+# duração da reserva de um lote (segundos) e lotes por execução
+NOTIFICATION_OUTBOX_DISPATCH_INTERVAL_SECONDS = int(os.getenv("NOTIFICATION_OUTBOX_DISPATCH_INTERVAL_SECONDS", 5))
+NOTIFICATION_OUTBOX_BATCH_SIZE = int(os.getenv("NOTIFICATION_OUTBOX_BATCH_SIZE", 200))
+NOTIFICATION_OUTBOX_LEASE_SECONDS = int(os.getenv("NOTIFICATION_OUTBOX_LEASE_SECONDS", 300))
+NOTIFICATION_OUTBOX_MAX_BATCHES = int(os.getenv("NOTIFICATION_OUTBOX_MAX_BATCHES", 50))
+
+# Envio concorrente das notificações do outbox: requisições simultâneas no total e por host de destino,
+# hosts com pool de conexões keep-alive mantido e timeout de cada envio (segundos)
+NOTIFICATION_DISPATCH_MAX_CONCURRENCY = int(os.getenv("NOTIFICATION_DISPATCH_MAX_CONCURRENCY", 200))
+NOTIFICATION_DISPATCH_MAX_CONNECTIONS_PER_HOST = int(os.getenv("NOTIFICATION_DISPATCH_MAX_CONNECTIONS_PER_HOST", 10))
+NOTIFICATION_DISPATCH_MAX_HOSTS = int(os.getenv("NOTIFICATION_DISPATCH_MAX_HOSTS", 100))
+NOTIFICATION_DISPATCH_KEEPALIVE_EXPIRY = float(os.getenv("NOTIFICATION_DISPATCH_KEEPALIVE_EXPIRY", 30))
+NOTIFICATION_DISPATCH_TIMEOUT_SECONDS = float(os.getenv("NOTIFICATION_DISPATCH_TIMEOUT_SECONDS", 10))
+
+# Circuit breaker por host de notification_url, compartilhado entre workers via Redis: falhas (dentro da
+# janela, em segundos) que abrem o circuito, tempo aberto até a chamada de teste e duração máxima do teste
+NOTIFICATION_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("NOTIFICATION_CIRCUIT_FAILURE_THRESHOLD", 5))
+NOTIFICATION_CIRCUIT_FAILURE_WINDOW_SECONDS = int(os.getenv("NOTIFICATION_CIRCUIT_FAILURE_WINDOW_SECONDS", 60))
+NOTIFICATION_CIRCUIT_OPEN_SECONDS = int(os.getenv("NOTIFICATION_CIRCUIT_OPEN_SECONDS", 30))
+NOTIFICATION_CIRCUIT_PROBE_TIMEOUT_SECONDS = int(os.getenv("NOTIFICATION_CIRCUIT_PROBE_TIMEOUT_SECONDS", 30))
+
+# Estratégia do serviço híbrido de notificação (sequential, race, enqueue_first ou weighted) e pesos
+# por serviço da estratégia weighted, no formato "http:1,celery:3"
+NOTIFICATION_STRATEGY = os.getenv("NOTIFICATION_STRATEGY", "sequential")
+NOTIFICATION_STRATEGY_WEIGHTS = {
+    name.strip(): float(weight)
+    for name, weight in (
+        item.split(":", 1) for item in os.getenv("NOTIFICATION_STRATEGY_WEIGHTS", "http:1,celery:1").split(",") if item.strip()
+    )
+}
+
+# Limites do identity map de cada requisição/task: entidades e tamanho aproximado em bytes (0 desativa);
+# com referências fracas, entidades que ninguém mais referencia saem do mapa
+IDENTITY_MAP_MAX_ENTRIES = int(os.getenv("IDENTITY_MAP_MAX_ENTRIES", 10000))
+IDENTITY_MAP_MAX_BYTES = int(os.getenv("IDENTITY_MAP_MAX_BYTES", 32 * 1024 * 1024))
+IDENTITY_MAP_WEAK_REFS = os.getenv("IDENTITY_MAP_WEAK_REFS", "false").lower() in ("true", "1")
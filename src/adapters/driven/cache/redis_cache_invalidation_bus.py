@@ -0,0 +1,66 @@
+import json
+import logging
+import uuid
+from typing import Callable, Dict, List
+
+import redis
+
+from src.core.ports.cache.i_cache_invalidation_bus import ICacheInvalidationBus
+
+logger = logging.getLogger(__name__)
+
+
+class RedisCacheInvalidationBus(ICacheInvalidationBus):
+    """
+    Propaga invalidações de cache entre réplicas usando Redis pub/sub.
+    """
+
+    def __init__(self, redis_url: str, channel: str = "payment-microservice:reference-data-cache"):
+        self._client = redis.Redis.from_url(redis_url)
+        self._channel = channel
+        self._origin = uuid.uuid4().hex
+        self._callbacks: Dict[str, List[Callable[[], None]]] = {}
+        self._pubsub = None
+        self._thread = None
+
+    def publish(self, namespace: str) -> None:
+        message = json.dumps({"namespace": namespace, "origin": self._origin})
+        try:
+            self._client.publish(self._channel, message)
+        except redis.RedisError as e:
+            logger.warning(f"Falha ao publicar invalidação do cache {namespace}: {e}")
+
+    def subscribe(self, namespace: str, callback: Callable[[], None]) -> None:
+        self._callbacks.setdefault(namespace, []).append(callback)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(**{self._channel: self._handle_message})
+        self._thread = self._pubsub.run_in_thread(sleep_time=1, daemon=True)
+        logger.info(f"Escutando invalidações de cache no canal {self._channel}")
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._thread.stop()
+        self._pubsub.close()
+        self._thread = None
+        self._pubsub = None
+
+    def _handle_message(self, message: dict) -> None:
+        try:
+            data = json.loads(message["data"])
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Mensagem de invalidação de cache inválida: {e}")
+            return
+
+        if data.get("origin") == self._origin:
+            return
+
+        for callback in self._callbacks.get(data.get("namespace"), []):
+            callback()
+
+
+__all__ = ["RedisCacheInvalidationBus"]
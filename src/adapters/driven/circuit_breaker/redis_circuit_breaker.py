@@ -0,0 +1,104 @@
+import logging
+import time
+
+import redis
+
+from config.settings import (
+    NOTIFICATION_CIRCUIT_FAILURE_THRESHOLD,
+    NOTIFICATION_CIRCUIT_FAILURE_WINDOW_SECONDS,
+    NOTIFICATION_CIRCUIT_OPEN_SECONDS,
+    NOTIFICATION_CIRCUIT_PROBE_TIMEOUT_SECONDS,
+)
+from src.constants.circuit_state import CircuitState
+from src.core.ports.notification.i_circuit_breaker import ICircuitBreaker
+
+logger = logging.getLogger(__name__)
+
+
+class RedisCircuitBreaker(ICircuitBreaker):
+    """
+    Circuit breakers por destino com estado no Redis, compartilhado por todos os workers e réplicas.
+
+    Por destino são mantidas três chaves: o contador de falhas da janela atual, o instante até o qual
+    o circuito fica aberto e a reserva da chamada de teste (meio-aberto), que um único chamador obtém
+    com `SET NX`. Se o Redis estiver indisponível o circuito é considerado fechado: o breaker nunca
+    impede uma entrega por falha própria.
+    """
+
+    def __init__(
+        self,
+        redis_url: str = None,
+        client: redis.Redis = None,
+        prefix: str = "payment-microservice:circuit",
+        failure_threshold: int = NOTIFICATION_CIRCUIT_FAILURE_THRESHOLD,
+        failure_window_seconds: int = NOTIFICATION_CIRCUIT_FAILURE_WINDOW_SECONDS,
+        open_seconds: int = NOTIFICATION_CIRCUIT_OPEN_SECONDS,
+        probe_timeout_seconds: int = NOTIFICATION_CIRCUIT_PROBE_TIMEOUT_SECONDS,
+    ):
+        self._client = client if client is not None else redis.Redis.from_url(redis_url)
+        self._prefix = prefix
+        self.failure_threshold = failure_threshold
+        self.failure_window_seconds = failure_window_seconds
+        self.open_seconds = open_seconds
+        self.probe_timeout_seconds = probe_timeout_seconds
+
+    def acquire(self, key: str) -> CircuitState:
+        try:
+            open_until = self._client.get(self._key(key, "open_until"))
+            if open_until is None:
+                return CircuitState.CLOSED
+            if time.time() < float(open_until):
+                return CircuitState.OPEN
+            # Intervalo de abertura encerrado: apenas um chamador faz a chamada de teste
+            if self._client.set(self._key(key, "probe"), 1, nx=True, ex=self.probe_timeout_seconds):
+                return CircuitState.HALF_OPEN
+            return CircuitState.OPEN
+        except redis.RedisError as e:
+            logger.warning(f"Circuit breaker indisponível para {key}, chamada liberada: {e}")
+            return CircuitState.CLOSED
+
+    def record_success(self, key: str) -> None:
+        try:
+            self._client.delete(self._key(key, "failures"), self._key(key, "open_until"), self._key(key, "probe"))
+        except redis.RedisError as e:
+            logger.warning(f"Falha ao registrar sucesso no circuit breaker de {key}: {e}")
+
+    def record_failure(self, key: str) -> None:
+        try:
+            # Falha com o circuito já aberto (chamada de teste ou iniciada antes da abertura): reabre
+            if self._client.exists(self._key(key, "open_until")):
+                self._open(key)
+                return
+
+            failures = self._client.incr(self._key(key, "failures"))
+            if failures == 1:
+                self._client.expire(self._key(key, "failures"), self.failure_window_seconds)
+            if failures >= self.failure_threshold:
+                self._open(key)
+        except redis.RedisError as e:
+            logger.warning(f"Falha ao registrar falha no circuit breaker de {key}: {e}")
+
+    def retry_after(self, key: str) -> float:
+        try:
+            open_until = self._client.get(self._key(key, "open_until"))
+        except redis.RedisError:
+            return 0.0
+        if open_until is None:
+            return 0.0
+        return max(float(open_until) - time.time(), 0.0)
+
+    def _open(self, key: str) -> None:
+        logger.warning(f"Circuito aberto para {key} por {self.open_seconds}s")
+        # Sem chamadas por um intervalo após a abertura, o estado expira e o circuito volta a fechar
+        self._client.set(
+            self._key(key, "open_until"),
+            time.time() + self.open_seconds,
+            ex=self.open_seconds + self.probe_timeout_seconds + self.failure_window_seconds,
+        )
+        self._client.delete(self._key(key, "failures"), self._key(key, "probe"))
+
+    def _key(self, key: str, name: str) -> str:
+        return f"{self._prefix}:{key}:{name}"
+
+
+__all__ = ["RedisCircuitBreaker"]
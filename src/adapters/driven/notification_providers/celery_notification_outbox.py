@@ -0,0 +1,29 @@
+import logging
+from typing import Dict
+from config.celery_config import celery_app
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(bind=True, name='dispatch_payment_notifications_task')
+def dispatch_payment_notifications_task(self) -> Dict[str, int]:
+    """
+    Task Celery, agendada pelo `celery-beat`, que esvazia o outbox de notificações de pagamento.
+    Cada lote é entregue concorrentemente pelo próprio worker da fila `notifications`, reaproveitando
+    as conexões com os hosts de destino, em vez de uma task (e uma conexão) por notificação.
+    """
+    from src.core.containers import Container
+    from src.core.shared.identity_map import IdentityMap
+    from src.application.usecases.payment_usecase.dispatch_payment_notifications_usecase import (
+        DispatchPaymentNotificationsUseCase
+    )
+
+    logger.info(f"Despachando outbox de notificações. Task ID: {self.request.id}")
+
+    # Cada task tem seu próprio identity map, como cada requisição HTTP
+    with IdentityMap.scope():
+        use_case = DispatchPaymentNotificationsUseCase.build(
+            payment_gateway=Container.payment_gateway(),
+            notification_service=Container.notification_dispatcher(),
+        )
+        return use_case.execute()
@@ -2,8 +2,12 @@ import logging
 import os
 from typing import Dict, Any
 from celery import Task
+from celery.utils.time import get_exponential_backoff_interval
 import requests
 from config.celery_config import celery_app
+from src.adapters.driven.notification_providers.notification_request import build_notification_request, notification_host
+from src.constants.circuit_state import CircuitState
+from src.core.ports.notification.i_notification_retry_scheduler import INotificationRetryScheduler
 from src.core.ports.notification.i_notification_service import INotificationService
 
 logger = logging.getLogger(__name__)
@@ -30,15 +34,36 @@ class CeleryNotificationService(INotificationService):
             return False
 
 
+class CeleryNotificationRetryScheduler(INotificationRetryScheduler):
+    """Agenda o reenvio na fila `notifications`, com o mesmo backoff das tentativas da task"""
+
+    def schedule_retry(self, notification_url: str, payment_data: Dict[str, Any]) -> bool:
+        countdown = get_exponential_backoff_interval(
+            factor=NotificationTask.retry_backoff,
+            retries=0,
+            maximum=NotificationTask.retry_backoff_max,
+            full_jitter=NotificationTask.retry_jitter,
+        )
+        try:
+            task = send_payment_notification_task.apply_async((notification_url, payment_data), countdown=countdown)
+            logger.info(f"Reenvio da notificação para {notification_url} agendado em {countdown}s. Task ID: {task.id}")
+            return True
+        except Exception as e:
+            logger.error(f"Falha ao agendar reenvio da notificação para {notification_url}. Erro: {e}")
+            return False
+
+
 class NotificationTask(Task):
-    """Task customizada com retry automático"""
+    """Task customizada com retry automático (backoff exponencial com jitter)"""
     autoretry_for = (Exception,)
     retry_kwargs = {
         'max_retries': int(os.getenv('CELERY_NOTIFICATION_MAX_RETRIES', 3)),
         'countdown': int(os.getenv('CELERY_NOTIFICATION_RETRY_DELAY_SECONDS', 5))
     }
-    retry_backoff = True
-    retry_jitter = False
+    # Espera aleatória entre 0 e min(máximo, fator × 2^tentativa) segundos
+    retry_backoff = int(os.getenv('CELERY_NOTIFICATION_RETRY_DELAY_SECONDS', 5))
+    retry_backoff_max = int(os.getenv('CELERY_NOTIFICATION_RETRY_BACKOFF_MAX_SECONDS', 600))
+    retry_jitter = True
 
 
 @celery_app.task(bind=True, base=NotificationTask, name='send_payment_notification_task')
@@ -50,22 +75,19 @@ def send_payment_notification_task(self, notification_url: str, payment_data: Di
     :param payment_data: Dados do pagamento
     :return: True se enviado com sucesso
     """
+    from src.core.containers import Container
+
     logger.info(f"Executando task assíncrona de notificação. Task ID: {self.request.id}")
+
+    # Destino com o circuito aberto: a entrega é adiada até a chamada de teste, sem ocupar o worker
+    circuit_breaker = Container.notification_circuit_breaker()
+    host = notification_host(notification_url) if circuit_breaker is not None else None
+    if circuit_breaker is not None and circuit_breaker.acquire(host) is CircuitState.OPEN:
+        countdown = max(circuit_breaker.retry_after(host), 1)
+        logger.warning(f"Circuito aberto para {host}: notificação adiada por {countdown:.0f}s. Task ID: {self.request.id}")
+        raise self.retry(countdown=countdown)
     
-    headers = {
-        'Content-Type': 'application/json',
-        'User-Agent': 'Payment-Microservice/1.0'
-    }
-    
-    payload = {
-        'event': 'payment.completed',
-        'payment_id': payment_data.get('payment_id'),
-        'external_reference': payment_data.get('external_reference'),
-        'amount': payment_data.get('amount'),
-        'status': payment_data.get('status'),
-        'transaction_id': payment_data.get('transaction_id'),
-        'timestamp': payment_data.get('timestamp')
-    }
+    payload, headers = build_notification_request(payment_data)
     
     logger.info(f"Enviando notificação HTTP para {notification_url}")
     
@@ -79,8 +101,12 @@ def send_payment_notification_task(self, notification_url: str, payment_data: Di
         response.raise_for_status()
         
         logger.info(f"Notificação assíncrona enviada com sucesso. Task ID: {self.request.id}")
+        if circuit_breaker is not None:
+            circuit_breaker.record_success(host)
         return True
         
     except requests.exceptions.RequestException as e:
         logger.error(f"Erro na task assíncrona {self.request.id}: {e}")
+        if circuit_breaker is not None:
+            circuit_breaker.record_failure(host)
         raise e
\ No newline at end of file
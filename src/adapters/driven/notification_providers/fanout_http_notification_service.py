@@ -0,0 +1,182 @@
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from config.settings import (
+    NOTIFICATION_DISPATCH_MAX_CONCURRENCY,
+    NOTIFICATION_DISPATCH_MAX_CONNECTIONS_PER_HOST,
+    NOTIFICATION_DISPATCH_MAX_HOSTS,
+    NOTIFICATION_DISPATCH_KEEPALIVE_EXPIRY,
+    NOTIFICATION_DISPATCH_TIMEOUT_SECONDS,
+)
+from src.adapters.driven.notification_providers.notification_request import build_notification_request, notification_host
+from src.constants.circuit_state import CircuitState
+from src.core.ports.notification.i_circuit_breaker import ICircuitBreaker
+from src.core.ports.notification.i_notification_service import INotificationService
+
+logger = logging.getLogger(__name__)
+
+
+class FanoutHttpNotificationService(INotificationService):
+    """
+    Envia lotes de notificações concorrentemente a partir de um único processo.
+
+    Cada host de destino tem seu próprio `httpx.AsyncClient`, com conexões keep-alive reaproveitadas
+    entre lotes, e um limite de requisições simultâneas, para que um cliente lento não ocupe todas as
+    conexões nem receba mais requisições do que suporta. O envio é feito em um event loop próprio do
+    serviço, que sobrevive entre chamadas (e entre tasks do mesmo worker) junto com os pools.
+
+    Com um `ICircuitBreaker`, hosts com o circuito aberto não recebem requisições (a notificação falha
+    de imediato e volta ao outbox) e, no meio-aberto, recebem uma única notificação do lote como teste.
+    Cada lote conta como uma observação por host: sucesso se alguma entrega ao host funcionou.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = NOTIFICATION_DISPATCH_MAX_CONCURRENCY,
+        max_connections_per_host: int = NOTIFICATION_DISPATCH_MAX_CONNECTIONS_PER_HOST,
+        max_hosts: int = NOTIFICATION_DISPATCH_MAX_HOSTS,
+        keepalive_expiry: float = NOTIFICATION_DISPATCH_KEEPALIVE_EXPIRY,
+        timeout: float = NOTIFICATION_DISPATCH_TIMEOUT_SECONDS,
+        circuit_breaker: ICircuitBreaker = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.max_concurrency = max_concurrency
+        self.max_connections_per_host = max_connections_per_host
+        self.max_hosts = max_hosts
+        self.keepalive_expiry = keepalive_expiry
+        self.timeout = timeout
+        self.circuit_breaker = circuit_breaker
+        self._transport = transport
+        self._clients: "OrderedDict[str, httpx.AsyncClient]" = OrderedDict()
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        self._loop = asyncio.new_event_loop()
+        self._lock = threading.Lock()
+
+    def send_payment_notification(self, notification_url: str, payment_data: Dict[str, Any]) -> bool:
+        return self.send_payment_notifications([(notification_url, payment_data)])[0]
+
+    def send_payment_notifications(self, notifications: List[Tuple[str, Dict[str, Any]]]) -> List[bool]:
+        """
+        Envia o lote concorrentemente, respeitando os limites global e por host.
+
+        :param notifications: Pares (URL da notificação, dados do pagamento)
+        :return: Resultado de cada envio, na ordem do lote
+        """
+        if not notifications:
+            return []
+        with self._lock:
+            return self._loop.run_until_complete(self.asend_payment_notifications(notifications))
+
+    async def asend_payment_notifications(self, notifications: List[Tuple[str, Dict[str, Any]]]) -> List[bool]:
+        limit = asyncio.Semaphore(self.max_concurrency)
+        hosts = [self._host(notification_url) for notification_url, _ in notifications]
+        allowed = self._allowed(hosts)
+
+        async def send(index: int) -> bool:
+            if not allowed[index]:
+                return False
+            async with limit:
+                return await self._send(hosts[index], *notifications[index])
+
+        try:
+            results = list(await asyncio.gather(*(send(index) for index in range(len(notifications)))))
+        finally:
+            await self._evict_idle_hosts()
+
+        self._record_outcomes(hosts, allowed, results)
+        return results
+
+    async def _send(self, host: str, notification_url: str, payment_data: Dict[str, Any]) -> bool:
+        payload, headers = build_notification_request(payment_data)
+        async with self._host_limit(host):
+            try:
+                response = await self._client(host).post(notification_url, json=payload, headers=headers)
+                response.raise_for_status()
+                return True
+            except httpx.HTTPError as e:
+                logger.warning(f"Falha ao enviar notificação para {notification_url}. Erro: {e}")
+                return False
+
+    @staticmethod
+    def _host(notification_url: str) -> Optional[str]:
+        try:
+            return notification_host(notification_url)
+        except ValueError as e:
+            logger.error(str(e))
+            return None
+
+    def _allowed(self, hosts: List[Optional[str]]) -> List[bool]:
+        states: Dict[str, CircuitState] = {}
+        allowed = []
+        for host in hosts:
+            if host is None:
+                allowed.append(False)
+                continue
+            if host not in states:
+                states[host] = self.circuit_breaker.acquire(host) if self.circuit_breaker else CircuitState.CLOSED
+                if states[host] is CircuitState.OPEN:
+                    logger.info(f"Circuito aberto para {host}: notificações adiadas")
+                allowed.append(states[host] is not CircuitState.OPEN)
+            else:
+                # No meio-aberto, apenas a primeira notificação do host é enviada
+                allowed.append(states[host] is CircuitState.CLOSED)
+        return allowed
+
+    def _record_outcomes(self, hosts: List[Optional[str]], allowed: List[bool], results: List[bool]) -> None:
+        if self.circuit_breaker is None:
+            return
+        outcomes: Dict[str, bool] = {}
+        for host, was_sent, result in zip(hosts, allowed, results):
+            if was_sent:
+                outcomes[host] = outcomes.get(host, False) or result
+        for host, succeeded in outcomes.items():
+            if succeeded:
+                self.circuit_breaker.record_success(host)
+            else:
+                self.circuit_breaker.record_failure(host)
+
+    def _host_limit(self, host: str) -> asyncio.Semaphore:
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.max_connections_per_host)
+        return self._host_limits[host]
+
+    def _client(self, host: str) -> httpx.AsyncClient:
+        client = self._clients.get(host)
+        if client is None:
+            client = httpx.AsyncClient(
+                transport=self._transport,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections_per_host,
+                    max_keepalive_connections=self.max_connections_per_host,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+                timeout=self.timeout,
+            )
+            self._clients[host] = client
+        self._clients.move_to_end(host)
+        return client
+
+    async def _evict_idle_hosts(self) -> None:
+        # Mantém os pools apenas dos hosts usados mais recentemente
+        while len(self._clients) > self.max_hosts:
+            host, client = self._clients.popitem(last=False)
+            self._host_limits.pop(host, None)
+            await client.aclose()
+
+    def close(self) -> None:
+        """
+        Fecha as conexões mantidas e o event loop do serviço.
+        """
+        with self._lock:
+            if self._loop.is_closed():
+                return
+            for client in self._clients.values():
+                self._loop.run_until_complete(client.aclose())
+            self._clients.clear()
+            self._host_limits.clear()
+            self._loop.close()
@@ -1,43 +1,38 @@
 import requests
 import logging
-import os
 from typing import Dict, Any
+from src.adapters.driven.notification_providers.notification_request import build_notification_request, notification_host
+from src.constants.circuit_state import CircuitState
+from src.core.ports.notification.i_circuit_breaker import ICircuitBreaker
+from src.core.ports.notification.i_notification_retry_scheduler import INotificationRetryScheduler
 from src.core.ports.notification.i_notification_service import INotificationService
-from tenacity import retry, stop_after_attempt, wait_fixed, before_sleep_log
 
 logger = logging.getLogger(__name__)
 
 class HttpNotificationService(INotificationService):
-    def __init__(self, timeout: int = 30):
-        self.timeout = timeout
-        self.max_retries = int(os.getenv('NOTIFICATION_MAX_RETRIES', 3))
-        self.retry_delay = int(os.getenv('NOTIFICATION_RETRY_DELAY_SECONDS', 5))
+    """
+    Envia a notificação diretamente, com uma única tentativa na requisição: a latência de quem chama
+    fica limitada a uma chamada. Falhas são entregues ao `INotificationRetryScheduler`, que reenvia
+    fora da requisição com backoff exponencial e jitter; sem agendador, a falha é propagada.
 
-        self._send_http_request_with_retry = retry(
-            stop=stop_after_attempt(self.max_retries),
-            wait=wait_fixed(self.retry_delay),
-            before_sleep=before_sleep_log(logger, logging.INFO),
-            reraise=True
-        )(self._execute_http_request)
+    Com um `ICircuitBreaker`, destinos com o circuito aberto não recebem a chamada na requisição
+    (a notificação vai direto para o agendador) e, no meio-aberto, a notificação é a chamada de teste.
+    """
+    def __init__(
+        self,
+        timeout: int = 30,
+        circuit_breaker: ICircuitBreaker = None,
+        retry_scheduler: INotificationRetryScheduler = None,
+    ):
+        self.timeout = timeout
+        self.circuit_breaker = circuit_breaker
+        self.retry_scheduler = retry_scheduler
 
     def _execute_http_request(self, notification_url: str, payment_data: Dict[str, Any]) -> bool:
-        headers = {
-            'Content-Type': 'application/json',
-            'User-Agent': 'Payment-Microservice/1.0'
-        }
-        
-        payload = {
-            'event': 'payment.completed',
-            'payment_id': payment_data.get('payment_id'),
-            'external_reference': payment_data.get('external_reference'),
-            'amount': payment_data.get('amount'),
-            'status': payment_data.get('status'),
-            'transaction_id': payment_data.get('transaction_id'),
-            'timestamp': payment_data.get('timestamp')
-        }
-        
+        payload, headers = build_notification_request(payment_data)
+
         logger.info(f"Enviando notificação para {notification_url}")
-        
+
         try:
             response = requests.post(
                 notification_url,
@@ -47,10 +42,29 @@ class HttpNotificationService(INotificationService):
             )
             response.raise_for_status()
             logger.info(f"Notificação enviada com sucesso para {notification_url}")
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_success(notification_host(notification_url))
             return True
         except requests.exceptions.RequestException as e:
-            logger.warning(f"Falha ao enviar notificação para {notification_url}. Erro: {e}. Tentando novamente...")
+            logger.warning(f"Falha ao enviar notificação para {notification_url}. Erro: {e}")
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_failure(notification_host(notification_url))
             raise
 
     def send_payment_notification(self, notification_url: str, payment_data: Dict[str, Any]) -> bool:
-        return self._send_http_request_with_retry(notification_url, payment_data)
+        if self.circuit_breaker is not None:
+            if self.circuit_breaker.acquire(notification_host(notification_url)) is CircuitState.OPEN:
+                logger.warning(f"Circuito aberto para {notification_url}: notificação não enviada na requisição")
+                return self._schedule_retry(notification_url, payment_data)
+
+        try:
+            return self._execute_http_request(notification_url, payment_data)
+        except requests.exceptions.RequestException:
+            if not self._schedule_retry(notification_url, payment_data):
+                raise
+            return True
+
+    def _schedule_retry(self, notification_url: str, payment_data: Dict[str, Any]) -> bool:
+        if self.retry_scheduler is None:
+            return False
+        return self.retry_scheduler.schedule_retry(notification_url, payment_data)
@@ -1,6 +1,12 @@
 import logging
-from typing import Dict, Any
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Tuple
+from config.settings import NOTIFICATION_STRATEGY, NOTIFICATION_STRATEGY_WEIGHTS
+from src.constants.notification_strategy import NotificationStrategy
 from src.core.ports.notification.i_notification_service import INotificationService
+from src.core.shared.latency_histogram import LatencyHistogram
 
 logger = logging.getLogger(__name__)
 
@@ -8,35 +14,101 @@ class HybridNotificationService(INotificationService):
     """
     Serviço híbrido que coordena notificações síncronas e assíncronas
     Respeitando os princípios da Clean Architecture
+
+    A ordem de uso dos serviços segue a estratégia configurada (`NotificationStrategy`); a latência
+    de cada envio é registrada no histograma da estratégia, para comparar as políticas de entrega.
+    Na estratégia `race` o mesmo envio pode chegar mais de uma vez ao destinatário, que deduplica
+    pelo `notification_id`.
     """
-    
-    def __init__(self, services: Dict[str, INotificationService] = None):
+
+    def __init__(
+        self,
+        services: Dict[str, INotificationService] = None,
+        strategy: str = NOTIFICATION_STRATEGY,
+        weights: Dict[str, float] = None,
+        enqueue_service: str = "celery",
+        latency_histogram: LatencyHistogram = None,
+        rng: random.Random = None,
+    ):
         self._services = services if services is not None else {}
-    
+        self._strategy = NotificationStrategy(strategy)
+        self._weights = weights if weights is not None else NOTIFICATION_STRATEGY_WEIGHTS
+        self._enqueue_service = enqueue_service
+        self._latency_histogram = latency_histogram if latency_histogram is not None else LatencyHistogram()
+        self._rng = rng or random.Random()
+
+    @property
+    def latency_histogram(self) -> LatencyHistogram:
+        return self._latency_histogram
+
     def send_payment_notification(self, notification_url: str, payment_data: Dict[str, Any]) -> bool:
         """
         Envia notificação usando estratégia para multiplos serviços de notificação.
-        
+
         :param notification_url: URL para enviar a notificação
         :param payment_data: Dados do pagamento
         :return: True se enviado com sucesso
         """
-        
-        for service_name, service in self._services.items():
-            try:
-                logger.info(f"Tentando enviar notificação via {service_name}...")
-                result = service.send_payment_notification(notification_url, payment_data)
-                
-                if result:
-                    logger.info(f"Notificação enviada com sucesso via {service_name}")
-                    return True
-                
-            except NotImplementedError as e:
-                logger.warning(f"Serviço {service_name} não implementado: {e}")
-                continue  # Pula para o próximo serviço
-            except Exception as e:
-                logger.warning(f"Falha ao enviar notificação via {service_name}: {e}")
-                continue  # Pula para o próximo serviço
-        
-        logger.error("Todos os serviços de notificação falharam")
-        return False
\ No newline at end of file
+        started_at = time.monotonic()
+        if self._strategy is NotificationStrategy.RACE:
+            result = self._race(notification_url, payment_data)
+        else:
+            result = self._sequential(self._ordered_services(), notification_url, payment_data)
+        self._latency_histogram.observe(self._strategy.value, time.monotonic() - started_at)
+
+        if not result:
+            logger.error("Todos os serviços de notificação falharam")
+        return result
+
+    def _ordered_services(self) -> List[Tuple[str, INotificationService]]:
+        services = list(self._services.items())
+        if self._strategy is NotificationStrategy.ENQUEUE_FIRST:
+            return sorted(services, key=lambda item: item[0] != self._enqueue_service)
+        if self._strategy is NotificationStrategy.WEIGHTED:
+            weighted = [(name, self._weights.get(name, 0)) for name, _ in services if self._weights.get(name, 0) > 0]
+            if weighted:
+                names, weights = zip(*weighted)
+                first = self._rng.choices(names, weights=weights)[0]
+                return sorted(services, key=lambda item: item[0] != first)
+        return services
+
+    def _sequential(
+        self, services: List[Tuple[str, INotificationService]], notification_url: str, payment_data: Dict[str, Any]
+    ) -> bool:
+        for service_name, service in services:
+            if self._try_service(service_name, service, notification_url, payment_data):
+                return True
+        return False
+
+    def _race(self, notification_url: str, payment_data: Dict[str, Any]) -> bool:
+        if not self._services:
+            return False
+
+        executor = ThreadPoolExecutor(max_workers=len(self._services), thread_name_prefix="notification-race")
+        try:
+            futures = [
+                executor.submit(self._try_service, service_name, service, notification_url, payment_data)
+                for service_name, service in self._services.items()
+            ]
+            # Retorna no primeiro sucesso; os envios restantes terminam em segundo plano
+            return any(future.result() for future in as_completed(futures))
+        finally:
+            executor.shutdown(wait=False)
+
+    @staticmethod
+    def _try_service(
+        service_name: str, service: INotificationService, notification_url: str, payment_data: Dict[str, Any]
+    ) -> bool:
+        try:
+            logger.info(f"Tentando enviar notificação via {service_name}...")
+            result = service.send_payment_notification(notification_url, payment_data)
+
+            if result:
+                logger.info(f"Notificação enviada com sucesso via {service_name}")
+                return True
+
+        except NotImplementedError as e:
+            logger.warning(f"Serviço {service_name} não implementado: {e}")
+        except Exception as e:
+            logger.warning(f"Falha ao enviar notificação via {service_name}: {e}")
+        return False
@@ -0,0 +1,45 @@
+from typing import Any, Dict, Tuple
+from urllib.parse import urlsplit
+
+
+def build_notification_request(payment_data: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """
+    Monta o corpo e os cabeçalhos da notificação de pagamento enviada ao cliente.
+    Reenvios repetem o `notification_id` (cabeçalho `Idempotency-Key`): o destinatário descarta duplicatas.
+
+    :param payment_data: Dados do pagamento
+    :return: Corpo JSON e cabeçalhos da requisição
+    """
+    headers = {
+        'Content-Type': 'application/json',
+        'User-Agent': 'Payment-Microservice/1.0'
+    }
+    if payment_data.get('notification_id'):
+        headers['Idempotency-Key'] = payment_data['notification_id']
+
+    payload = {
+        'event': 'payment.completed',
+        'notification_id': payment_data.get('notification_id'),
+        'payment_id': payment_data.get('payment_id'),
+        'external_reference': payment_data.get('external_reference'),
+        'amount': payment_data.get('amount'),
+        'status': payment_data.get('status'),
+        'transaction_id': payment_data.get('transaction_id'),
+        'timestamp': payment_data.get('timestamp')
+    }
+    return payload, headers
+
+
+def notification_host(notification_url: str) -> str:
+    """
+    Identifica o destino (esquema, host e porta) de uma URL de notificação; é a chave dos pools
+    de conexão e dos circuit breakers por destino.
+
+    :param notification_url: URL para enviar a notificação
+    :return: Destino no formato `esquema://host:porta`
+    :raises ValueError: Se a URL não for HTTP(S) ou não tiver host
+    """
+    parts = urlsplit(notification_url)
+    if parts.scheme not in ('http', 'https') or not parts.hostname:
+        raise ValueError(f"URL de notificação inválida: {notification_url}")
+    return f"{parts.scheme}://{parts.hostname}:{parts.port or (443 if parts.scheme == 'https' else 80)}"
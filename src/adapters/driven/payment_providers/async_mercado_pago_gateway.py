@@ -0,0 +1,93 @@
+import traceback
+import httpx
+from typing import Dict, Any
+from config.settings import (
+    MERCADO_PAGO_HTTP2_ENABLED,
+    MERCADO_PAGO_HTTP_MAX_CONNECTIONS,
+    MERCADO_PAGO_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    MERCADO_PAGO_HTTP_KEEPALIVE_EXPIRY,
+    MERCADO_PAGO_HTTP_CONNECT_TIMEOUT,
+    MERCADO_PAGO_HTTP_READ_TIMEOUT,
+    MERCADO_PAGO_HTTP_WRITE_TIMEOUT,
+    MERCADO_PAGO_HTTP_POOL_TIMEOUT,
+)
+from src.adapters.driven.payment_providers.mercado_pago_gateway import MercadoPagoGatewayBase
+from src.core.exceptions.bad_request_exception import BadRequestException
+from src.core.ports.payment.i_async_payment_provider_gateway import IAsyncPaymentProviderGateway
+from src.core.shared.single_flight import AsyncSingleFlight
+
+
+def build_mercado_pago_http_client() -> httpx.AsyncClient:
+    """
+    Cria o `httpx.AsyncClient` compartilhado pelo processo para chamadas ao Mercado Pago,
+    mantendo conexões keep-alive reutilizáveis entre requisições.
+    HTTP/2 exige o pacote `h2` (`httpx[http2]`) e é habilitado por `MERCADO_PAGO_HTTP2_ENABLED`.
+    """
+    return httpx.AsyncClient(
+        http2=MERCADO_PAGO_HTTP2_ENABLED,
+        limits=httpx.Limits(
+            max_connections=MERCADO_PAGO_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=MERCADO_PAGO_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=MERCADO_PAGO_HTTP_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(
+            connect=MERCADO_PAGO_HTTP_CONNECT_TIMEOUT,
+            read=MERCADO_PAGO_HTTP_READ_TIMEOUT,
+            write=MERCADO_PAGO_HTTP_WRITE_TIMEOUT,
+            pool=MERCADO_PAGO_HTTP_POOL_TIMEOUT,
+        ),
+    )
+
+
+class AsyncMercadoPagoGateway(MercadoPagoGatewayBase, IAsyncPaymentProviderGateway):
+    """
+    Implementação assíncrona do gateway do Mercado Pago sobre um `httpx.AsyncClient` compartilhado.
+    Com um `AsyncSingleFlight`, consultas simultâneas ao mesmo recurso compartilham uma única requisição.
+    """
+    def __init__(self, client: httpx.AsyncClient, single_flight: AsyncSingleFlight = None):
+        super().__init__()
+        self.client = client
+        self.single_flight = single_flight
+
+    async def initiate_payment(self, payment_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Cria uma preferência de pagamento no Mercado Pago.
+        :param payment_data: Dados para criar o pagamento.
+        :return: Detalhes do pagamento, como QR Code e ID da transação.
+        """
+        payload = self._build_order_payload(payment_data)
+        response = await self.client.post(self.qr_orders_url, json=payload, headers=self.headers)
+
+        if response.status_code != 201:
+            raise BadRequestException(f"Erro ao criar pagamento: {response.text}")
+
+        return response.json()
+
+    async def verify_payment(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Verifica o status de um pagamento.
+        :param payload: Dados do payload para verificar o pagamento.
+        :return: Detalhes do status do pagamento.
+        """
+        try:
+            if self._is_ignored_event(payload):
+                return {"message": payload.get("action"), "action": 'return'}
+
+            resource = self._resolve_resource_url(payload)
+            if self.single_flight is None:
+                payment_data = await self._fetch_resource(resource)
+            else:
+                payment_data = await self.single_flight.do(resource, lambda: self._fetch_resource(resource))
+
+            return self._parse_payment_data(payment_data)
+        except Exception as e:
+            traceback.print_exc()
+            raise BadRequestException(f"Erro ao verificar pagamento: {str(e)}")
+
+    async def _fetch_resource(self, resource: str) -> Dict[str, Any]:
+        response = await self.client.get(resource, headers=self.headers)
+
+        if response.status_code != 200:
+            raise BadRequestException(f"Erro ao buscar pagamento: {response.text}")
+
+        return response.json()
@@ -1,15 +1,17 @@
 import traceback
 import requests
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from config.settings import MERCADO_PAGO_ACCESS_TOKEN, MERCADO_PAGO_USER_ID, MERCADO_PAGO_POS_ID
 from src.constants.payment_status import PaymentStatusEnum
 from src.core.exceptions.bad_request_exception import BadRequestException
 from src.core.ports.payment.i_payment_provider_gateway import IPaymentProviderGateway
+from src.core.shared.single_flight import SingleFlight
 
 
-class MercadoPagoGateway(IPaymentProviderGateway):
+class MercadoPagoGatewayBase:
     """
-    Implementação do gateway de pagamento usando a API oficial do Mercado Pago.
+    Regras comuns às implementações síncrona e assíncrona do gateway do Mercado Pago:
+    montagem das requisições, interpretação das respostas e mapeamento de status.
     """
     def __init__(self):
         self.base_url = 'https://api.mercadopago.com'
@@ -18,13 +20,12 @@ class MercadoPagoGateway(IPaymentProviderGateway):
             "Content-Type": "application/json"
         }
 
-    def initiate_payment(self, payment_data: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Cria uma preferência de pagamento no Mercado Pago.
-        :param payment_data: Dados para criar o pagamento.
-        :return: Detalhes do pagamento, como QR Code e ID da transação.
-        """
-        payload = {
+    @property
+    def qr_orders_url(self) -> str:
+        return f"{self.base_url}/instore/orders/qr/seller/collectors/{MERCADO_PAGO_USER_ID}/pos/{MERCADO_PAGO_POS_ID}/qrs"
+
+    def _build_order_payload(self, payment_data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
             "external_reference": payment_data.get("external_reference", ""),
             "notification_url": payment_data.get("payment_notification_url", ""),
             "total_amount": payment_data.get("total_amount", 0.0),
@@ -33,60 +34,82 @@ class MercadoPagoGateway(IPaymentProviderGateway):
             "description": payment_data.get("description", "")
         }
 
-        url = f"{self.base_url}/instore/orders/qr/seller/collectors/{MERCADO_PAGO_USER_ID}/pos/{MERCADO_PAGO_POS_ID}/qrs"
-        response = requests.post(url, json=payload, headers=self.headers)
+    def _resolve_resource_url(self, payload: Dict[str, Any]) -> str:
+        resource = payload.get("resource")
+        if not resource:
+            raise BadRequestException("Payload inválido: recurso ausente.")
 
-        if response.status_code != 201:
-            raise BadRequestException(f"Erro ao criar pagamento: {response.text}")
+        if not resource.startswith('https://api.mercadolibre.com'):
+            parts = resource.split('/')
+            merchant_order_id = parts[-1]
+            if 'merchant_order' in payload.get('topic', ''):
+                resource = f"{self.base_url}/merchant_orders/{merchant_order_id}"
+            else:
+                resource = f"{self.base_url}/v1/payments/{merchant_order_id}"
 
-        return response.json()
+        return resource
 
-    def verify_payment(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    def _parse_payment_data(self, payment_data: Dict[str, Any]) -> Dict[str, Any]:
+        if not payment_data:
+            raise BadRequestException("Dados de pagamento não encontrados.")
+
+        return {
+            "external_reference": payment_data.get("external_reference"),
+            "payment_status": payment_data.get("status"),
+            "payment_method": payment_data.get("payment_method_id"),
+            "transaction_amount": payment_data.get("transaction_amount"),
+            "payment_date": payment_data.get("date_created"),
+            "merchant_order_id": payment_data.get("merchant_order_id"),
+            "payer": payment_data.get("payer"),
+            "payment_type": payment_data.get("payment_type_id"),
+            "last_modified": payment_data.get("date_last_updated"),
+            "action": 'process'
+        }
+
+    @property
+    def payments_search_url(self) -> str:
+        return f"{self.base_url}/v1/payments/search"
+
+    @staticmethod
+    def _payments_search_params(external_reference: str) -> Dict[str, Any]:
+        # Pagamento mais recente primeiro: tentativas recusadas podem preceder a aprovada
+        return {"external_reference": external_reference, "sort": "date_last_updated", "criteria": "desc", "limit": 1}
+
+    def _parse_search_results(self, search_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        results = (search_data or {}).get("results") or []
+        if not results:
+            return None
+        return self._parse_payment_data(results[0])
+
+    def webhook_resource_key(self, payload: Dict[str, Any]) -> Optional[str]:
         """
-        Verifica o status de um pagamento.
-        :param payload: Dados do payload para verificar o pagamento.
-        :return: Detalhes do status do pagamento.
+        Identifica o recurso (tópico e id) ao qual um webhook do Mercado Pago se refere.
         """
-        try:
-            if "action" in payload and payload["action"] == "payment.created":
-                return {"message": payload.get("action"), "action": 'return'}
+        topic = payload.get("topic") or payload.get("type")
+        resource = payload.get("resource") or (payload.get("data") or {}).get("id")
+        if not topic or not resource:
+            return None
 
-            resource = payload.get("resource")
-            if not resource:
-                raise BadRequestException("Payload inválido: recurso ausente.")
-
-            if not resource.startswith('https://api.mercadolibre.com'):
-                parts = resource.split('/')
-                merchant_order_id = parts[-1]
-                if 'merchant_order' in payload.get('topic', ''):
-                    resource = f"{self.base_url}/merchant_orders/{merchant_order_id}"
-                else:
-                    resource = f"{self.base_url}/v1/payments/{merchant_order_id}"
-
-            response = requests.get(resource, headers=self.headers)
-            
-            if response.status_code != 200:
-                raise BadRequestException(f"Erro ao buscar pagamento: {response.text}")
-
-            payment_data = response.json()
-            if not payment_data:
-                raise BadRequestException("Dados de pagamento não encontrados.")
-
-            return {
-                "external_reference": payment_data.get("external_reference"),
-                "payment_status": payment_data.get("status"),
-                "payment_method": payment_data.get("payment_method_id"),
-                "transaction_amount": payment_data.get("transaction_amount"),
-                "payment_date": payment_data.get("date_created"),
-                "merchant_order_id": payment_data.get("merchant_order_id"),
-                "payer": payment_data.get("payer"),
-                "payment_type": payment_data.get("payment_type_id"),
-                "last_modified": payment_data.get("date_last_updated"),
-                "action": 'process'
-            }
-        except Exception as e:
-            traceback.print_exc()
-            raise BadRequestException(f"Erro ao verificar pagamento: {str(e)}")
+        resource_id = str(resource).rstrip('/').split('/')[-1]
+        return f"mercado_pago:{topic}:{resource_id}"
+
+    def webhook_idempotency_key(self, payload: Dict[str, Any], last_modified: Optional[str] = None) -> Optional[str]:
+        """
+        Chave (tópico, id do recurso, versão) de um webhook do Mercado Pago. A versão é a data de
+        atualização do recurso ou, nas notificações que não a trazem, o id da própria notificação,
+        que se repete nas reentregas. Sem versão conhecida não há como deduplicar com segurança.
+        """
+        resource_key = self.webhook_resource_key(payload)
+        version = last_modified or payload.get("last_modified") or (payload.get("id") if "data" in payload else None)
+
+        if not resource_key or not version:
+            return None
+
+        return f"{resource_key}:{version}"
+
+    @staticmethod
+    def _is_ignored_event(payload: Dict[str, Any]) -> bool:
+        return "action" in payload and payload["action"] == "payment.created"
 
     def status_map(self, status_name: str) -> str:
         """
@@ -110,4 +133,74 @@ class MercadoPagoGateway(IPaymentProviderGateway):
             print(f"Status desconhecido recebido: {status_name}")
             raise BadRequestException(f"Status de pagamento não mapeado: {status_name}")
 
-        return STATUS_MAP[status_name]
\ No newline at end of file
+        return STATUS_MAP[status_name]
+
+
+class MercadoPagoGateway(MercadoPagoGatewayBase, IPaymentProviderGateway):
+    """
+    Implementação do gateway de pagamento usando a API oficial do Mercado Pago.
+
+    Quando um `SingleFlight` é informado, consultas simultâneas ao mesmo recurso
+    compartilham uma única requisição HTTP e um cache de curta duração.
+    """
+    def __init__(self, single_flight: SingleFlight = None):
+        super().__init__()
+        self.single_flight = single_flight
+
+    def initiate_payment(self, payment_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Cria uma preferência de pagamento no Mercado Pago.
+        :param payment_data: Dados para criar o pagamento.
+        :return: Detalhes do pagamento, como QR Code e ID da transação.
+        """
+        payload = self._build_order_payload(payment_data)
+        response = requests.post(self.qr_orders_url, json=payload, headers=self.headers)
+
+        if response.status_code != 201:
+            raise BadRequestException(f"Erro ao criar pagamento: {response.text}")
+
+        return response.json()
+
+    def verify_payment(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Verifica o status de um pagamento.
+        :param payload: Dados do payload para verificar o pagamento.
+        :return: Detalhes do status do pagamento.
+        """
+        try:
+            if self._is_ignored_event(payload):
+                return {"message": payload.get("action"), "action": 'return'}
+
+            resource = self._resolve_resource_url(payload)
+            if self.single_flight is None:
+                payment_data = self._fetch_resource(resource)
+            else:
+                payment_data = self.single_flight.do(resource, lambda: self._fetch_resource(resource))
+
+            return self._parse_payment_data(payment_data)
+        except Exception as e:
+            traceback.print_exc()
+            raise BadRequestException(f"Erro ao verificar pagamento: {str(e)}")
+
+    def find_payment_by_reference(self, external_reference: str) -> Optional[Dict[str, Any]]:
+        """
+        Busca o pagamento mais recente do Mercado Pago com a referência externa informada.
+        :param external_reference: Referência externa do pagamento.
+        :return: Detalhes do pagamento, ou None se ainda não houver pagamento no provedor.
+        """
+        response = requests.get(
+            self.payments_search_url, params=self._payments_search_params(external_reference), headers=self.headers
+        )
+
+        if response.status_code != 200:
+            raise BadRequestException(f"Erro ao buscar pagamento: {response.text}")
+
+        return self._parse_search_results(response.json())
+
+    def _fetch_resource(self, resource: str) -> Dict[str, Any]:
+        response = requests.get(resource, headers=self.headers)
+
+        if response.status_code != 200:
+            raise BadRequestException(f"Erro ao buscar pagamento: {response.text}")
+
+        return response.json()
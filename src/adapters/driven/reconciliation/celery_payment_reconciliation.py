@@ -0,0 +1,29 @@
+import logging
+from typing import Any, Dict
+from config.celery_config import celery_app
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(bind=True, name='reconcile_pending_payments_task')
+def reconcile_pending_payments_task(self) -> Dict[str, Any]:
+    """
+    Task Celery, agendada pelo `celery-beat`, que concilia os pagamentos pendentes com o provedor.
+    O resultado (métricas da rodada) fica disponível no backend de resultados e no Flower.
+    """
+    from src.core.containers import Container
+    from src.core.shared.identity_map import IdentityMap
+    from src.application.usecases.payment_usecase.reconcile_pending_payments_usecase import (
+        ReconcilePendingPaymentsUseCase
+    )
+
+    logger.info(f"Iniciando conciliação de pagamentos pendentes. Task ID: {self.request.id}")
+
+    # Cada task tem seu próprio identity map, como cada requisição HTTP
+    with IdentityMap.scope():
+        use_case = ReconcilePendingPaymentsUseCase.build(
+            payment_provider_gateway=Container.payment_provider_gateway(),
+            payment_gateway=Container.payment_gateway(),
+            payment_status_gateway=Container.payment_status_gateway(),
+        )
+        return use_case.execute()
@@ -0,0 +1,12 @@
+from src.adapters.driven.repositories.async_reference_data_repository import AsyncReferenceDataRepository
+from src.adapters.driven.repositories.models.payment_method_model import PaymentMethodModel
+from src.core.domain.entities.payment_method import PaymentMethod
+from src.core.ports.payment_method.i_async_payment_method_repository import IAsyncPaymentMethodRepository
+
+
+class AsyncPaymentMethodRepository(AsyncReferenceDataRepository[PaymentMethod], IAsyncPaymentMethodRepository):
+    model_class = PaymentMethodModel
+    entity_class = PaymentMethod
+
+
+__all__ = ["AsyncPaymentMethodRepository"]
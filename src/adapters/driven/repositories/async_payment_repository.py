@@ -0,0 +1,258 @@
+import datetime
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from bson import ObjectId
+from mongoengine.errors import ValidationError
+from pymongo import DESCENDING, ReturnDocument
+from pymongo.errors import BulkWriteError
+
+from config.settings import PAYMENT_EXPORT_BATCH_SIZE
+from src.adapters.driven.repositories.async_payment_method_repository import AsyncPaymentMethodRepository
+from src.adapters.driven.repositories.async_payment_status_repository import AsyncPaymentStatusRepository
+from src.adapters.driven.repositories.models.payment_model import PaymentModel
+from src.core.domain.entities.payment import Payment
+from src.core.exceptions.bad_request_exception import BadRequestException
+from src.core.ports.payment.i_async_payment_repository import IAsyncPaymentRepository
+from src.core.shared.identity_map import IdentityMap
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncPaymentRepository(IAsyncPaymentRepository):
+    """
+    Implementação assíncrona do repositório de pagamentos sobre o `AsyncMongoClient` do PyMongo.
+    Usa a mesma coleção e o mesmo formato de documento do `PaymentModel`.
+    """
+
+    def __init__(self, db):
+        self.collection = db[PaymentModel._get_collection_name()]
+        self.payment_status_gateway = AsyncPaymentStatusRepository(db)
+        self.payment_method_gateway = AsyncPaymentMethodRepository(db)
+        self.identity_map: IdentityMap = IdentityMap.get_instance()
+
+    async def create_payment(self, payment: Payment) -> Payment:
+        """
+        Insere um novo pagamento na coleção `payments` e retorna o pagamento criado.
+        :param payment: Instância do pagamento a ser criado.
+        :return: Instância do pagamento criado.
+        """
+        if payment.id is not None:
+            self.identity_map.remove(payment)
+
+        document = self._to_document(payment)
+        await self.collection.insert_one(document)
+        return await self._to_entity(document)
+
+    async def create_payments(self, payments: List[Payment]) -> List[Optional[Payment]]:
+        """
+        Insere vários pagamentos na coleção `payments` com um único `insert_many` não ordenado.
+        :param payments: Instâncias dos pagamentos a serem criados.
+        :return: Lista alinhada à entrada com o pagamento criado, ou None para os que não puderam ser gravados.
+        """
+        documents = {}
+        for index, payment in enumerate(payments):
+            try:
+                documents[index] = self._to_document(payment)
+            except (ValidationError, ValueError) as e:
+                logger.error(f"Pagamento {payment.external_reference} inválido para inserção em lote: {e}")
+
+        failed = set()
+        if documents:
+            positions = list(documents)
+            try:
+                await self.collection.insert_many(list(documents.values()), ordered=False)
+            except BulkWriteError as e:
+                for error in e.details.get('writeErrors', []):
+                    failed.add(positions[error['index']])
+                    logger.error(f"Falha ao inserir pagamento em lote: {error.get('errmsg')}")
+
+        return [
+            await self._to_entity(documents[index]) if index in documents and index not in failed else None
+            for index in range(len(payments))
+        ]
+
+    async def update_payment_status(
+        self, payment: Payment, status_id, expected_status_id=None, enqueue_notification: bool = False
+    ) -> Optional[Payment]:
+        """
+        Atualiza o status de um pagamento na coleção `payments`.
+        :param payment: Instância do pagamento a ser atualizado.
+        :param status_id: Novo ID do status do pagamento.
+        :param expected_status_id: Se informado, só atualiza se o status atual for este.
+        :param enqueue_notification: Registra no outbox, na mesma escrita, a notificação ao cliente.
+        :return: Instância do pagamento atualizado, ou None se o status atual não for o esperado.
+        """
+        if payment.id is not None:
+            self.identity_map.remove(payment)
+
+        payment_status = await self.payment_status_gateway.get_by_id(status_id)
+        if payment_status is None:
+            raise ValueError(f"Payment status with ID {status_id} does not exist.")
+
+        query = {"_id": payment.id}
+        if expected_status_id is not None:
+            query["payment_status"] = ObjectId(expected_status_id)
+
+        to_set = {
+            "payment_status": payment_status.id,
+            "updated_at": datetime.datetime.now(datetime.UTC),
+        }
+        if enqueue_notification:
+            to_set["notification_pending"] = True
+
+        document = await self.collection.find_one_and_update(
+            query, {"$set": to_set}, return_document=ReturnDocument.AFTER
+        )
+        if document is None:
+            if expected_status_id is not None:
+                return None
+
+            payment.payment_status = payment_status
+            document = self._to_document(payment)
+            document["notification_pending"] = document.get("notification_pending", False) or enqueue_notification
+            await self.collection.insert_one(document)
+
+        return await self._to_entity(document)
+
+    async def get_payment_by_id(self, payment_id) -> Optional[Payment]:
+        """
+        Recupera os detalhes de um pagamento pelo ID.
+        :param payment_id: ID do pagamento.
+        :return: Instância do pagamento.
+        """
+        if ObjectId.is_valid(payment_id) is False:
+            raise BadRequestException(f"ID de pagamento inválido: {payment_id}")
+
+        return await self._find_one({"_id": ObjectId(payment_id)})
+
+    async def get_payment_by_transaction_id(self, transaction_id: str) -> Optional[Payment]:
+        """
+        Recupera os detalhes de um pagamento pelo ID da transação.
+        :param transaction_id: ID da transação do pagamento.
+        :return: Instância do pagamento.
+        """
+        return await self._find_one({"transaction_id": transaction_id})
+
+    async def get_payment_by_reference(self, external_reference: str) -> Optional[Payment]:
+        """
+        Recupera os detalhes de um pagamento pela referência externa.
+        :param external_reference: Referência externa do pagamento.
+        :return: Instância do pagamento.
+        """
+        return await self._find_one({"external_reference": external_reference})
+
+    async def update_payment(self, payment: Payment) -> Payment:
+        """
+        Atualiza um pagamento existente na coleção `payments`, gravando apenas os atributos alterados.
+        :param payment: Instância do pagamento a ser atualizado.
+        :return: Instância do pagamento atualizado.
+        """
+        if payment.id is None:
+            raise ValueError("Payment ID is required for update.")
+
+        self.identity_map.remove(payment)
+
+        if payment.dirty_fields:
+            document = await self.collection.find_one_and_update(
+                {"_id": ObjectId(payment.id)},
+                PaymentModel.dirty_update(payment),
+                return_document=ReturnDocument.AFTER,
+            )
+            if document is not None:
+                payment.clear_dirty()
+                return await self._to_entity(document)
+
+        # Pagamento ainda não persistido ou sem alterações rastreadas: grava o documento completo
+        document = self._to_document(payment)
+        await self.collection.replace_one({"_id": document["_id"]}, document, upsert=True)
+        return await self._to_entity(document)
+
+    async def list_payments(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime.datetime, Any]] = None,
+        payment_status_id=None,
+        payment_method_id=None,
+        amount_min: Optional[float] = None,
+        amount_max: Optional[float] = None,
+        client_notified: Optional[bool] = None,
+    ) -> List[Payment]:
+        """
+        Lista uma página de pagamentos ordenada por (created_at, _id) decrescente. A página seguinte
+        parte da chave do último item (`after`), sem `skip`, usando os índices `*_created_at_id`.
+        Apenas `PaymentModel.LIST_FIELDS` são lidos do banco.
+        """
+        query = PaymentModel.keyset_filter(
+            PaymentModel.raw_filter(
+                payment_status_id=payment_status_id,
+                payment_method_id=payment_method_id,
+                amount_min=amount_min,
+                amount_max=amount_max,
+                client_notified=client_notified,
+            ),
+            after,
+        )
+        cursor = (
+            self.collection.find(query, list(PaymentModel.LIST_FIELDS))
+            .sort([('created_at', DESCENDING), ('_id', DESCENDING)])
+            .limit(limit)
+        )
+        return [PaymentModel.list_entity(document) for document in await cursor.to_list()]
+
+    async def iter_payments(
+        self,
+        payment_status_id=None,
+        payment_method_id=None,
+        created_from: Optional[datetime.datetime] = None,
+        created_to: Optional[datetime.datetime] = None,
+    ) -> AsyncIterator[Payment]:
+        """
+        Percorre os pagamentos com um cursor do servidor lido em lotes de `PAYMENT_EXPORT_BATCH_SIZE`.
+        As entidades não são registradas no identity map, mantendo a memória constante.
+        """
+        query = PaymentModel.raw_filter(payment_status_id, payment_method_id, created_from, created_to)
+        async for document in self.collection.find(query, batch_size=PAYMENT_EXPORT_BATCH_SIZE):
+            yield await self._to_entity(document, track=False)
+
+    async def _find_one(self, query: Dict[str, Any]) -> Optional[Payment]:
+        document = await self.collection.find_one(query)
+        if document is None:
+            return None
+        return await self._to_entity(document)
+
+    def _to_document(self, payment: Payment) -> Dict[str, Any]:
+        payment_model = PaymentModel.from_entity(payment)
+        payment_model.updated_at = datetime.datetime.now(datetime.UTC)
+        payment_model.validate()
+        return payment_model.to_mongo().to_dict()
+
+    async def _to_entity(self, document: Dict[str, Any], track: bool = True) -> Payment:
+        existing_payment = self.identity_map.get(Payment, document["_id"])
+        if existing_payment:
+            return existing_payment
+
+        payment = Payment(
+            id=document["_id"],
+            amount=document.get("amount"),
+            external_reference=document.get("external_reference"),
+            qr_code=document.get("qr_code"),
+            transaction_id=document.get("transaction_id"),
+            notification_url=document.get("notification_url"),
+            client_notified=document.get("client_notified", False),
+            notification_pending=document.get("notification_pending", False),
+            created_at=document.get("created_at"),
+            updated_at=document.get("updated_at"),
+            inactivated_at=document.get("inactivated_at"),
+        )
+        if track:
+            self.identity_map.add(payment)
+
+        payment.payment_method = await self.payment_method_gateway.get_by_id(document.get("payment_method"))
+        payment.payment_status = await self.payment_status_gateway.get_by_id(document.get("payment_status"))
+        payment.clear_dirty()
+
+        return payment
+
+
+__all__ = ['AsyncPaymentRepository']
@@ -0,0 +1,12 @@
+from src.adapters.driven.repositories.async_reference_data_repository import AsyncReferenceDataRepository
+from src.adapters.driven.repositories.models.payment_status_model import PaymentStatusModel
+from src.core.domain.entities.payment_status import PaymentStatus
+from src.core.ports.payment_status.i_async_payment_status_repository import IAsyncPaymentStatusRepository
+
+
+class AsyncPaymentStatusRepository(AsyncReferenceDataRepository[PaymentStatus], IAsyncPaymentStatusRepository):
+    model_class = PaymentStatusModel
+    entity_class = PaymentStatus
+
+
+__all__ = ["AsyncPaymentStatusRepository"]
@@ -0,0 +1,114 @@
+import datetime
+from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
+
+from bson import ObjectId
+
+from src.adapters.driven.repositories.models.reference_data_model import ReferenceDataModel
+from src.core.domain.entities.base_entity import BaseEntity
+from src.core.shared.identity_map import IdentityMap
+
+E = TypeVar("E", bound=BaseEntity)
+
+
+class AsyncReferenceDataRepository(Generic[E]):
+    """
+    Base assíncrona para os repositórios de dados de referência (status e métodos de pagamento).
+    Lê e escreve a mesma coleção e o mesmo `ReferenceDataCache` dos repositórios síncronos.
+    """
+
+    model_class: Type[ReferenceDataModel] = None
+    entity_class: Type[E] = None
+
+    def __init__(self, db):
+        self.collection = db[self.model_class._get_collection_name()]
+        self.identity_map: IdentityMap = IdentityMap.get_instance()
+        self.cache = self.model_class.get_cache()
+
+    async def create(self, entity: E) -> E:
+        if entity.id is not None:
+            self.identity_map.remove(entity)
+
+        document = self._to_document(entity)
+        await self.collection.insert_one(document)
+        self.cache.invalidate()
+        return self._to_entity(document)
+
+    async def exists_by_name(self, name: str) -> bool:
+        return await self.collection.count_documents({"name": name}, limit=1) > 0
+
+    async def get_by_name(self, name: str) -> Optional[E]:
+        return await self._get_cached("name", name)
+
+    async def get_by_id(self, entity_id) -> Optional[E]:
+        if entity_id is None:
+            return None
+        return await self._get_cached("id", entity_id)
+
+    async def get_all(self, include_deleted: Optional[bool] = False) -> List[E]:
+        query = {} if include_deleted else {"inactivated_at": None}
+        return [self._to_entity(document) async for document in self.collection.find(query)]
+
+    async def update(self, entity: E) -> E:
+        if entity.id is not None:
+            self.identity_map.remove(entity)
+
+        document = self._to_document(entity)
+        await self.collection.replace_one({"_id": document["_id"]}, document, upsert=True)
+        self.cache.invalidate()
+        return self._to_entity(document)
+
+    async def delete(self, entity: E) -> None:
+        result = await self.collection.delete_one({"_id": self._object_id(entity.id)})
+        if result.deleted_count:
+            self.cache.invalidate()
+            self.identity_map.remove(entity)
+
+    async def _get_cached(self, field: str, value: Any) -> Optional[E]:
+        snapshot = self.cache.get_snapshot(field, value)
+        if snapshot is None:
+            query = {"_id": self._object_id(value)} if field == "id" else {field: value}
+            document = await self.collection.find_one(query)
+            if document is None:
+                return None
+            snapshot = self._to_snapshot(document)
+            self.cache.set_snapshot(snapshot)
+        return self._from_snapshot(snapshot)
+
+    def _to_document(self, entity: E) -> Dict[str, Any]:
+        model = self.model_class.from_entity(entity)
+        model.updated_at = datetime.datetime.now(datetime.UTC)
+        model.validate()
+        return model.to_mongo().to_dict()
+
+    def _to_snapshot(self, document: Dict[str, Any]) -> Dict[str, Any]:
+        snapshot = {field: document.get(field) for field in self.model_class.cached_fields}
+        snapshot["id"] = document["_id"]
+        return snapshot
+
+    def _to_entity(self, document: Dict[str, Any]) -> E:
+        return self._from_snapshot(self._to_snapshot(document))
+
+    def _from_snapshot(self, snapshot: Dict[str, Any]) -> E:
+        existing_entity = self.identity_map.get(self.entity_class, snapshot["id"])
+        if existing_entity:
+            return existing_entity
+
+        entity = self.entity_class(
+            id=snapshot["id"],
+            name=snapshot["name"],
+            description=snapshot["description"],
+            created_at=snapshot["created_at"],
+            updated_at=snapshot["updated_at"],
+            inactivated_at=snapshot["inactivated_at"],
+        )
+        self.identity_map.add(entity)
+        return entity
+
+    @staticmethod
+    def _object_id(value):
+        if isinstance(value, str) and ObjectId.is_valid(value):
+            return ObjectId(value)
+        return value
+
+
+__all__ = ["AsyncReferenceDataRepository"]
@@ -1,5 +1,5 @@
 import datetime
-from typing import TypeVar, Generic
+from typing import TypeVar, Generic, List
 from mongoengine import Document, DateTimeField, ObjectIdField
 from bson import ObjectId
 
@@ -21,4 +21,11 @@ class BaseModel(Document, Generic[M]):
         self.updated_at = datetime.datetime.now(datetime.UTC)
         return super().save(*args, **kwargs)
 
+    @classmethod
+    def missing_indexes(cls) -> List[list]:
+        """
+        Retorna os índices declarados em `meta` que ainda não existem na coleção.
+        """
+        return [index for index in cls.compare_indexes()['missing'] if index != [('_id', 1)]]
+
 __all__ = ["BaseModel"]
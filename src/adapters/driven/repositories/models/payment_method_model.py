@@ -1,11 +1,12 @@
 from mongoengine import StringField
-from src.adapters.driven.repositories.models.base_model import BaseModel
+from src.adapters.driven.repositories.models.reference_data_model import ReferenceDataModel
 from src.core.domain.entities.payment_method import PaymentMethod
 from src.core.shared.identity_map import IdentityMap
 
 
-class PaymentMethodModel(BaseModel):
+class PaymentMethodModel(ReferenceDataModel):
     meta = {'collection': 'payment_methods'}
+    cache_namespace = 'payment_method'
 
     name = StringField(max_length=300, required=True, unique=True)
     description = StringField(max_length=300, required=True)
@@ -34,10 +35,9 @@ class PaymentMethodModel(BaseModel):
         )
         identity_map.add(payment_method)
 
-        # Load related payments if needed
+        # Related payments are only loaded when iterated
         from src.adapters.driven.repositories.models.payment_model import PaymentModel
-        payments = PaymentModel.objects(payment_method=self.id)
-        payment_method.payments = [payment.to_entity() for payment in payments]
+        payment_method.payments = PaymentModel.lazy_related(payment_method=self.id)
         
         payment_method.created_at = self.created_at
         payment_method.updated_at = self.updated_at
@@ -1,14 +1,39 @@
-from mongoengine import StringField, FloatField, ReferenceField, BooleanField
+import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from mongoengine import Document, StringField, FloatField, ReferenceField, BooleanField, ObjectIdField
 from src.adapters.driven.repositories.models.base_model import BaseModel
 from src.core.domain.entities.payment import Payment
 from src.core.shared.identity_map import IdentityMap
+from src.core.shared.lazy_relation import LazyRelation
 from src.core.domain.entities.base_entity import BaseEntity
 
-from bson import ObjectId
+from bson import DBRef, ObjectId
 
 
 class PaymentModel(BaseModel):
-    meta = {'collection': 'payments'}
+    # Índices criados pela migração 003 (em background), não na primeira consulta do processo
+    meta = {
+        'collection': 'payments',
+        'auto_create_index': False,
+        'index_background': True,
+        'indexes': [
+            {'fields': ['external_reference'], 'unique': True, 'name': 'external_reference_unique'},
+            {'fields': ['transaction_id'], 'unique': True, 'sparse': True, 'name': 'transaction_id_unique_sparse'},
+            # Listagem paginada por (created_at, _id), do mais recente para o mais antigo (migração 004)
+            {'fields': ['-created_at', '-id'], 'name': 'created_at_id'},
+            {'fields': ['payment_status', '-created_at', '-id'], 'name': 'payment_status_created_at_id'},
+            {'fields': ['payment_method', '-created_at', '-id'], 'name': 'payment_method_created_at_id'},
+            # Outbox de notificações: apenas os pagamentos com notificação pendente (migração 005)
+            {
+                'fields': ['notification_pending'],
+                'partialFilterExpression': {'notification_pending': True},
+                'name': 'notification_pending_partial',
+            },
+            # Paginação por cursor das relações reversas (LazyRelation ordena por _id)
+            {'fields': ['payment_status', 'id'], 'name': 'payment_status_id'},
+            {'fields': ['payment_method', 'id'], 'name': 'payment_method_id'},
+        ],
+    }
 
     payment_method = ReferenceField('PaymentMethodModel', required=False)
     payment_status = ReferenceField('PaymentStatusModel', required=True)
@@ -22,6 +47,11 @@ class PaymentModel(BaseModel):
     notification_url = StringField(required=False)
     client_notified = BooleanField(default=False)
 
+    # Outbox de notificações: gravado na mesma operação que a mudança de status
+    notification_pending = BooleanField(default=False)
+    # Reserva do despachante (o timestamp do ObjectId marca o início da reserva)
+    notification_claim = ObjectIdField(required=False)
+
     @classmethod
     def from_entity(cls, payment: BaseEntity):
         payment_method_id = payment.payment_method.id if payment.payment_method else None
@@ -42,13 +72,168 @@ class PaymentModel(BaseModel):
             transaction_id=payment.transaction_id,
             notification_url=payment.notification_url,
             client_notified=payment.client_notified,
+            notification_pending=payment.notification_pending,
             id=payment.id,
             created_at=payment.created_at,
             updated_at=payment.updated_at,
             inactivated_at=payment.inactivated_at
         )
     
-    def to_entity(self) -> Payment:
+    @classmethod
+    def dirty_update(cls, payment: Payment) -> Dict[str, Dict[str, Any]]:
+        """
+        Monta o update (`$set`/`$unset`) apenas com os atributos alterados da entidade.
+        O documento completo é validado antes, como em `save()`.
+        """
+        payment_model = cls.from_entity(payment)
+        payment_model.updated_at = datetime.datetime.now(datetime.UTC)
+        payment_model.validate()
+        document = payment_model.to_mongo()
+
+        to_set, to_unset = {}, {}
+        for field_name in payment.dirty_fields | {'updated_at'}:
+            if field_name not in cls._fields:
+                continue
+            db_field = cls._fields[field_name].db_field
+            if db_field in document:
+                to_set[db_field] = document[db_field]
+            else:
+                to_unset[db_field] = ""
+
+        update = {'$set': to_set}
+        if to_unset:
+            update['$unset'] = to_unset
+        return update
+
+    # Campos lidos pela listagem paginada (QrCodePaymentDTO e o cursor)
+    LIST_FIELDS = ('external_reference', 'transaction_id', 'qr_code', 'created_at')
+
+    @staticmethod
+    def raw_filter(
+        payment_status_id=None,
+        payment_method_id=None,
+        created_from: Optional[datetime.datetime] = None,
+        created_to: Optional[datetime.datetime] = None,
+        amount_min: Optional[float] = None,
+        amount_max: Optional[float] = None,
+        client_notified: Optional[bool] = None,
+    ) -> Dict[str, Any]:
+        """
+        Monta o filtro (documento do MongoDB) por status, método, intervalo de criação, faixa de valor
+        e notificação do cliente, compartilhado pelos repositórios síncrono e assíncrono.
+        """
+        query: Dict[str, Any] = {}
+        if payment_status_id is not None:
+            query['payment_status'] = ObjectId(payment_status_id)
+        if payment_method_id is not None:
+            query['payment_method'] = ObjectId(payment_method_id)
+        if created_from is not None or created_to is not None:
+            query['created_at'] = {}
+            if created_from is not None:
+                query['created_at']['$gte'] = created_from
+            if created_to is not None:
+                query['created_at']['$lt'] = created_to
+        if amount_min is not None or amount_max is not None:
+            query['amount'] = {}
+            if amount_min is not None:
+                query['amount']['$gte'] = amount_min
+            if amount_max is not None:
+                query['amount']['$lte'] = amount_max
+        if client_notified is not None:
+            query['client_notified'] = True if client_notified else {'$ne': True}
+        return query
+
+    @staticmethod
+    def keyset_filter(query: Dict[str, Any], after: Optional[Tuple[datetime.datetime, Any]]) -> Dict[str, Any]:
+        """
+        Restringe o filtro aos documentos posteriores a `after` = (created_at, _id) na ordem
+        decrescente da listagem, para que cada página seja lida direto do índice.
+        """
+        if after is None:
+            return query
+
+        created_at, last_id = after
+        last_id = ObjectId(last_id)
+        keyset = {'$or': [
+            {'created_at': {'$lt': created_at}},
+            {'created_at': created_at, '_id': {'$lt': last_id}},
+        ]}
+        return {'$and': [query, keyset]} if query else keyset
+
+    @staticmethod
+    def list_entity(document: Dict[str, Any]) -> Payment:
+        """
+        Cria a entidade a partir de um documento projetado com `LIST_FIELDS`. Por estar incompleta,
+        ela não é registrada no identity map.
+        """
+        return Payment(
+            id=document['_id'],
+            amount=document.get('amount'),
+            external_reference=document.get('external_reference'),
+            qr_code=document.get('qr_code'),
+            transaction_id=document.get('transaction_id'),
+            created_at=document.get('created_at'),
+        )
+
+    @classmethod
+    def lazy_related(cls, **filters) -> LazyRelation[Payment]:
+        """
+        Retorna um proxy preguiçoso para os pagamentos que atendem aos filtros informados.
+        A consulta só é executada quando o proxy é iterado, em lotes paginados por `_id`.
+        """
+        def load_page(last_id, limit):
+            query = cls.objects(**filters)
+            if last_id is not None:
+                query = query.filter(id__gt=last_id)
+            return cls.to_entities(query.order_by('id').limit(limit))
+
+        return LazyRelation(load_page)
+
+    @classmethod
+    def to_entities(cls, payment_models: Iterable["PaymentModel"], track: bool = True) -> List[Payment]:
+        """
+        Converte um conjunto de documentos em entidades. Os status e métodos referenciados são
+        carregados antes, de uma vez, com uma consulta `$in` por tipo (apenas para os que não estão
+        no identity map nem no cache), em vez de uma consulta por pagamento.
+        """
+        payment_models = list(payment_models)
+        references = cls._load_references(payment_models)
+        return [payment_model.to_entity(track=track, references=references) for payment_model in payment_models]
+
+    @staticmethod
+    def _load_references(payment_models: List["PaymentModel"]) -> Dict[tuple, Any]:
+        from src.core.domain.entities.payment_method import PaymentMethod
+        from src.core.domain.entities.payment_status import PaymentStatus
+        from src.adapters.driven.repositories.models.payment_method_model import PaymentMethodModel
+        from src.adapters.driven.repositories.models.payment_status_model import PaymentStatusModel
+
+        identity_map: IdentityMap = IdentityMap.get_instance()
+        references: Dict[tuple, Any] = {}
+        for entity_class, model_class, field_name in (
+            (PaymentStatus, PaymentStatusModel, 'payment_status'),
+            (PaymentMethod, PaymentMethodModel, 'payment_method'),
+        ):
+            missing = []
+            for reference_id in {payment_model._reference_id(field_name) for payment_model in payment_models} - {None}:
+                entity = identity_map.get(entity_class, reference_id)
+                if entity is not None:
+                    references[(entity_class, reference_id)] = entity
+                else:
+                    missing.append(reference_id)
+
+            models = model_class.get_many_cached(missing) if missing else {}
+            for reference_id in missing:
+                # Referências inexistentes também ficam registradas, para não serem consultadas de novo
+                model = models.get(reference_id)
+                references[(entity_class, reference_id)] = model.to_entity() if model else None
+        return references
+
+    def to_entity(self, track: bool = True, references: Optional[Dict[tuple, Any]] = None) -> Payment:
+        """
+        Converte o documento em entidade. Com `track=False` a entidade não é registrada no
+        identity map (leituras em streaming, que não devem reter os pagamentos em memória).
+        `references` traz status e métodos já carregados em lote por `to_entities`.
+        """
         identity_map: IdentityMap = IdentityMap.get_instance()
         existing_payment = identity_map.get(Payment, self.id)
         if existing_payment:
@@ -62,44 +247,68 @@ class PaymentModel(BaseModel):
             transaction_id=self.transaction_id,
             notification_url=self.notification_url,
             client_notified=self.client_notified,
+            notification_pending=self.notification_pending,
             created_at=self.created_at,  
             updated_at=self.updated_at,
             inactivated_at=self.inactivated_at,
         )
-        identity_map.add(payment)
+        if track:
+            identity_map.add(payment)
 
-        payment.payment_method = self._get_payment_method(identity_map)
-        payment.payment_status = self._get_payment_status(identity_map)
+        payment.payment_method = self._get_payment_method(identity_map, references or {})
+        payment.payment_status = self._get_payment_status(identity_map, references or {})
+        payment.clear_dirty()
 
         return payment
     
-    def _get_payment_status(self, identity_map: IdentityMap):
+    def _get_payment_status(self, identity_map: IdentityMap, references: Dict[tuple, Any]):
         from src.core.domain.entities.payment_status import PaymentStatus
         from src.adapters.driven.repositories.models.payment_status_model import PaymentStatusModel
         
-        payment_status = identity_map.get(PaymentStatus, self.payment_status.id)
+        payment_status_id = self._reference_id('payment_status')
+        if (PaymentStatus, payment_status_id) in references:
+            return references[(PaymentStatus, payment_status_id)]
+
+        payment_status = identity_map.get(PaymentStatus, payment_status_id)
         if payment_status:
             return payment_status
         
-        payment_status_model = PaymentStatusModel.objects(id=self.payment_status.id).first()
+        payment_status_model = PaymentStatusModel.get_cached(id=payment_status_id)
         if payment_status_model:
             return payment_status_model.to_entity()
         
         return None
     
-    def _get_payment_method(self, identity_map: IdentityMap):
+    def _get_payment_method(self, identity_map: IdentityMap, references: Dict[tuple, Any]):
         from src.core.domain.entities.payment_method import PaymentMethod
         from src.adapters.driven.repositories.models.payment_method_model import PaymentMethodModel
 
-        payment_method = identity_map.get(PaymentMethod, self.payment_method.id)
+        payment_method_id = self._reference_id('payment_method')
+        if payment_method_id is None:
+            return None
+        if (PaymentMethod, payment_method_id) in references:
+            return references[(PaymentMethod, payment_method_id)]
+
+        payment_method = identity_map.get(PaymentMethod, payment_method_id)
         if payment_method:
             return payment_method
 
-        payment_method_model = PaymentMethodModel.objects(id=self.payment_method.id).first()
+        payment_method_model = PaymentMethodModel.get_cached(id=payment_method_id)
         if payment_method_model:
             return payment_method_model.to_entity()
         
         return None
+
+    def _reference_id(self, field_name: str):
+        """
+        Retorna o id de um ReferenceField sem dereferenciar o documento relacionado.
+        """
+        value = self._data.get(field_name)
+        if isinstance(value, DBRef):
+            return value.id
+        if isinstance(value, Document):
+            return value.id
+        return value
     
 
 __all__ = ['PaymentModel']
@@ -2,11 +2,12 @@
 from mongoengine import StringField
 from src.core.shared.identity_map import IdentityMap
 from src.core.domain.entities.payment_status import PaymentStatus
-from src.adapters.driven.repositories.models.base_model import BaseModel
+from src.adapters.driven.repositories.models.reference_data_model import ReferenceDataModel
 
 
-class PaymentStatusModel(BaseModel):
+class PaymentStatusModel(ReferenceDataModel):
     meta = {'collection': 'payment_status'}
+    cache_namespace = 'payment_status'
 
     name = StringField(max_length=50, required=True, unique=True)
     description = StringField(max_length=255, required=False)
@@ -36,10 +37,9 @@ class PaymentStatusModel(BaseModel):
         )
         identity_map.add(payment_status)
         
-        # Load related payments if needed
+        # Related payments are only loaded when iterated
         from src.adapters.driven.repositories.models.payment_model import PaymentModel
-        payments = PaymentModel.objects(payment_status=self.id)
-        payment_status.payments = [payment.to_entity() for payment in payments]
+        payment_status.payments = PaymentModel.lazy_related(payment_status=self.id)
         
         payment_status.id = self.id
         payment_status.created_at = self.created_at
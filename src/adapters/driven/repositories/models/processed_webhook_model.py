@@ -0,0 +1,24 @@
+import datetime
+from mongoengine import Document, StringField, DateTimeField
+
+
+class ProcessedWebhookModel(Document):
+    """
+    Webhooks já processados. O índice TTL em `expires_at` faz o MongoDB remover
+    os registros expirados automaticamente.
+    """
+    meta = {
+        'collection': 'processed_webhooks',
+        'indexes': [
+            {'fields': ['expires_at'], 'expireAfterSeconds': 0},
+        ],
+    }
+
+    key = StringField(primary_key=True, max_length=500)
+
+    processed_at = DateTimeField(default=datetime.datetime.now, required=True)
+
+    expires_at = DateTimeField(required=True)
+
+
+__all__ = ["ProcessedWebhookModel"]
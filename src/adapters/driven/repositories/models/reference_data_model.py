@@ -0,0 +1,85 @@
+from typing import Any, Dict, Iterable, Optional, TypeVar
+
+from src.adapters.driven.repositories.models.base_model import BaseModel
+from src.core.shared.reference_data_cache import ReferenceDataCache
+
+R = TypeVar("R", bound="ReferenceDataModel")
+
+
+class ReferenceDataModel(BaseModel):
+    """
+    Modelo base para coleções de dados de referência (status e métodos de pagamento),
+    cujas leituras por `id` e `name` são servidas pelo `ReferenceDataCache` do processo.
+    """
+
+    meta = {'abstract': True}
+
+    cache_namespace: str = None
+    cached_fields = ('id', 'name', 'description', 'created_at', 'updated_at', 'inactivated_at')
+
+    @classmethod
+    def get_cache(cls) -> ReferenceDataCache:
+        return ReferenceDataCache.get_instance(cls.cache_namespace)
+
+    @classmethod
+    def get_cached(cls: type[R], **lookup) -> Optional[R]:
+        """
+        Busca um documento por `id` ou `name`, consultando o banco apenas em caso de cache miss.
+        """
+        (field, value), = lookup.items()
+        cache = cls.get_cache()
+
+        snapshot = cache.get_snapshot(field, value)
+        if snapshot is not None:
+            return cls(**snapshot)
+
+        model = cls.objects(**lookup).first()
+        if model is not None:
+            cls.cache_model(model)
+        return model
+
+    @classmethod
+    def get_many_cached(cls: type[R], ids: Iterable[Any]) -> Dict[Any, R]:
+        """
+        Busca vários documentos por `id`; os ausentes do cache são lidos em uma única consulta `$in`.
+        :return: Documentos encontrados, indexados pelo `id` informado.
+        """
+        cache = cls.get_cache()
+        models: Dict[Any, R] = {}
+        missing = []
+        for model_id in set(ids):
+            snapshot = cache.get_snapshot('id', model_id)
+            if snapshot is not None:
+                models[model_id] = cls(**snapshot)
+            else:
+                missing.append(model_id)
+
+        if missing:
+            for model in cls.objects(id__in=missing):
+                cls.cache_model(model)
+                models[model.id] = model
+        return models
+
+    @classmethod
+    def cache_model(cls, model: "ReferenceDataModel") -> None:
+        snapshot = {field: getattr(model, field) for field in cls.cached_fields}
+        cls.get_cache().set_snapshot(snapshot)
+
+    @classmethod
+    def warm_cache(cls) -> int:
+        """
+        Carrega todos os documentos da coleção no cache.
+        :return: Quantidade de documentos carregados.
+        """
+        count = 0
+        for model in cls.objects():
+            cls.cache_model(model)
+            count += 1
+        return count
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        cls.get_cache().invalidate()
+
+
+__all__ = ["ReferenceDataModel"]
@@ -20,19 +20,20 @@ class PaymentMethodRepository(IPaymentMethodRepository):
         
         payment_method_model = PaymentMethodModel.from_entity(payment_method)
         payment_method_model.save()
+        PaymentMethodModel.invalidate_cache()
         return payment_method_model.to_entity()
     
     def exists_by_name(self, name: str) -> bool:
         return PaymentMethodModel.objects(name=name).first() is not None
     
     def get_by_name(self, name: str) -> PaymentMethod:
-        payment_method_model = PaymentMethodModel.objects(name=name).first()
+        payment_method_model = PaymentMethodModel.get_cached(name=name)
         if payment_method_model is None:
             return None
         return payment_method_model.to_entity()
     
     def get_by_id(self, payment_method_id: ObjectId) -> PaymentMethod:
-        payment_method_model = PaymentMethodModel.objects(id=payment_method_id).first()
+        payment_method_model = PaymentMethodModel.get_cached(id=payment_method_id)
         if payment_method_model is None:
             return None
         return payment_method_model.to_entity()
@@ -64,10 +65,12 @@ class PaymentMethodRepository(IPaymentMethodRepository):
             payment_method_model = PaymentMethodModel.from_entity(payment_method)
             payment_method_model.save()
         
+        PaymentMethodModel.invalidate_cache()
         return payment_method_model.to_entity()
     
     def delete(self, payment_method) -> None:
         payment_method_model = PaymentMethodModel.objects(id=payment_method.id).first()
         if payment_method_model:
             payment_method_model.delete()
+            PaymentMethodModel.invalidate_cache()
             self.identity_map.remove(payment_method)
@@ -1,5 +1,13 @@
 
+import datetime
+import logging
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from bson import ObjectId
+from config.settings import PAYMENT_EXPORT_BATCH_SIZE
+from mongoengine.errors import ValidationError
+from pymongo import DESCENDING, ReturnDocument
+from pymongo.errors import BulkWriteError
 from src.core.exceptions.bad_request_exception import BadRequestException
 from src.adapters.driven.repositories.models.payment_status_model import PaymentStatusModel
 from src.adapters.driven.repositories.models.payment_model import PaymentModel
@@ -7,6 +15,8 @@ from src.core.shared.identity_map import IdentityMap
 from src.core.domain.entities.payment import Payment
 from src.core.ports.payment.i_payment_repository import IPaymentRepository
 
+logger = logging.getLogger(__name__)
+
 
 class PaymentRepository(IPaymentRepository):
     """
@@ -32,36 +42,232 @@ class PaymentRepository(IPaymentRepository):
         return payment_model.to_entity()
         
 
-    def update_payment_status(self, payment: Payment, status_id) -> Payment:
+    def create_payments(self, payments: List[Payment]) -> List[Optional[Payment]]:
+        """
+        Insere vários pagamentos na coleção `payments` com um único `insert_many` não ordenado.
+        :param payments: Instâncias dos pagamentos a serem criados.
+        :return: Lista alinhada à entrada com o pagamento criado, ou None para os que não puderam ser gravados.
+        """
+        payment_models = {}
+        for index, payment in enumerate(payments):
+            try:
+                payment_model = PaymentModel.from_entity(payment)
+                payment_model.validate()
+                payment_models[index] = payment_model
+            except (ValidationError, ValueError) as e:
+                logger.error(f"Pagamento {payment.external_reference} inválido para inserção em lote: {e}")
+
+        failed = set()
+        if payment_models:
+            positions = list(payment_models)
+            try:
+                PaymentModel._get_collection().insert_many(
+                    [payment_model.to_mongo() for payment_model in payment_models.values()], ordered=False
+                )
+            except BulkWriteError as e:
+                for error in e.details.get('writeErrors', []):
+                    failed.add(positions[error['index']])
+                    logger.error(f"Falha ao inserir pagamento em lote: {error.get('errmsg')}")
+
+        created = {
+            index: payment
+            for index, payment in zip(
+                [index for index in payment_models if index not in failed],
+                PaymentModel.to_entities(payment_model for index, payment_model in payment_models.items() if index not in failed),
+            )
+        }
+        return [created.get(index) for index in range(len(payments))]
+
+    def update_payment_status(
+        self, payment: Payment, status_id, expected_status_id=None, enqueue_notification: bool = False
+    ) -> Optional[Payment]:
         """
-        Atualiza o status de um pagamento na coleção `payments`.
+        Atualiza o status de um pagamento na coleção `payments` com um único `find_one_and_update`.
         :param payment: Instância do pagamento a ser atualizado.
         :param status_id: Novo ID do status do pagamento.
-        :return: Instância do pagamento atualizado.
+        :param expected_status_id: Se informado, só atualiza se o status atual for este.
+        :param enqueue_notification: Registra no outbox, na mesma escrita, a notificação ao cliente.
+        :return: Instância do pagamento atualizado, ou None se o status atual não for o esperado.
         """
         if payment.id is not None:
             existing_payment = self.identity_map.get(Payment, payment.id)
             if existing_payment is not None:
                 self.identity_map.remove(payment)
 
-        payment_status = PaymentStatusModel.objects(id=status_id).first()
+        payment_status = PaymentStatusModel.get_cached(id=status_id)
         if payment_status is None:
             raise ValueError(f"Payment status with ID {status_id} does not exist.")
 
-        # Find existing payment document
-        payment_model = PaymentModel.objects(id=payment.id).first()
-        if payment_model:
-            
-            payment_model.payment_status = payment_status
-            payment_model.save()
-        else:
+        query = PaymentModel.objects(id=payment.id)
+        if expected_status_id is not None:
+            query = query.filter(payment_status=ObjectId(expected_status_id))
+
+        update = {
+            'set__payment_status': payment_status,
+            'set__updated_at': datetime.datetime.now(datetime.UTC),
+        }
+        if enqueue_notification:
+            update['set__notification_pending'] = True
+
+        payment_model = query.modify(new=True, **update)
+        if payment_model is None:
+            if expected_status_id is not None:
+                return None
+
             # Create new payment with updated status
             payment_model = PaymentModel.from_entity(payment)
             payment_model.payment_status = payment_status
+            payment_model.notification_pending = payment_model.notification_pending or enqueue_notification
             payment_model.save()
 
         return payment_model.to_entity()
 
+    def bulk_update_status_by_reference(self, status_by_reference: Dict[str, Any], notify_status_id=None) -> int:
+        """
+        Atualiza o status de vários pagamentos com um `update_many` por status de destino.
+        Pagamentos que já estão no status informado não são regravados.
+        :param status_by_reference: ID do novo status para cada referência externa.
+        :param notify_status_id: Status cuja transição registra no outbox a notificação ao cliente.
+        :return: Quantidade de pagamentos efetivamente alterados.
+        """
+        references_by_status: Dict[ObjectId, List[str]] = {}
+        for external_reference, status_id in status_by_reference.items():
+            references_by_status.setdefault(ObjectId(status_id), []).append(external_reference)
+
+        now = datetime.datetime.now(datetime.UTC)
+        collection = PaymentModel._get_collection()
+        modified = 0
+        for status_id, external_references in references_by_status.items():
+            to_set = {'payment_status': status_id, 'updated_at': now}
+            if notify_status_id is not None and status_id == ObjectId(notify_status_id):
+                to_set['notification_pending'] = True
+            result = collection.update_many(
+                {'external_reference': {'$in': external_references}, 'payment_status': {'$ne': status_id}},
+                {'$set': to_set},
+            )
+            modified += result.modified_count
+        return modified
+
+    def claim_pending_notifications(self, limit: int, lease_seconds: int) -> List[Payment]:
+        """
+        Reserva até `limit` pagamentos do outbox de notificações. Reservas mais antigas que
+        `lease_seconds` (despachante interrompido) voltam a ficar disponíveis.
+        :param limit: Quantidade máxima de pagamentos reservados.
+        :param lease_seconds: Duração da reserva.
+        :return: Pagamentos reservados.
+        """
+        collection = PaymentModel._get_collection()
+        expired_claim = ObjectId.from_datetime(
+            datetime.datetime.now(datetime.UTC) - datetime.timedelta(seconds=lease_seconds)
+        )
+        claimable = {
+            'notification_pending': True,
+            '$or': [{'notification_claim': None}, {'notification_claim': {'$lt': expired_claim}}],
+        }
+        payment_ids = [document['_id'] for document in collection.find(claimable, {'_id': 1}).limit(limit)]
+        if not payment_ids:
+            return []
+
+        # Outro despachante pode ter reservado parte dos ids entre a busca e a reserva
+        claim = ObjectId()
+        collection.update_many({**claimable, '_id': {'$in': payment_ids}}, {'$set': {'notification_claim': claim}})
+        return [
+            PaymentModel._from_son(document).to_entity(track=False)
+            for document in collection.find({'notification_claim': claim})
+        ]
+
+    def complete_notifications(self, payment_ids: List[Any]) -> None:
+        """
+        Remove os pagamentos do outbox, marcando o cliente como notificado.
+        :param payment_ids: IDs dos pagamentos despachados.
+        """
+        if not payment_ids:
+            return
+        PaymentModel._get_collection().update_many(
+            {'_id': {'$in': [ObjectId(payment_id) for payment_id in payment_ids]}},
+            {'$set': {'client_notified': True, 'notification_pending': False}, '$unset': {'notification_claim': ''}},
+        )
+        for payment_id in payment_ids:
+            existing_payment = self.identity_map.get(Payment, payment_id)
+            if existing_payment is not None:
+                self.identity_map.remove(existing_payment)
+
+    def release_notifications(self, payment_ids: List[Any]) -> None:
+        """
+        Libera a reserva dos pagamentos cujo despacho falhou, para nova tentativa.
+        :param payment_ids: IDs dos pagamentos reservados.
+        """
+        if not payment_ids:
+            return
+        PaymentModel._get_collection().update_many(
+            {'_id': {'$in': [ObjectId(payment_id) for payment_id in payment_ids]}},
+            {'$unset': {'notification_claim': ''}},
+        )
+
+    def get_payments_by_references(self, external_references: List[str]) -> List[Payment]:
+        """
+        Recupera os pagamentos com as referências externas informadas em uma única consulta.
+        :param external_references: Referências externas dos pagamentos.
+        :return: Lista de pagamentos encontrados.
+        """
+        if not external_references:
+            return []
+        return PaymentModel.to_entities(PaymentModel.objects(external_reference__in=external_references))
+
+    def list_payments(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime.datetime, Any]] = None,
+        payment_status_id=None,
+        payment_method_id=None,
+        amount_min: Optional[float] = None,
+        amount_max: Optional[float] = None,
+        client_notified: Optional[bool] = None,
+    ) -> List[Payment]:
+        """
+        Lista uma página de pagamentos ordenada por (created_at, _id) decrescente. A página seguinte
+        parte da chave do último item (`after`), sem `skip`, usando os índices `*_created_at_id`.
+        Apenas `PaymentModel.LIST_FIELDS` são lidos do banco.
+        """
+        query = PaymentModel.keyset_filter(
+            PaymentModel.raw_filter(
+                payment_status_id=payment_status_id,
+                payment_method_id=payment_method_id,
+                amount_min=amount_min,
+                amount_max=amount_max,
+                client_notified=client_notified,
+            ),
+            after,
+        )
+        cursor = (
+            PaymentModel._get_collection().find(query, list(PaymentModel.LIST_FIELDS))
+            .sort([('created_at', DESCENDING), ('_id', DESCENDING)])
+            .limit(limit)
+        )
+        return [PaymentModel.list_entity(document) for document in cursor]
+
+    def iter_payments(
+        self,
+        payment_status_id=None,
+        payment_method_id=None,
+        created_from: Optional[datetime.datetime] = None,
+        created_to: Optional[datetime.datetime] = None,
+    ) -> Iterator[Payment]:
+        """
+        Percorre os pagamentos com um cursor do servidor lido em lotes de `PAYMENT_EXPORT_BATCH_SIZE`.
+        As entidades não são registradas no identity map, mantendo a memória constante.
+        :param payment_status_id: ID do status do pagamento.
+        :param payment_method_id: ID do método de pagamento.
+        :param created_from: Data de criação inicial (inclusiva).
+        :param created_to: Data de criação final (exclusiva).
+        :return: Iterador de pagamentos.
+        """
+        query = PaymentModel.objects(__raw__=PaymentModel.raw_filter(payment_status_id, payment_method_id, created_from, created_to))
+        payment_models = iter(query.no_cache().batch_size(PAYMENT_EXPORT_BATCH_SIZE))
+        # Status e métodos são carregados em lote a cada `PAYMENT_EXPORT_BATCH_SIZE` pagamentos
+        while batch := list(islice(payment_models, PAYMENT_EXPORT_BATCH_SIZE)):
+            yield from PaymentModel.to_entities(batch, track=False)
+
     def get_payment_by_id(self, payment_id) -> Payment:
         """
         Recupera os detalhes de um pagamento pelo ID.
@@ -102,6 +308,7 @@ class PaymentRepository(IPaymentRepository):
     def update_payment(self, payment: Payment) -> Payment:
         """
         Atualiza um pagamento existente na coleção `payments`.
+        Se a entidade rastreia alterações, grava apenas os atributos alterados.
         :param payment: Instância do pagamento a ser atualizado.
         :return: Instância do pagamento atualizado.
         """
@@ -112,6 +319,17 @@ class PaymentRepository(IPaymentRepository):
         if existing_payment is not None:
             self.identity_map.remove(payment)
 
+        if isinstance(payment, Payment) and payment.dirty_fields:
+            document = PaymentModel._get_collection().find_one_and_update(
+                {'_id': ObjectId(payment.id)},
+                PaymentModel.dirty_update(payment),
+                return_document=ReturnDocument.AFTER,
+            )
+            if document is not None:
+                payment.clear_dirty()
+                return PaymentModel._from_son(document).to_entity()
+
+        # Pagamento ainda não persistido ou sem rastreamento de alterações: grava o documento completo
         payment_model = PaymentModel.from_entity(payment)
         payment_model.save()
         return payment_model.to_entity()
@@ -16,19 +16,20 @@ class PaymentStatusRepository(IPaymentStatusRepository):
         
         payment_status_model = PaymentStatusModel.from_entity(payment_status)
         payment_status_model.save()
+        PaymentStatusModel.invalidate_cache()
         return payment_status_model.to_entity()
     
     def exists_by_name(self, name):
         return PaymentStatusModel.objects(name=name).first() is not None
     
     def get_by_name(self, name):
-        payment_status_model = PaymentStatusModel.objects(name=name).first()
+        payment_status_model = PaymentStatusModel.get_cached(name=name)
         if not payment_status_model:
             return None
         return payment_status_model.to_entity()
     
     def get_by_id(self, payment_status_id):
-        payment_status_model = PaymentStatusModel.objects(id=payment_status_id).first()
+        payment_status_model = PaymentStatusModel.get_cached(id=payment_status_id)
         if not payment_status_model:
             return None
         return payment_status_model.to_entity()
@@ -60,10 +61,12 @@ class PaymentStatusRepository(IPaymentStatusRepository):
             payment_status_model = PaymentStatusModel.from_entity(payment_status)
             payment_status_model.save()
         
+        PaymentStatusModel.invalidate_cache()
         return payment_status_model.to_entity()
     
     def delete(self, payment_status: PaymentStatus):
         payment_status_model = PaymentStatusModel.objects(id=payment_status.id).first()
         if payment_status_model:
             payment_status_model.delete()
+            PaymentStatusModel.invalidate_cache()
             self.identity_map.remove(payment_status)
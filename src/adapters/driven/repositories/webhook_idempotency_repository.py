@@ -0,0 +1,29 @@
+import datetime
+from config.settings import WEBHOOK_IDEMPOTENCY_TTL_SECONDS
+from src.adapters.driven.repositories.models.processed_webhook_model import ProcessedWebhookModel
+from src.core.ports.payment.i_webhook_idempotency_store import IWebhookIdempotencyStore
+
+
+class WebhookIdempotencyRepository(IWebhookIdempotencyStore):
+    """
+    Registro de webhooks processados em uma coleção MongoDB com índice TTL.
+    """
+
+    def __init__(self, ttl_seconds: float = WEBHOOK_IDEMPOTENCY_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+
+    def is_processed(self, key: str) -> bool:
+        # O monitor de TTL do MongoDB roda a cada minuto, então a expiração também é conferida aqui
+        now = datetime.datetime.now(datetime.UTC)
+        return ProcessedWebhookModel.objects(key=key, expires_at__gt=now).only('key').first() is not None
+
+    def mark_processed(self, key: str) -> None:
+        now = datetime.datetime.now(datetime.UTC)
+        ProcessedWebhookModel.objects(key=key).update_one(
+            upsert=True,
+            set__processed_at=now,
+            set__expires_at=now + datetime.timedelta(seconds=self.ttl_seconds),
+        )
+
+
+__all__ = ['WebhookIdempotencyRepository']
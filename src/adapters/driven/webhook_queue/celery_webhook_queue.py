@@ -0,0 +1,67 @@
+import logging
+import os
+from typing import Dict, Any
+from celery import Task
+from config.celery_config import celery_app
+from src.core.ports.payment.i_payment_webhook_queue import IPaymentWebhookQueue
+
+logger = logging.getLogger(__name__)
+
+
+class CeleryPaymentWebhookQueue(IPaymentWebhookQueue):
+    """Enfileira os webhooks do provedor na fila `default` do Celery"""
+
+    def enqueue(self, payload: Dict[str, Any]) -> bool:
+        """
+        Envia o payload do webhook para a fila de processamento.
+
+        :param payload: Dados enviados pelo gateway no webhook.
+        :return: True se enviado para fila com sucesso
+        """
+        try:
+            task = process_payment_webhook_task.delay(payload)
+            logger.info(f"Webhook enfileirado para processamento. Task ID: {task.id}")
+            return True
+        except Exception as e:
+            logger.error(f"Falha ao enfileirar webhook. Erro: {e}")
+            return False
+
+
+class PaymentWebhookTask(Task):
+    """
+    Task customizada com retry automático. Falhas de negócio também são reprocessadas,
+    pois o webhook pode chegar antes de o pagamento ser persistido.
+    """
+    autoretry_for = (Exception,)
+    retry_kwargs = {
+        'max_retries': int(os.getenv('CELERY_WEBHOOK_MAX_RETRIES', 3)),
+        'countdown': int(os.getenv('CELERY_WEBHOOK_RETRY_DELAY_SECONDS', 5))
+    }
+    retry_backoff = True
+    retry_jitter = True
+
+
+@celery_app.task(bind=True, base=PaymentWebhookTask, name='process_payment_webhook_task')
+def process_payment_webhook_task(self, payload: Dict[str, Any]):
+    """
+    Task Celery que processa um webhook do provedor de pagamento enfileirado pela API.
+
+    :param payload: Dados enviados pelo gateway no webhook
+    """
+    from src.core.containers import Container
+    from src.core.shared.identity_map import IdentityMap
+    from src.application.usecases.payment_usecase.payment_provider_webhook_handler_use_case import (
+        PaymentProviderWebhookHandlerUseCase
+    )
+
+    logger.info(f"Processando webhook enfileirado. Task ID: {self.request.id}")
+
+    # Cada task tem seu próprio identity map, como cada requisição HTTP
+    with IdentityMap.scope():
+        use_case = PaymentProviderWebhookHandlerUseCase.build(
+            payment_provider_gateway=Container.payment_provider_gateway(),
+            payment_gateway=Container.payment_gateway(),
+            payment_status_gateway=Container.payment_status_gateway(),
+            webhook_idempotency_store=Container.webhook_idempotency_store(),
+        )
+        return use_case.execute(payload)
@@ -0,0 +1,115 @@
+import asyncio
+from typing import AsyncIterator, Optional
+from src.core.ports.payment.i_payment_webhook_queue import IPaymentWebhookQueue
+from src.core.ports.payment.i_webhook_idempotency_store import IWebhookIdempotencyStore
+from src.application.usecases.payment_usecase.enqueue_payment_webhook_usecase import EnqueuePaymentWebhookUseCase
+from src.application.usecases.payment_usecase.async_get_payment_by_id_usecase import AsyncGetPaymentByIdUseCase
+from src.application.usecases.payment_usecase.async_get_payment_by_transaction_id_usecase import AsyncGetPaymentByTransactionIdUseCase
+from src.core.domain.dtos.payment.create_payment_dto import CreatePaymentDTO
+from src.core.domain.dtos.payment.create_payments_batch_dto import CreatePaymentsBatchDTO
+from src.core.domain.dtos.payment.payments_batch_result_dto import PaymentsBatchResultDTO
+from src.application.usecases.payment_usecase.async_process_payments_batch_usecase import AsyncProcessPaymentsBatchUseCase
+from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
+from src.application.usecases.payment_usecase.async_payment_provider_webhook_handler_use_case import AsyncPaymentProviderWebhookHandlerUseCase
+from src.adapters.driver.api.v1.presenters.dto_presenter import DTOPresenter
+from src.adapters.driver.api.v1.presenters.export_presenter import ExportPresenter
+from src.application.usecases.payment_usecase.async_export_payments_usecase import AsyncExportPaymentsUseCase
+from src.core.domain.dtos.payment.payment_export_dto import PaymentExportFilterDTO, PaymentExportFormat
+from src.core.domain.dtos.payment.payment_list_dto import PaymentListFilterDTO, PaymentPageDTO
+from src.application.usecases.payment_usecase.async_list_payments_usecase import AsyncListPaymentsUseCase
+from src.core.domain.dtos.payment.qr_code_payment_dto import QrCodePaymentDTO
+from src.application.usecases.payment_usecase.async_process_payment_usecase import AsyncProcessPaymentUseCase
+from src.core.ports.payment.i_async_payment_provider_gateway import IAsyncPaymentProviderGateway
+from src.core.ports.payment_method.i_async_payment_method_repository import IAsyncPaymentMethodRepository
+from src.core.ports.payment_status.i_async_payment_status_repository import IAsyncPaymentStatusRepository
+from src.core.ports.payment.i_async_payment_repository import IAsyncPaymentRepository
+
+
+class AsyncPaymentController:
+    """
+    Versão assíncrona do `PaymentController`, usada quando `PAYMENT_REPOSITORY_MODE=async`.
+    """
+    
+    def __init__(
+        self,
+        payment_provider_gateway: IAsyncPaymentProviderGateway, 
+        payment_gateway: IAsyncPaymentRepository, 
+        payment_status_gateway: IAsyncPaymentStatusRepository, 
+        payment_method_gateway: IAsyncPaymentMethodRepository,
+        payment_webhook_queue: IPaymentWebhookQueue = None,
+        webhook_idempotency_store: IWebhookIdempotencyStore = None,
+    ):
+        self.payment_provider_gateway: IAsyncPaymentProviderGateway = payment_provider_gateway
+        self.payment_gateway: IAsyncPaymentRepository = payment_gateway
+        self.payment_status_gateway: IAsyncPaymentStatusRepository = payment_status_gateway
+        self.payment_method_gateway: IAsyncPaymentMethodRepository = payment_method_gateway
+        self.payment_webhook_queue: IPaymentWebhookQueue = payment_webhook_queue
+        self.webhook_idempotency_store: IWebhookIdempotencyStore = webhook_idempotency_store
+        
+    async def process_payment(self, dto: CreatePaymentDTO) -> QrCodePaymentDTO:
+        process_payment_use_case = AsyncProcessPaymentUseCase.build(
+            payment_gateway=self.payment_gateway,
+            payment_status_gateway=self.payment_status_gateway,
+            payment_method_gateway=self.payment_method_gateway,
+            payment_provider_gateway=self.payment_provider_gateway,
+        )
+        payment = await process_payment_use_case.execute(dto)
+        return DTOPresenter.transform(payment, QrCodePaymentDTO)
+
+    async def process_payments_batch(self, dto: CreatePaymentsBatchDTO) -> PaymentsBatchResultDTO:
+        process_payments_batch_use_case = AsyncProcessPaymentsBatchUseCase.build(
+            payment_gateway=self.payment_gateway,
+            payment_status_gateway=self.payment_status_gateway,
+            payment_method_gateway=self.payment_method_gateway,
+            payment_provider_gateway=self.payment_provider_gateway,
+        )
+        results = await process_payments_batch_use_case.execute(dto.payments)
+        return PaymentsBatchResultDTO.from_results(results)
+
+    async def get_payment_by_transaction_id(self, transaction_id: str) -> QrCodePaymentDTO:
+        get_payment_by_transaction_id_use_case = AsyncGetPaymentByTransactionIdUseCase.build(self.payment_gateway)
+        payment = await get_payment_by_transaction_id_use_case.execute(transaction_id)
+        if not payment:
+            raise EntityNotFoundException(message="Pagamento não encontrado para o transaction_id informado.")
+        return DTOPresenter.transform(payment, QrCodePaymentDTO)
+    
+    async def get_payment_by_id(self, payment_id: str) -> QrCodePaymentDTO:
+        get_payment_by_id_use_case = AsyncGetPaymentByIdUseCase.build(
+            self.payment_gateway
+        )
+        payment = await get_payment_by_id_use_case.execute(payment_id)
+        if not payment:
+            raise EntityNotFoundException(message="Pagamento não encontrado para o ID informado.")
+        return DTOPresenter.transform(payment, QrCodePaymentDTO)
+
+    async def list_payments(self, filters: PaymentListFilterDTO, limit: int, cursor: Optional[str] = None) -> PaymentPageDTO:
+        list_payments_use_case = AsyncListPaymentsUseCase.build(
+            payment_gateway=self.payment_gateway,
+            payment_status_gateway=self.payment_status_gateway,
+            payment_method_gateway=self.payment_method_gateway,
+        )
+        payments, next_cursor = await list_payments_use_case.execute(filters, limit, cursor)
+        return PaymentPageDTO.from_page(payments, next_cursor)
+
+    async def export_payments(self, filters: PaymentExportFilterDTO, export_format: PaymentExportFormat) -> AsyncIterator[str]:
+        export_payments_use_case = AsyncExportPaymentsUseCase.build(
+            payment_gateway=self.payment_gateway,
+            payment_status_gateway=self.payment_status_gateway,
+            payment_method_gateway=self.payment_method_gateway,
+        )
+        payments = await export_payments_use_case.execute(filters)
+        return ExportPresenter.astream(payments, export_format)
+
+    async def payment_provider_webhook(self, payload: dict) -> dict:
+        if self.payment_webhook_queue is not None:
+            enqueue_payment_webhook_use_case = EnqueuePaymentWebhookUseCase.build(self.payment_webhook_queue)
+            if await asyncio.to_thread(enqueue_payment_webhook_use_case.execute, payload):
+                return {"action": "enqueued"}
+
+        payment_provider_webhook_use_case = AsyncPaymentProviderWebhookHandlerUseCase.build(
+            self.payment_provider_gateway,
+            self.payment_gateway,
+            self.payment_status_gateway,
+            self.webhook_idempotency_store,
+        )
+        return await payment_provider_webhook_use_case.execute(payload)
@@ -1,10 +1,22 @@
-from src.core.ports.notification.i_notification_service import INotificationService
+from typing import Iterable, Iterator, Optional
+from src.core.ports.payment.i_payment_webhook_queue import IPaymentWebhookQueue
+from src.core.ports.payment.i_webhook_idempotency_store import IWebhookIdempotencyStore
+from src.application.usecases.payment_usecase.enqueue_payment_webhook_usecase import EnqueuePaymentWebhookUseCase
 from src.application.usecases.payment_usecase.get_payment_by_id_usecase import GetPaymentByIdUseCase
 from src.application.usecases.payment_usecase.get_payment_by_transaction_id_usecase import GetPaymentByTransactionIdUseCase
 from src.core.domain.dtos.payment.create_payment_dto import CreatePaymentDTO
+from src.core.domain.dtos.payment.create_payments_batch_dto import CreatePaymentsBatchDTO
+from src.core.domain.dtos.payment.payments_batch_result_dto import PaymentsBatchResultDTO
+from src.application.usecases.payment_usecase.process_payments_batch_usecase import ProcessPaymentsBatchUseCase
 from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
 from src.application.usecases.payment_usecase.payment_provider_webhook_handler_use_case import PaymentProviderWebhookHandlerUseCase
+from src.application.usecases.payment_usecase.replay_payment_webhooks_usecase import ReplayPaymentWebhooksUseCase
 from src.adapters.driver.api.v1.presenters.dto_presenter import DTOPresenter
+from src.adapters.driver.api.v1.presenters.export_presenter import ExportPresenter
+from src.application.usecases.payment_usecase.export_payments_usecase import ExportPaymentsUseCase
+from src.core.domain.dtos.payment.payment_export_dto import PaymentExportFilterDTO, PaymentExportFormat
+from src.core.domain.dtos.payment.payment_list_dto import PaymentListFilterDTO, PaymentPageDTO
+from src.application.usecases.payment_usecase.list_payments_usecase import ListPaymentsUseCase
 from src.core.domain.dtos.payment.qr_code_payment_dto import QrCodePaymentDTO
 from src.application.usecases.payment_usecase.process_payment_usecase import ProcessPaymentUseCase
 from src.core.ports.payment.i_payment_provider_gateway import IPaymentProviderGateway
@@ -21,13 +33,15 @@ class PaymentController:
         payment_gateway: IPaymentRepository, 
         payment_status_gateway: IPaymentStatusRepository, 
         payment_method_gateway: IPaymentMethodRepository,
-        notification_service: INotificationService,
+        payment_webhook_queue: IPaymentWebhookQueue = None,
+        webhook_idempotency_store: IWebhookIdempotencyStore = None,
     ):
         self.payment_provider_gateway: IPaymentProviderGateway = payment_provider_gateway
         self.payment_gateway: IPaymentRepository = payment_gateway
         self.payment_status_gateway: IPaymentStatusRepository = payment_status_gateway
         self.payment_method_gateway: IPaymentMethodRepository = payment_method_gateway
-        self.notification_service: INotificationService = notification_service
+        self.payment_webhook_queue: IPaymentWebhookQueue = payment_webhook_queue
+        self.webhook_idempotency_store: IWebhookIdempotencyStore = webhook_idempotency_store
         
     def process_payment(self, dto: CreatePaymentDTO) -> QrCodePaymentDTO:
         process_payment_use_case = ProcessPaymentUseCase.build(
@@ -39,6 +53,16 @@ class PaymentController:
         payment = process_payment_use_case.execute(dto)
         return DTOPresenter.transform(payment, QrCodePaymentDTO)
 
+    def process_payments_batch(self, dto: CreatePaymentsBatchDTO) -> PaymentsBatchResultDTO:
+        process_payments_batch_use_case = ProcessPaymentsBatchUseCase.build(
+            payment_gateway=self.payment_gateway,
+            payment_status_gateway=self.payment_status_gateway,
+            payment_method_gateway=self.payment_method_gateway,
+            payment_provider_gateway=self.payment_provider_gateway,
+        )
+        results = process_payments_batch_use_case.execute(dto.payments)
+        return PaymentsBatchResultDTO.from_results(results)
+
     def get_payment_by_transaction_id(self, transaction_id: str) -> QrCodePaymentDTO:
         get_payment_by_transaction_id_use_case = GetPaymentByTransactionIdUseCase.build(self.payment_gateway)
         payment = get_payment_by_transaction_id_use_case.execute(transaction_id)
@@ -55,12 +79,42 @@ class PaymentController:
             raise EntityNotFoundException(message="Pagamento não encontrado para o ID informado.")
         return DTOPresenter.transform(payment, QrCodePaymentDTO)
 
+    def list_payments(self, filters: PaymentListFilterDTO, limit: int, cursor: Optional[str] = None) -> PaymentPageDTO:
+        list_payments_use_case = ListPaymentsUseCase.build(
+            payment_gateway=self.payment_gateway,
+            payment_status_gateway=self.payment_status_gateway,
+            payment_method_gateway=self.payment_method_gateway,
+        )
+        payments, next_cursor = list_payments_use_case.execute(filters, limit, cursor)
+        return PaymentPageDTO.from_page(payments, next_cursor)
+
+    def export_payments(self, filters: PaymentExportFilterDTO, export_format: PaymentExportFormat) -> Iterator[str]:
+        export_payments_use_case = ExportPaymentsUseCase.build(
+            payment_gateway=self.payment_gateway,
+            payment_status_gateway=self.payment_status_gateway,
+            payment_method_gateway=self.payment_method_gateway,
+        )
+        payments = export_payments_use_case.execute(filters)
+        return ExportPresenter.stream(payments, export_format)
+
     def payment_provider_webhook(self, payload: dict) -> dict:
+        if self.payment_webhook_queue is not None:
+            enqueue_payment_webhook_use_case = EnqueuePaymentWebhookUseCase.build(self.payment_webhook_queue)
+            if enqueue_payment_webhook_use_case.execute(payload):
+                return {"action": "enqueued"}
+
         payment_provider_webhook_use_case = PaymentProviderWebhookHandlerUseCase.build(
             self.payment_provider_gateway,
             self.payment_gateway,
             self.payment_status_gateway,
-            self.notification_service,
+            self.webhook_idempotency_store,
         )
         return payment_provider_webhook_use_case.execute(payload)
-            
+
+    def replay_payment_webhooks(self, payloads: Iterable[dict]) -> dict:
+        replay_payment_webhooks_use_case = ReplayPaymentWebhooksUseCase.build(
+            self.payment_provider_gateway,
+            self.payment_gateway,
+            self.payment_status_gateway,
+        )
+        return replay_payment_webhooks_use_case.execute(payloads)
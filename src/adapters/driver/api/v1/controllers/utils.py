@@ -0,0 +1,12 @@
+import inspect
+from typing import Any
+
+
+async def resolve(result: Any) -> Any:
+    """
+    Aguarda o resultado quando o controller é assíncrono; caso contrário, retorna o valor como está.
+    Permite que as rotas funcionem com os controllers síncronos e assíncronos selecionados no container.
+    """
+    if inspect.isawaitable(result):
+        return await result
+    return result
@@ -1,7 +1,10 @@
+import logging
 
-from src.core.containers import Container
+from src.core.shared.identity_map import IdentityMap
 from starlette.types import ASGIApp, Receive, Scope, Send
 
+logger = logging.getLogger(__name__)
+
 class IdentityMapMiddleware:
     def __init__(self, app: ASGIApp) -> None:
         self.app = app
@@ -11,5 +14,7 @@ class IdentityMapMiddleware:
             await self.app(scope, receive, send)
             return
 
-        Container.identity_map.reset()  # Garante que uma nova instância seja criada
-        await self.app(scope, receive, send)
+        # Cada requisição tem seu próprio mapa, herdado pelas threads e tasks que ela dispara
+        with IdentityMap.scope() as identity_map:
+            await self.app(scope, receive, send)
+        logger.debug(f"Identity map de {scope['path']}: {identity_map.stats()}")
@@ -0,0 +1,67 @@
+import csv
+import io
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator
+
+from src.core.domain.dtos.payment.payment_export_dto import PaymentExportFormat, PaymentExportRowDTO
+from src.core.domain.entities.payment import Payment
+
+
+class _ExportBuffer:
+    """
+    Acumula as linhas serializadas até formar um bloco, evitando uma mensagem HTTP por pagamento.
+    """
+
+    def __init__(self, export_format: PaymentExportFormat):
+        self._buffer = io.StringIO()
+        self._csv_writer = csv.writer(self._buffer) if export_format == PaymentExportFormat.CSV else None
+        self.rows = 0
+        if self._csv_writer:
+            self._csv_writer.writerow(PaymentExportRowDTO.FIELDS)
+
+    def write(self, payment: Payment) -> None:
+        row = PaymentExportRowDTO.from_entity(payment)
+        if self._csv_writer:
+            data = row.model_dump(mode="json")
+            self._csv_writer.writerow([data[field] for field in PaymentExportRowDTO.FIELDS])
+        else:
+            self._buffer.write(row.model_dump_json())
+            self._buffer.write("\n")
+        self.rows += 1
+
+    def flush(self) -> str:
+        chunk = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self.rows = 0
+        return chunk
+
+
+class ExportPresenter:
+
+    CHUNK_ROWS = 500
+    MEDIA_TYPES = {
+        PaymentExportFormat.NDJSON: "application/x-ndjson",
+        PaymentExportFormat.CSV: "text/csv",
+    }
+
+    @classmethod
+    def stream(cls, payments: Iterable[Payment], export_format: PaymentExportFormat) -> Iterator[str]:
+        buffer = _ExportBuffer(export_format)
+        for payment in payments:
+            buffer.write(payment)
+            if buffer.rows >= cls.CHUNK_ROWS:
+                yield buffer.flush()
+        chunk = buffer.flush()
+        if chunk:
+            yield chunk
+
+    @classmethod
+    async def astream(cls, payments: AsyncIterable[Payment], export_format: PaymentExportFormat) -> AsyncIterator[str]:
+        buffer = _ExportBuffer(export_format)
+        async for payment in payments:
+            buffer.write(payment)
+            if buffer.rows >= cls.CHUNK_ROWS:
+                yield buffer.flush()
+        chunk = buffer.flush()
+        if chunk:
+            yield chunk
@@ -1,9 +1,18 @@
-from fastapi import APIRouter, Depends, status
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 from dependency_injector.wiring import inject, Provide
 
+from config.settings import PAYMENT_LIST_DEFAULT_LIMIT, PAYMENT_LIST_MAX_LIMIT
 from src.core.domain.dtos.payment.create_payment_dto import CreatePaymentDTO
 from src.core.domain.dtos.payment.qr_code_payment_dto import QrCodePaymentDTO
+from src.core.domain.dtos.payment.create_payments_batch_dto import CreatePaymentsBatchDTO
+from src.core.domain.dtos.payment.payments_batch_result_dto import PaymentsBatchResultDTO
+from src.core.domain.dtos.payment.payment_export_dto import PaymentExportFilterDTO, PaymentExportFormat
+from src.core.domain.dtos.payment.payment_list_dto import PaymentListFilterDTO, PaymentPageDTO
+from src.adapters.driver.api.v1.presenters.export_presenter import ExportPresenter
 from src.adapters.driver.api.v1.controllers.payment_controller import PaymentController
+from src.adapters.driver.api.v1.controllers.utils import resolve
 from src.core.containers import Container
 
 router = APIRouter()
@@ -19,7 +28,54 @@ async def create_payment(
     dto: CreatePaymentDTO,
     controller: PaymentController = Depends(Provide[Container.payment_controller]),
 ):
-    return controller.process_payment(dto)
+    return await resolve(controller.process_payment(dto))
+
+# Criar pagamentos em lote (resultado individual por item)
+@router.post(
+    "/payments/batch",
+    response_model=PaymentsBatchResultDTO,
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def create_payments_batch(
+    dto: CreatePaymentsBatchDTO,
+    controller: PaymentController = Depends(Provide[Container.payment_controller]),
+):
+    return await resolve(controller.process_payments_batch(dto))
+
+# Listar pagamentos com filtros e paginação por cursor
+@router.get(
+    "/payments",
+    response_model=PaymentPageDTO,
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def list_payments(
+    filters: PaymentListFilterDTO = Depends(),
+    limit: int = Query(PAYMENT_LIST_DEFAULT_LIMIT, ge=1, le=PAYMENT_LIST_MAX_LIMIT),
+    cursor: Optional[str] = Query(None),
+    controller: PaymentController = Depends(Provide[Container.payment_controller]),
+):
+    return await resolve(controller.list_payments(filters, limit, cursor))
+
+# Exportar pagamentos em streaming (NDJSON ou CSV) para conciliação
+@router.get(
+    "/payments/export",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def export_payments(
+    filters: PaymentExportFilterDTO = Depends(),
+    export_format: PaymentExportFormat = Query(PaymentExportFormat.NDJSON, alias="format"),
+    controller: PaymentController = Depends(Provide[Container.payment_controller]),
+):
+    content = await resolve(controller.export_payments(filters, export_format))
+    return StreamingResponse(
+        content,
+        media_type=ExportPresenter.MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="payments.{export_format.value}"'},
+    )
 
 @router.get(
     "/payment/transaction/{transaction_id}",
@@ -31,7 +87,7 @@ async def get_payment_by_transaction_id(
     transaction_id: str,
     controller: PaymentController = Depends(Provide[Container.payment_controller]),
 ):
-    return controller.get_payment_by_transaction_id(transaction_id)
+    return await resolve(controller.get_payment_by_transaction_id(transaction_id))
 
 @router.get(
     "/payment/id/{payment_id}",
@@ -43,4 +99,4 @@ async def get_payment_by_id(
     payment_id: str,
     controller: PaymentController = Depends(Provide[Container.payment_controller]),
 ):
-    return controller.get_payment_by_id(payment_id)
+    return await resolve(controller.get_payment_by_id(payment_id))
@@ -1,12 +1,15 @@
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import JSONResponse
 from dependency_injector.wiring import inject, Provide
+from starlette.concurrency import run_in_threadpool
 from starlette.requests import ClientDisconnect
 import logging
 
 from src.core.containers import Container
 from src.adapters.driver.api.v1.controllers.payment_controller import PaymentController
+from src.adapters.driver.api.v1.controllers.utils import resolve
 from src.adapters.driver.api.v1.decorators.bypass_auth import bypass_auth
+from src.core.shared.ndjson import NdjsonReader, aiter_lines
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -39,7 +42,7 @@ async def webhook(request: Request, payment_controller: PaymentController = Depe
             return JSONResponse(content={"error": "Invalid JSON payload"}, status_code=400)
 
         logger.info(f"Webhook recebido: {payload}")
-        payment_controller.payment_provider_webhook(payload)
+        await resolve(payment_controller.payment_provider_webhook(payload))
         return JSONResponse(content={"message": "Webhook processado com sucesso!"}, status_code=200)
         
     except ClientDisconnect:
@@ -48,3 +51,26 @@ async def webhook(request: Request, payment_controller: PaymentController = Depe
     except Exception as e:
         logger.error(f"Erro ao processar webhook: {e}")
         return JSONResponse(content={"error": "Erro interno do servidor"}, status_code=500)
+
+
+@router.post("/webhook/payment/replay", include_in_schema=False)
+@inject
+async def replay_webhooks(
+    request: Request,
+    payment_controller: PaymentController = Depends(Provide[Container.webhook_replay_controller])
+):
+    """
+    Reprocessa em lote notificações do payment provider enviadas como NDJSON (um payload por linha).
+    """
+    try:
+        lines = [line async for line in aiter_lines(request.stream())]
+    except ClientDisconnect:
+        logger.warning("Cliente desconectou durante leitura do NDJSON")
+        return JSONResponse(content={"message": "Cliente desconectou"}, status_code=200)
+
+    reader = NdjsonReader(lines)
+    payloads = list(reader)
+    logger.info(f"Reprocessando {len(payloads)} webhooks ({reader.invalid_lines} linhas inválidas).")
+
+    summary = await run_in_threadpool(payment_controller.replay_payment_webhooks, payloads)
+    return JSONResponse(content={**summary, "invalid_lines": reader.invalid_lines}, status_code=200)
@@ -0,0 +1,39 @@
+import argparse
+import json
+import sys
+
+from config.database import connect_db, disconnect_db
+from src.core.containers import Container
+from src.core.shared.ndjson import NdjsonReader
+
+
+def main(argv=None) -> int:
+    """
+    Reprocessa em lote notificações do payment provider a partir de um arquivo NDJSON
+    (um payload por linha) e imprime o resumo em JSON.
+    """
+    parser = argparse.ArgumentParser(description="Reprocessa webhooks de pagamento a partir de um arquivo NDJSON.")
+    parser.add_argument("path", help="Arquivo NDJSON com os payloads ('-' para ler da entrada padrão).")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.path == "-" else open(args.path, encoding="utf-8")
+    try:
+        reader = NdjsonReader(source)
+        payloads = list(reader)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+    connect_db()
+    try:
+        controller = Container().webhook_replay_controller()
+        summary = controller.replay_payment_webhooks(payloads)
+    finally:
+        disconnect_db()
+
+    print(json.dumps({**summary, "invalid_lines": reader.invalid_lines}))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,16 +10,64 @@ from src.adapters.driver.api.v1.routes.payment_status_routes import router as pa
 from src.adapters.driver.api.v1.routes.payment_routes import router as payment_routes
 from src.adapters.driver.api.v1.routes.webhook_routes import router as webhook_routes
 from src.adapters.driver.api.v1.middleware.api_key_middleware import ApiKeyMiddleware
-from config.database import connect_db, disconnect_db
+from src.adapters.driven.repositories.models.payment_status_model import PaymentStatusModel
+from src.adapters.driven.repositories.models.payment_method_model import PaymentMethodModel
+from src.adapters.driven.repositories.models.payment_model import PaymentModel
+from config.database import connect_db, disconnect_db, connect_async_db, disconnect_async_db
 from config.custom_openapi import custom_openapi
+from config.settings import REFERENCE_DATA_CACHE_PUBSUB_ENABLED
+import logging
+
+logger = logging.getLogger(__name__)
 
 # Definindo o esquema de segurança para API Key
 api_key_header = APIKeyHeader(name="x-api-key", auto_error=False)
 
+def warm_reference_data_cache():
+    for model in (PaymentStatusModel, PaymentMethodModel):
+        try:
+            count = model.warm_cache()
+            logger.info(f"Cache {model.cache_namespace} aquecido com {count} registros.")
+        except Exception as e:
+            logger.warning(f"Falha ao aquecer o cache {model.cache_namespace}: {e}")
+
+def report_missing_indexes():
+    for model in (PaymentModel, PaymentStatusModel, PaymentMethodModel):
+        try:
+            missing = model.missing_indexes()
+            if missing:
+                logger.warning(
+                    f"Coleção {model._get_collection_name()} sem os índices {missing}. "
+                    "Execute as migrações (config/init_db/run_migrations.py)."
+                )
+        except Exception as e:
+            logger.warning(f"Falha ao verificar os índices de {model._get_collection_name()}: {e}")
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     connect_db()
+    async_mode = container.config.repository_mode() == "async"
+    if async_mode:
+        connect_async_db()
+        container.mercado_pago_http_client()
+    warm_reference_data_cache()
+    report_missing_indexes()
+
+    cache_bus = None
+    if REFERENCE_DATA_CACHE_PUBSUB_ENABLED:
+        cache_bus = Container.reference_data_cache_bus()
+        for cache in Container.reference_data_caches().values():
+            cache.bind_bus(cache_bus)
+        cache_bus.start()
+
     yield
+
+    if cache_bus is not None:
+        cache_bus.stop()
+    if async_mode:
+        await container.mercado_pago_http_client().aclose()
+        container.mercado_pago_http_client.reset()
+    await disconnect_async_db()
     disconnect_db()
 
 app = FastAPI(
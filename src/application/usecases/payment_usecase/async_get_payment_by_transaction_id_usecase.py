@@ -0,0 +1,19 @@
+from src.core.domain.entities.payment import Payment
+from src.core.ports.payment.i_async_payment_repository import IAsyncPaymentRepository
+
+
+class AsyncGetPaymentByTransactionIdUseCase:
+    """Async use case for retrieving a payment by its transaction ID."""
+    
+    def __init__(self, payment_gateway: IAsyncPaymentRepository):
+        self.payment_gateway = payment_gateway
+    
+    @classmethod
+    def build(cls, payment_gateway: IAsyncPaymentRepository) -> 'AsyncGetPaymentByTransactionIdUseCase':
+        """Factory method to create an instance of AsyncGetPaymentByTransactionIdUseCase."""
+        return cls(payment_gateway=payment_gateway)
+    
+    async def execute(self, transaction_id: str) -> Payment | None:
+        """Execute the use case to retrieve a payment by its transaction ID."""
+        payment = await self.payment_gateway.get_payment_by_transaction_id(transaction_id)
+        return payment
@@ -0,0 +1,70 @@
+from typing import List, Optional, Tuple
+
+from src.application.usecases.payment_usecase.list_payments_usecase import ListPaymentsUseCase
+from src.core.domain.dtos.payment.payment_list_dto import PaymentListFilterDTO
+from src.core.domain.entities.payment import Payment
+from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
+from src.core.ports.payment.i_async_payment_repository import IAsyncPaymentRepository
+from src.core.ports.payment_method.i_async_payment_method_repository import IAsyncPaymentMethodRepository
+from src.core.ports.payment_status.i_async_payment_status_repository import IAsyncPaymentStatusRepository
+from src.core.shared.keyset_cursor import decode_cursor
+
+
+class AsyncListPaymentsUseCase:
+    """
+    Versão assíncrona de `ListPaymentsUseCase`.
+    """
+
+    def __init__(
+        self,
+        payment_gateway: IAsyncPaymentRepository,
+        payment_status_gateway: IAsyncPaymentStatusRepository,
+        payment_method_gateway: IAsyncPaymentMethodRepository,
+    ):
+        self.payment_gateway = payment_gateway
+        self.payment_status_gateway = payment_status_gateway
+        self.payment_method_gateway = payment_method_gateway
+
+    @classmethod
+    def build(
+        cls,
+        payment_gateway: IAsyncPaymentRepository,
+        payment_status_gateway: IAsyncPaymentStatusRepository,
+        payment_method_gateway: IAsyncPaymentMethodRepository,
+    ) -> 'AsyncListPaymentsUseCase':
+        return cls(
+            payment_gateway=payment_gateway,
+            payment_status_gateway=payment_status_gateway,
+            payment_method_gateway=payment_method_gateway,
+        )
+
+    async def execute(
+        self, filters: PaymentListFilterDTO, limit: int, cursor: Optional[str] = None
+    ) -> Tuple[List[Payment], Optional[str]]:
+        """
+        Retorna os pagamentos da página e o cursor da próxima página (None na última).
+        """
+        payment_status_id = None
+        if filters.payment_status:
+            payment_status = await self.payment_status_gateway.get_by_name(filters.payment_status)
+            if not payment_status:
+                raise EntityNotFoundException("Não foi possível encontrar o status de pagamento informado.")
+            payment_status_id = payment_status.id
+
+        payment_method_id = None
+        if filters.payment_method:
+            payment_method = await self.payment_method_gateway.get_by_name(filters.payment_method)
+            if not payment_method:
+                raise EntityNotFoundException("Não foi possível encontrar o método de pagamento informado.")
+            payment_method_id = payment_method.id
+
+        payments = await self.payment_gateway.list_payments(
+            limit=limit + 1,
+            after=decode_cursor(cursor) if cursor else None,
+            payment_status_id=payment_status_id,
+            payment_method_id=payment_method_id,
+            amount_min=filters.amount_min,
+            amount_max=filters.amount_max,
+            client_notified=filters.client_notified,
+        )
+        return ListPaymentsUseCase.paginate(payments, limit)
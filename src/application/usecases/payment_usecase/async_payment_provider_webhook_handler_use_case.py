@@ -0,0 +1,113 @@
+import asyncio
+import traceback
+from typing import Optional
+from src.application.usecases.payment_usecase.payment_provider_webhook_handler_use_case import PaymentProviderWebhookHandlerUseCase
+from src.core.exceptions.bad_request_exception import BadRequestException
+from src.core.ports.payment.i_async_payment_provider_gateway import IAsyncPaymentProviderGateway
+from src.core.ports.payment.i_async_payment_repository import IAsyncPaymentRepository
+from src.core.ports.payment_status.i_async_payment_status_repository import IAsyncPaymentStatusRepository
+from src.core.ports.payment.i_webhook_idempotency_store import IWebhookIdempotencyStore
+import logging
+
+logger = logging.getLogger(__name__)
+
+class AsyncPaymentProviderWebhookHandlerUseCase:
+    
+    def __init__(
+        self,
+        payment_provider_gateway: IAsyncPaymentProviderGateway,
+        payment_gateway: IAsyncPaymentRepository,
+        payment_status_gateway: IAsyncPaymentStatusRepository,
+        webhook_idempotency_store: IWebhookIdempotencyStore = None,
+    ):
+        self.payment_provider_gateway = payment_provider_gateway
+        self.payment_gateway = payment_gateway
+        self.payment_status_gateway = payment_status_gateway
+        self.webhook_idempotency_store = webhook_idempotency_store
+    
+    @classmethod    
+    def build(
+        cls,
+        payment_provider_gateway: IAsyncPaymentProviderGateway,
+        payment_gateway: IAsyncPaymentRepository,
+        payment_status_gateway: IAsyncPaymentStatusRepository,
+        webhook_idempotency_store: IWebhookIdempotencyStore = None
+    ) -> 'AsyncPaymentProviderWebhookHandlerUseCase':
+        return cls(
+            payment_provider_gateway=payment_provider_gateway,
+            payment_gateway=payment_gateway,
+            payment_status_gateway=payment_status_gateway,
+            webhook_idempotency_store=webhook_idempotency_store
+        )
+        
+    async def execute(self, payload: dict) -> None:
+        """
+        Processes a webhook sent by the payment service.
+        :param payload: Data sent by the payment service webhook.
+        """
+        try:
+            # Reentregas já processadas são descartadas antes de consultar o provedor
+            delivery_key = self.payment_provider_gateway.webhook_idempotency_key(payload)
+            if await self._is_processed(delivery_key):
+                logger.info(f"Webhook {delivery_key} já processado; ignorando reentrega.")
+                return dict(PaymentProviderWebhookHandlerUseCase.DUPLICATE_RESULT)
+
+            payment_details = await self.payment_provider_gateway.verify_payment(payload)
+            if payment_details.get("action") == "return":
+                return payment_details
+
+            # Mesma versão do recurso já aplicada por outra notificação
+            resource_key = self.payment_provider_gateway.webhook_idempotency_key(
+                payload, payment_details.get("last_modified")
+            )
+            if resource_key != delivery_key and await self._is_processed(resource_key):
+                logger.info(f"Webhook {resource_key} já processado; ignorando reentrega.")
+                await self._mark_processed(delivery_key)
+                return dict(PaymentProviderWebhookHandlerUseCase.DUPLICATE_RESULT)
+
+            external_reference = payment_details.get("external_reference")
+            status_name = payment_details.get("payment_status")
+
+            status_mapped = self.payment_provider_gateway.status_map(status_name)
+            if not status_mapped:
+                raise BadRequestException(f"Status desconhecido recebido: {status_name}")
+
+            # Buscando o pagamento no banco de dados
+            payment = await self.payment_gateway.get_payment_by_reference(external_reference)
+            if not payment:
+                raise BadRequestException(f"Pagamento com referência {external_reference} não encontrado.")
+
+            # Atualizando o status do pagamento
+            new_status = await self.payment_status_gateway.get_by_name(status_mapped.status)
+            if not new_status:
+                raise BadRequestException(f"Status de pagamento não encontrado: {status_name}")
+
+            # Transição condicionada ao status lido: uma atualização concorrente faz o webhook ser reprocessado.
+            # A notificação ao cliente entra no outbox na mesma escrita e é despachada fora da requisição.
+            current_status_id = payment.payment_status.id if payment.payment_status else None
+            if current_status_id != new_status.id:
+                payment = await self.payment_gateway.update_payment_status(
+                    payment,
+                    new_status.id,
+                    expected_status_id=current_status_id,
+                    enqueue_notification=PaymentProviderWebhookHandlerUseCase.should_notify_client(payment, new_status),
+                )
+                if payment is None:
+                    raise BadRequestException(f"Status do pagamento {external_reference} alterado concorrentemente.")
+
+            await self._mark_processed(delivery_key, resource_key)
+                    
+        except Exception as e:
+            traceback.print_exc()
+            raise BadRequestException(f"Erro ao processar webhook: {str(e)}")
+
+    async def _is_processed(self, key: Optional[str]) -> bool:
+        if not key or not self.webhook_idempotency_store:
+            return False
+        return await asyncio.to_thread(self.webhook_idempotency_store.is_processed, key)
+
+    async def _mark_processed(self, *keys: Optional[str]) -> None:
+        if not self.webhook_idempotency_store:
+            return
+        for key in dict.fromkeys(k for k in keys if k):
+            await asyncio.to_thread(self.webhook_idempotency_store.mark_processed, key)
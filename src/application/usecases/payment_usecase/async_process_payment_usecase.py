@@ -0,0 +1,55 @@
+from src.application.usecases.payment_usecase.process_payment_usecase import ProcessPaymentUseCase
+from src.core.domain.dtos.payment.create_payment_dto import CreatePaymentDTO
+from src.constants.payment_status import PaymentStatusEnum
+from src.core.domain.entities.payment import Payment
+from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
+from src.core.ports.payment.i_async_payment_provider_gateway import IAsyncPaymentProviderGateway
+from src.core.ports.payment.i_async_payment_repository import IAsyncPaymentRepository
+from src.core.ports.payment_method.i_async_payment_method_repository import IAsyncPaymentMethodRepository
+from src.core.ports.payment_status.i_async_payment_status_repository import IAsyncPaymentStatusRepository
+
+
+class AsyncProcessPaymentUseCase:
+    
+    def __init__(self,
+        payment_gateway: IAsyncPaymentRepository,
+        payment_status_gateway: IAsyncPaymentStatusRepository,
+        payment_method_gateway: IAsyncPaymentMethodRepository,
+        payment_provider_gateway: IAsyncPaymentProviderGateway
+    ):
+        self.payment_gateway = payment_gateway
+        self.payment_status_gateway = payment_status_gateway
+        self.payment_method_gateway = payment_method_gateway
+        self.payment_provider_gateway = payment_provider_gateway
+        
+    @classmethod
+    def build(
+        cls,
+        payment_gateway: IAsyncPaymentRepository,
+        payment_status_gateway: IAsyncPaymentStatusRepository,
+        payment_method_gateway: IAsyncPaymentMethodRepository,
+        payment_provider_gateway: IAsyncPaymentProviderGateway
+    ) -> 'AsyncProcessPaymentUseCase':
+        return cls(
+            payment_gateway=payment_gateway,
+            payment_status_gateway=payment_status_gateway,
+            payment_method_gateway=payment_method_gateway,
+            payment_provider_gateway=payment_provider_gateway
+        )
+
+    async def execute(self, dto: CreatePaymentDTO) -> Payment:
+        payment_method = await self.payment_method_gateway.get_by_name(dto.payment_method)
+        if not payment_method:
+            raise EntityNotFoundException("Não foi possível encontrar o método de pagamento informado.")
+
+        payment_status = await self.payment_status_gateway.get_by_name(PaymentStatusEnum.PAYMENT_PENDING.status)
+        if not payment_status:
+            raise ValueError(f"Status de pagamento não encontrado: {PaymentStatusEnum.PAYMENT_PENDING.status}")
+
+        payment = ProcessPaymentUseCase.build_payment(dto, payment_method, payment_status)
+
+        payment_data = ProcessPaymentUseCase.build_payment_data(dto, payment)
+        await payment.initiate_payment_async(payment_data, self.payment_provider_gateway)
+        payment = await self.payment_gateway.create_payment(payment)
+
+        return payment
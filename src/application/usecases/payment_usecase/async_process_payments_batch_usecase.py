@@ -0,0 +1,100 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+from config.settings import PAYMENT_BATCH_MAX_CONCURRENCY
+from src.application.usecases.payment_usecase.process_payment_usecase import ProcessPaymentUseCase
+from src.application.usecases.payment_usecase.process_payments_batch_usecase import (
+    BatchItemResult, ProcessPaymentsBatchUseCase, PAYMENT_METHOD_NOT_FOUND, PAYMENT_NOT_PERSISTED
+)
+from src.core.domain.dtos.payment.create_payment_dto import CreatePaymentDTO
+from src.constants.payment_status import PaymentStatusEnum
+from src.core.domain.entities.payment import Payment
+from src.core.domain.entities.payment_method import PaymentMethod
+from src.core.ports.payment.i_async_payment_provider_gateway import IAsyncPaymentProviderGateway
+from src.core.ports.payment.i_async_payment_repository import IAsyncPaymentRepository
+from src.core.ports.payment_method.i_async_payment_method_repository import IAsyncPaymentMethodRepository
+from src.core.ports.payment_status.i_async_payment_status_repository import IAsyncPaymentStatusRepository
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncProcessPaymentsBatchUseCase:
+    
+    def __init__(self,
+        payment_gateway: IAsyncPaymentRepository,
+        payment_status_gateway: IAsyncPaymentStatusRepository,
+        payment_method_gateway: IAsyncPaymentMethodRepository,
+        payment_provider_gateway: IAsyncPaymentProviderGateway,
+        max_concurrency: int = PAYMENT_BATCH_MAX_CONCURRENCY
+    ):
+        self.payment_gateway = payment_gateway
+        self.payment_status_gateway = payment_status_gateway
+        self.payment_method_gateway = payment_method_gateway
+        self.payment_provider_gateway = payment_provider_gateway
+        self.max_concurrency = max_concurrency
+        
+    @classmethod
+    def build(
+        cls,
+        payment_gateway: IAsyncPaymentRepository,
+        payment_status_gateway: IAsyncPaymentStatusRepository,
+        payment_method_gateway: IAsyncPaymentMethodRepository,
+        payment_provider_gateway: IAsyncPaymentProviderGateway
+    ) -> 'AsyncProcessPaymentsBatchUseCase':
+        return cls(
+            payment_gateway=payment_gateway,
+            payment_status_gateway=payment_status_gateway,
+            payment_method_gateway=payment_method_gateway,
+            payment_provider_gateway=payment_provider_gateway
+        )
+
+    async def execute(self, dtos: List[CreatePaymentDTO]) -> List[BatchItemResult]:
+        """
+        Cria vários pagamentos: os pedidos ao provedor são feitos em paralelo (limitados por um
+        semáforo de `max_concurrency`) e os pagamentos iniciados são gravados com um único `insert_many`.
+        :param dtos: Dados dos pagamentos.
+        :return: Resultado de cada item, na ordem de entrada.
+        """
+        ProcessPaymentsBatchUseCase.validate_batch_size(dtos)
+
+        payment_status = await self.payment_status_gateway.get_by_name(PaymentStatusEnum.PAYMENT_PENDING.status)
+        if not payment_status:
+            raise ValueError(f"Status de pagamento não encontrado: {PaymentStatusEnum.PAYMENT_PENDING.status}")
+
+        payment_methods: Dict[str, Optional[PaymentMethod]] = {
+            name: await self.payment_method_gateway.get_by_name(name) for name in {dto.payment_method for dto in dtos}
+        }
+
+        results: List[BatchItemResult] = [(None, PAYMENT_METHOD_NOT_FOUND)] * len(dtos)
+        pending = [
+            (index, dto, ProcessPaymentUseCase.build_payment(dto, payment_methods[dto.payment_method], payment_status))
+            for index, dto in enumerate(dtos)
+            if payment_methods[dto.payment_method]
+        ]
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def initiate_payment(dto: CreatePaymentDTO, payment: Payment):
+            async with semaphore:
+                payment_data = ProcessPaymentUseCase.build_payment_data(dto, payment)
+                return await payment.initiate_payment_async(payment_data, self.payment_provider_gateway)
+
+        outcomes = await asyncio.gather(
+            *(initiate_payment(dto, payment) for _, dto, payment in pending), return_exceptions=True
+        )
+
+        initiated = []
+        for (index, _, payment), outcome in zip(pending, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Falha ao iniciar o pagamento {payment.external_reference}: {outcome}")
+                results[index] = (None, str(outcome))
+            else:
+                initiated.append((index, payment))
+
+        if initiated:
+            created_payments = await self.payment_gateway.create_payments([payment for _, payment in initiated])
+            for (index, _), created_payment in zip(initiated, created_payments):
+                results[index] = (created_payment, None) if created_payment else (None, PAYMENT_NOT_PERSISTED)
+
+        return results
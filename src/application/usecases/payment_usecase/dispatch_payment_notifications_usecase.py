@@ -0,0 +1,99 @@
+import logging
+from typing import Any, Dict, List
+
+from config.settings import (
+    NOTIFICATION_OUTBOX_BATCH_SIZE,
+    NOTIFICATION_OUTBOX_LEASE_SECONDS,
+    NOTIFICATION_OUTBOX_MAX_BATCHES,
+)
+from src.application.usecases.payment_usecase.payment_provider_webhook_handler_use_case import PaymentProviderWebhookHandlerUseCase
+from src.core.domain.entities.payment import Payment
+from src.core.ports.notification.i_notification_service import INotificationService
+from src.core.ports.payment.i_payment_repository import IPaymentRepository
+
+logger = logging.getLogger(__name__)
+
+
+class DispatchPaymentNotificationsUseCase:
+    """
+    Despacha as notificações registradas no outbox de pagamentos.
+
+    Cada lote é reservado antes do envio, de modo que despachantes simultâneos não enviam a mesma
+    notificação; reservas de um despachante interrompido expiram após `lease_seconds`. O lote é
+    entregue ao serviço de notificação de uma vez, para que ele o envie concorrentemente. O envio é
+    "ao menos uma vez": o `notification_id` permite ao destinatário descartar repetições.
+    """
+
+    def __init__(
+        self,
+        payment_gateway: IPaymentRepository,
+        notification_service: INotificationService,
+        batch_size: int = NOTIFICATION_OUTBOX_BATCH_SIZE,
+        lease_seconds: int = NOTIFICATION_OUTBOX_LEASE_SECONDS,
+        max_batches: int = NOTIFICATION_OUTBOX_MAX_BATCHES,
+    ):
+        self.payment_gateway = payment_gateway
+        self.notification_service = notification_service
+        self.batch_size = batch_size
+        self.lease_seconds = lease_seconds
+        self.max_batches = max_batches
+
+    @classmethod
+    def build(
+        cls,
+        payment_gateway: IPaymentRepository,
+        notification_service: INotificationService
+    ) -> 'DispatchPaymentNotificationsUseCase':
+        return cls(
+            payment_gateway=payment_gateway,
+            notification_service=notification_service
+        )
+
+    def execute(self) -> Dict[str, int]:
+        """
+        Esvazia o outbox em lotes, até `max_batches` lotes por execução.
+        :return: Quantidade de notificações despachadas, descartadas e com falha.
+        """
+        metrics = {"dispatched": 0, "skipped": 0, "failed": 0}
+
+        for _ in range(self.max_batches):
+            payments = self.payment_gateway.claim_pending_notifications(self.batch_size, self.lease_seconds)
+            if not payments:
+                break
+
+            completed: List[Any] = []
+            released: List[Any] = []
+            deliverable: List[Payment] = []
+            for payment in payments:
+                if payment.notification_url and not payment.client_notified:
+                    deliverable.append(payment)
+                else:
+                    # Sem URL ou já notificado: não há o que enviar, apenas sai do outbox
+                    metrics["skipped"] += 1
+                    completed.append(payment.id)
+
+            for payment, sent in zip(deliverable, self._send(deliverable)):
+                metrics["dispatched" if sent else "failed"] += 1
+                (completed if sent else released).append(payment.id)
+
+            self.payment_gateway.complete_notifications(completed)
+            self.payment_gateway.release_notifications(released)
+
+            if len(payments) < self.batch_size:
+                break
+
+        if any(metrics.values()):
+            logger.info(f"Outbox de notificações despachado: {metrics}")
+        return metrics
+
+    def _send(self, payments: List[Payment]) -> List[bool]:
+        if not payments:
+            return []
+        try:
+            return self.notification_service.send_payment_notifications([
+                (payment.notification_url, PaymentProviderWebhookHandlerUseCase.build_notification_data(payment))
+                for payment in payments
+            ])
+        except Exception as e:
+            logger.error(f"Falha ao enviar lote de {len(payments)} notificações. Erro: {e}")
+            return [False] * len(payments)
@@ -0,0 +1,26 @@
+import logging
+from src.core.ports.payment.i_payment_webhook_queue import IPaymentWebhookQueue
+
+logger = logging.getLogger(__name__)
+
+
+class EnqueuePaymentWebhookUseCase:
+    """Use case for accepting a provider webhook and deferring its processing to a queue."""
+
+    def __init__(self, payment_webhook_queue: IPaymentWebhookQueue):
+        self.payment_webhook_queue = payment_webhook_queue
+
+    @classmethod
+    def build(cls, payment_webhook_queue: IPaymentWebhookQueue) -> 'EnqueuePaymentWebhookUseCase':
+        """Factory method to create an instance of EnqueuePaymentWebhookUseCase."""
+        return cls(payment_webhook_queue=payment_webhook_queue)
+
+    def execute(self, payload: dict) -> bool:
+        """
+        Enqueue the raw webhook payload.
+        :return: True if the payload was enqueued, False if it must be processed inline.
+        """
+        enqueued = self.payment_webhook_queue.enqueue(payload)
+        if not enqueued:
+            logger.warning("Não foi possível enfileirar o webhook; processando na requisição.")
+        return enqueued
@@ -0,0 +1,63 @@
+from typing import Iterator
+
+from src.core.domain.dtos.payment.payment_export_dto import PaymentExportFilterDTO
+from src.core.domain.entities.payment import Payment
+from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
+from src.core.ports.payment.i_payment_repository import IPaymentRepository
+from src.core.ports.payment_method.i_payment_method_repository import IPaymentMethodRepository
+from src.core.ports.payment_status.i_payment_status_repository import IPaymentStatusRepository
+
+
+class ExportPaymentsUseCase:
+    """
+    Exporta os pagamentos que atendem aos filtros informados para conciliação.
+    """
+
+    def __init__(
+        self,
+        payment_gateway: IPaymentRepository,
+        payment_status_gateway: IPaymentStatusRepository,
+        payment_method_gateway: IPaymentMethodRepository,
+    ):
+        self.payment_gateway = payment_gateway
+        self.payment_status_gateway = payment_status_gateway
+        self.payment_method_gateway = payment_method_gateway
+
+    @classmethod
+    def build(
+        cls,
+        payment_gateway: IPaymentRepository,
+        payment_status_gateway: IPaymentStatusRepository,
+        payment_method_gateway: IPaymentMethodRepository,
+    ) -> 'ExportPaymentsUseCase':
+        return cls(
+            payment_gateway=payment_gateway,
+            payment_status_gateway=payment_status_gateway,
+            payment_method_gateway=payment_method_gateway,
+        )
+
+    def execute(self, filters: PaymentExportFilterDTO) -> Iterator[Payment]:
+        """
+        Valida os filtros e retorna o iterador de pagamentos. A consulta só é executada
+        à medida que o iterador é consumido.
+        """
+        payment_status_id = None
+        if filters.payment_status:
+            payment_status = self.payment_status_gateway.get_by_name(filters.payment_status)
+            if not payment_status:
+                raise EntityNotFoundException("Não foi possível encontrar o status de pagamento informado.")
+            payment_status_id = payment_status.id
+
+        payment_method_id = None
+        if filters.payment_method:
+            payment_method = self.payment_method_gateway.get_by_name(filters.payment_method)
+            if not payment_method:
+                raise EntityNotFoundException("Não foi possível encontrar o método de pagamento informado.")
+            payment_method_id = payment_method.id
+
+        return self.payment_gateway.iter_payments(
+            payment_status_id=payment_status_id,
+            payment_method_id=payment_method_id,
+            created_from=filters.created_from,
+            created_to=filters.created_to,
+        )
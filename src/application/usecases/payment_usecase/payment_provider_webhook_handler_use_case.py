@@ -1,28 +1,33 @@
 import traceback
 import datetime
-from src.core.ports.notification.i_notification_service import INotificationService
+from typing import Any, Dict, Optional
+from src.core.domain.entities.payment import Payment
+from src.core.domain.entities.payment_status import PaymentStatus
 from src.constants.payment_status import PaymentStatusEnum
 from src.core.exceptions.bad_request_exception import BadRequestException
 from src.core.ports.payment.i_payment_provider_gateway import IPaymentProviderGateway
 from src.core.ports.payment.i_payment_repository import IPaymentRepository
 from src.core.ports.payment_status.i_payment_status_repository import IPaymentStatusRepository
+from src.core.ports.payment.i_webhook_idempotency_store import IWebhookIdempotencyStore
 import logging
 
 logger = logging.getLogger(__name__)
 
 class PaymentProviderWebhookHandlerUseCase:
+
+    DUPLICATE_RESULT = {"message": "webhook já processado", "action": "return"}
     
     def __init__(
         self,
         payment_provider_gateway: IPaymentProviderGateway,
         payment_gateway: IPaymentRepository,
         payment_status_gateway: IPaymentStatusRepository,
-        notification_service: INotificationService,
+        webhook_idempotency_store: IWebhookIdempotencyStore = None,
     ):
         self.payment_provider_gateway = payment_provider_gateway
         self.payment_gateway = payment_gateway
         self.payment_status_gateway = payment_status_gateway
-        self.notification_service = notification_service
+        self.webhook_idempotency_store = webhook_idempotency_store
     
     @classmethod    
     def build(
@@ -30,13 +35,13 @@ class PaymentProviderWebhookHandlerUseCase:
         payment_provider_gateway: IPaymentProviderGateway,
         payment_gateway: IPaymentRepository,
         payment_status_gateway: IPaymentStatusRepository,
-        notification_service: INotificationService = None
+        webhook_idempotency_store: IWebhookIdempotencyStore = None
     ) -> 'PaymentProviderWebhookHandlerUseCase':
         return cls(
             payment_provider_gateway=payment_provider_gateway,
             payment_gateway=payment_gateway,
             payment_status_gateway=payment_status_gateway,
-            notification_service=notification_service
+            webhook_idempotency_store=webhook_idempotency_store
         )
         
     def execute(self, payload: dict) -> None:
@@ -45,10 +50,25 @@ class PaymentProviderWebhookHandlerUseCase:
         :param payload: Data sent by the payment service webhook.
         """
         try:
+            # Reentregas já processadas são descartadas antes de consultar o provedor
+            delivery_key = self.payment_provider_gateway.webhook_idempotency_key(payload)
+            if self._is_processed(delivery_key):
+                logger.info(f"Webhook {delivery_key} já processado; ignorando reentrega.")
+                return dict(self.DUPLICATE_RESULT)
+
             payment_details = self.payment_provider_gateway.verify_payment(payload)
             if payment_details.get("action") == "return":
                 return payment_details
 
+            # Mesma versão do recurso já aplicada por outra notificação
+            resource_key = self.payment_provider_gateway.webhook_idempotency_key(
+                payload, payment_details.get("last_modified")
+            )
+            if resource_key != delivery_key and self._is_processed(resource_key):
+                logger.info(f"Webhook {resource_key} já processado; ignorando reentrega.")
+                self._mark_processed(delivery_key)
+                return dict(self.DUPLICATE_RESULT)
+
             external_reference = payment_details.get("external_reference")
             status_name = payment_details.get("payment_status")
 
@@ -66,34 +86,51 @@ class PaymentProviderWebhookHandlerUseCase:
             if not new_status:
                 raise BadRequestException(f"Status de pagamento não encontrado: {status_name}")
 
-            payment = self.payment_gateway.update_payment_status(payment, new_status.id)
+            # Transição condicionada ao status lido: uma atualização concorrente faz o webhook ser reprocessado.
+            # A notificação ao cliente entra no outbox na mesma escrita e é despachada fora da requisição.
+            current_status_id = payment.payment_status.id if payment.payment_status else None
+            if current_status_id != new_status.id:
+                payment = self.payment_gateway.update_payment_status(
+                    payment,
+                    new_status.id,
+                    expected_status_id=current_status_id,
+                    enqueue_notification=self.should_notify_client(payment, new_status),
+                )
+                if payment is None:
+                    raise BadRequestException(f"Status do pagamento {external_reference} alterado concorrentemente.")
 
-            if (
-                new_status.name == PaymentStatusEnum.PAYMENT_COMPLETED.status and 
-                payment.notification_url and
-                payment.client_notified is False and
-                self.notification_service
-            ):
-                payment_data = {
-                    'payment_id': str(payment.id),
-                    'external_reference': payment.external_reference,
-                    'amount': payment.amount,
-                    'status': payment.payment_status.name,
-                    'transaction_id': payment.transaction_id,
-                    'timestamp': datetime.datetime.now(datetime.UTC).isoformat()
-                }
-                
-                try:
-                    self.notification_service.send_payment_notification(
-                        payment.notification_url,
-                        payment_data
-                    )
-                    logger.info(f"Notificação para pagamento {payment.id} enviada com sucesso.")
-                    payment.mark_client_notified()
-                    self.payment_gateway.update_payment(payment)
-                except Exception as e:
-                    logger.error(f"Falha ao enviar notificação para pagamento {payment.id} após todas as tentativas. Erro: {e}")
+            self._mark_processed(delivery_key, resource_key)
                     
         except Exception as e:
             traceback.print_exc()
             raise BadRequestException(f"Erro ao processar webhook: {str(e)}")
+
+    def _is_processed(self, key: Optional[str]) -> bool:
+        return bool(key and self.webhook_idempotency_store and self.webhook_idempotency_store.is_processed(key))
+
+    def _mark_processed(self, *keys: Optional[str]) -> None:
+        if not self.webhook_idempotency_store:
+            return
+        for key in dict.fromkeys(k for k in keys if k):
+            self.webhook_idempotency_store.mark_processed(key)
+
+    @staticmethod
+    def should_notify_client(payment: Payment, new_status: PaymentStatus) -> bool:
+        return bool(
+            new_status.name == PaymentStatusEnum.PAYMENT_COMPLETED.status and
+            payment.notification_url and
+            payment.client_notified is False
+        )
+
+    @staticmethod
+    def build_notification_data(payment: Payment) -> Dict[str, Any]:
+        return {
+            # Estável entre reenvios do outbox: o destinatário deduplica por ela
+            'notification_id': f"{payment.id}:{payment.payment_status.name}",
+            'payment_id': str(payment.id),
+            'external_reference': payment.external_reference,
+            'amount': payment.amount,
+            'status': payment.payment_status.name,
+            'transaction_id': payment.transaction_id,
+            'timestamp': datetime.datetime.now(datetime.UTC).isoformat()
+        }
@@ -4,6 +4,8 @@ from config.settings import WEBHOOK_URL
 from src.core.domain.dtos.payment.create_payment_dto import CreatePaymentDTO
 from src.constants.payment_status import PaymentStatusEnum
 from src.core.domain.entities.payment import Payment
+from src.core.domain.entities.payment_method import PaymentMethod
+from src.core.domain.entities.payment_status import PaymentStatus
 from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
 from src.core.ports.payment.i_payment_provider_gateway import IPaymentProviderGateway
 from src.core.ports.payment.i_payment_repository import IPaymentRepository
@@ -49,7 +51,17 @@ class ProcessPaymentUseCase:
         if not payment_status:
             raise ValueError(f"Status de pagamento não encontrado: {PaymentStatusEnum.PAYMENT_PENDING.status}")
 
-        payment = Payment(
+        payment = self.build_payment(dto, payment_method, payment_status)
+
+        payment_data = self.build_payment_data(dto, payment)
+        payment.initiate_payment(payment_data, self.payment_provider_gateway)
+        payment = self.payment_gateway.create_payment(payment)
+
+        return payment
+
+    @staticmethod
+    def build_payment(dto: CreatePaymentDTO, payment_method: PaymentMethod, payment_status: PaymentStatus) -> Payment:
+        return Payment(
             payment_method=payment_method,
             payment_status=payment_status,
             amount=dto.total_amount,
@@ -57,7 +69,9 @@ class ProcessPaymentUseCase:
             notification_url=dto.notification_url,
         )
 
-        payment_data = {
+    @staticmethod
+    def build_payment_data(dto: CreatePaymentDTO, payment: Payment) -> Dict[str, Any]:
+        return {
             "title": dto.title,
             "description": dto.description,
             "total_amount": dto.total_amount,
@@ -76,8 +90,3 @@ class ProcessPaymentUseCase:
                 for item in dto.items
             ],
         }
-        payment.initiate_payment(payment_data, self.payment_provider_gateway)
-        payment = self.payment_gateway.create_payment(payment)
-
-        return payment
-
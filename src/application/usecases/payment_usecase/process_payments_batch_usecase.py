@@ -0,0 +1,109 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from config.settings import PAYMENT_BATCH_MAX_SIZE, PAYMENT_BATCH_MAX_CONCURRENCY
+from src.application.usecases.payment_usecase.process_payment_usecase import ProcessPaymentUseCase
+from src.core.domain.dtos.payment.create_payment_dto import CreatePaymentDTO
+from src.constants.payment_status import PaymentStatusEnum
+from src.core.domain.entities.payment import Payment
+from src.core.domain.entities.payment_method import PaymentMethod
+from src.core.exceptions.bad_request_exception import BadRequestException
+from src.core.ports.payment.i_payment_provider_gateway import IPaymentProviderGateway
+from src.core.ports.payment.i_payment_repository import IPaymentRepository
+from src.core.ports.payment_method.i_payment_method_repository import IPaymentMethodRepository
+from src.core.ports.payment_status.i_payment_status_repository import IPaymentStatusRepository
+
+logger = logging.getLogger(__name__)
+
+# (pagamento criado, mensagem de erro) para cada item do lote, na ordem de entrada
+BatchItemResult = Tuple[Optional[Payment], Optional[str]]
+
+PAYMENT_METHOD_NOT_FOUND = "Não foi possível encontrar o método de pagamento informado."
+PAYMENT_NOT_PERSISTED = "Falha ao persistir o pagamento."
+
+
+class ProcessPaymentsBatchUseCase:
+    
+    def __init__(self,
+        payment_gateway: IPaymentRepository,
+        payment_status_gateway: IPaymentStatusRepository,
+        payment_method_gateway: IPaymentMethodRepository,
+        payment_provider_gateway: IPaymentProviderGateway,
+        max_concurrency: int = PAYMENT_BATCH_MAX_CONCURRENCY
+    ):
+        self.payment_gateway = payment_gateway
+        self.payment_status_gateway = payment_status_gateway
+        self.payment_method_gateway = payment_method_gateway
+        self.payment_provider_gateway = payment_provider_gateway
+        self.max_concurrency = max_concurrency
+        
+    @classmethod
+    def build(
+        cls,
+        payment_gateway: IPaymentRepository,
+        payment_status_gateway: IPaymentStatusRepository,
+        payment_method_gateway: IPaymentMethodRepository,
+        payment_provider_gateway: IPaymentProviderGateway
+    ) -> 'ProcessPaymentsBatchUseCase':
+        return cls(
+            payment_gateway=payment_gateway,
+            payment_status_gateway=payment_status_gateway,
+            payment_method_gateway=payment_method_gateway,
+            payment_provider_gateway=payment_provider_gateway
+        )
+
+    def execute(self, dtos: List[CreatePaymentDTO]) -> List[BatchItemResult]:
+        """
+        Cria vários pagamentos: os pedidos ao provedor são feitos em paralelo (limitados por
+        `max_concurrency`) e os pagamentos iniciados são gravados com um único `insert_many`.
+        :param dtos: Dados dos pagamentos.
+        :return: Resultado de cada item, na ordem de entrada.
+        """
+        self.validate_batch_size(dtos)
+
+        payment_status = self.payment_status_gateway.get_by_name(PaymentStatusEnum.PAYMENT_PENDING.status)
+        if not payment_status:
+            raise ValueError(f"Status de pagamento não encontrado: {PaymentStatusEnum.PAYMENT_PENDING.status}")
+
+        payment_methods: Dict[str, Optional[PaymentMethod]] = {
+            name: self.payment_method_gateway.get_by_name(name) for name in {dto.payment_method for dto in dtos}
+        }
+
+        results: List[BatchItemResult] = [(None, PAYMENT_METHOD_NOT_FOUND)] * len(dtos)
+        pending = [
+            (index, dto, ProcessPaymentUseCase.build_payment(dto, payment_methods[dto.payment_method], payment_status))
+            for index, dto in enumerate(dtos)
+            if payment_methods[dto.payment_method]
+        ]
+
+        initiated = []
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(pending))) as executor:
+                futures = [
+                    (index, payment, executor.submit(self._initiate_payment, dto, payment))
+                    for index, dto, payment in pending
+                ]
+                for index, payment, future in futures:
+                    try:
+                        future.result()
+                        initiated.append((index, payment))
+                    except Exception as e:
+                        logger.error(f"Falha ao iniciar o pagamento {payment.external_reference}: {e}")
+                        results[index] = (None, str(e))
+
+        if initiated:
+            created_payments = self.payment_gateway.create_payments([payment for _, payment in initiated])
+            for (index, _), created_payment in zip(initiated, created_payments):
+                results[index] = (created_payment, None) if created_payment else (None, PAYMENT_NOT_PERSISTED)
+
+        return results
+
+    def _initiate_payment(self, dto: CreatePaymentDTO, payment: Payment):
+        payment_data = ProcessPaymentUseCase.build_payment_data(dto, payment)
+        return payment.initiate_payment(payment_data, self.payment_provider_gateway)
+
+    @staticmethod
+    def validate_batch_size(dtos: List[CreatePaymentDTO]) -> None:
+        if len(dtos) > PAYMENT_BATCH_MAX_SIZE:
+            raise BadRequestException(f"O lote excede o limite de {PAYMENT_BATCH_MAX_SIZE} pagamentos.")
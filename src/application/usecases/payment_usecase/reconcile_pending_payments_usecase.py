@@ -0,0 +1,155 @@
+import datetime
+import itertools
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from config.settings import (
+    RECONCILIATION_BATCH_SIZE,
+    RECONCILIATION_MAX_CONCURRENCY,
+    RECONCILIATION_MAX_PAYMENTS_PER_RUN,
+    RECONCILIATION_PENDING_OLDER_THAN_MINUTES,
+    RECONCILIATION_RATE_LIMIT_PER_SECOND,
+)
+from src.application.usecases.payment_usecase.payment_provider_webhook_handler_use_case import PaymentProviderWebhookHandlerUseCase
+from src.constants.payment_status import PaymentStatusEnum
+from src.core.domain.entities.payment import Payment
+from src.core.domain.entities.payment_status import PaymentStatus
+from src.core.ports.payment.i_payment_provider_gateway import IPaymentProviderGateway
+from src.core.ports.payment.i_payment_repository import IPaymentRepository
+from src.core.ports.payment_status.i_payment_status_repository import IPaymentStatusRepository
+from src.core.shared.rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+class ReconcilePendingPaymentsUseCase:
+    """
+    Concilia com o provedor os pagamentos pendentes há mais de `older_than_minutes`, corrigindo os que
+    mudaram de status sem que o webhook tenha chegado.
+
+    Os pagamentos são lidos em lotes; as consultas ao provedor de cada lote são feitas em paralelo,
+    limitadas por `max_concurrency` e por `rate_limit_per_second`.
+    """
+
+    def __init__(
+        self,
+        payment_provider_gateway: IPaymentProviderGateway,
+        payment_gateway: IPaymentRepository,
+        payment_status_gateway: IPaymentStatusRepository,
+        older_than_minutes: int = RECONCILIATION_PENDING_OLDER_THAN_MINUTES,
+        batch_size: int = RECONCILIATION_BATCH_SIZE,
+        max_payments: int = RECONCILIATION_MAX_PAYMENTS_PER_RUN,
+        max_concurrency: int = RECONCILIATION_MAX_CONCURRENCY,
+        rate_limit_per_second: float = RECONCILIATION_RATE_LIMIT_PER_SECOND,
+    ):
+        self.payment_provider_gateway = payment_provider_gateway
+        self.payment_gateway = payment_gateway
+        self.payment_status_gateway = payment_status_gateway
+        self.older_than_minutes = older_than_minutes
+        self.batch_size = batch_size
+        self.max_payments = max_payments
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = RateLimiter(rate_limit_per_second, burst=max_concurrency)
+
+    @classmethod
+    def build(
+        cls,
+        payment_provider_gateway: IPaymentProviderGateway,
+        payment_gateway: IPaymentRepository,
+        payment_status_gateway: IPaymentStatusRepository
+    ) -> 'ReconcilePendingPaymentsUseCase':
+        return cls(
+            payment_provider_gateway=payment_provider_gateway,
+            payment_gateway=payment_gateway,
+            payment_status_gateway=payment_status_gateway
+        )
+
+    def execute(self) -> Dict[str, Any]:
+        """
+        Executa uma rodada de conciliação.
+        :return: Métricas da rodada (pagamentos verificados, divergências encontradas e corrigidas, vazão).
+        """
+        started_at = time.monotonic()
+        metrics = {"checked": 0, "drift": 0, "corrected": 0, "not_found": 0, "failed": 0, "notifications_enqueued": 0}
+
+        pending_status = self.payment_status_gateway.get_by_name(PaymentStatusEnum.PAYMENT_PENDING.status)
+        if not pending_status:
+            raise ValueError(f"Status de pagamento não encontrado: {PaymentStatusEnum.PAYMENT_PENDING.status}")
+
+        created_before = datetime.datetime.now(datetime.UTC) - datetime.timedelta(minutes=self.older_than_minutes)
+        payments = itertools.islice(
+            self.payment_gateway.iter_payments(payment_status_id=pending_status.id, created_to=created_before),
+            self.max_payments,
+        )
+        statuses: Dict[str, Optional[PaymentStatus]] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            while batch := list(itertools.islice(payments, self.batch_size)):
+                details = list(executor.map(self._lookup, batch))
+                for payment, payment_details in zip(batch, details):
+                    metrics["checked"] += 1
+                    self._reconcile(payment, payment_details, pending_status, statuses, metrics)
+
+        elapsed = time.monotonic() - started_at
+        metrics["duration_seconds"] = round(elapsed, 3)
+        metrics["throughput_per_second"] = round(metrics["checked"] / elapsed, 2) if elapsed > 0 else 0.0
+        logger.info(f"Conciliação de pagamentos pendentes concluída: {metrics}")
+        return metrics
+
+    def _lookup(self, payment: Payment) -> Any:
+        self.rate_limiter.acquire()
+        try:
+            return self.payment_provider_gateway.find_payment_by_reference(payment.external_reference)
+        except Exception as e:
+            logger.error(f"Falha ao consultar o pagamento {payment.external_reference} no provedor: {e}")
+            return e
+
+    def _reconcile(
+        self,
+        payment: Payment,
+        payment_details: Any,
+        pending_status: PaymentStatus,
+        statuses: Dict[str, Optional[PaymentStatus]],
+        metrics: Dict[str, Any],
+    ) -> None:
+        if isinstance(payment_details, Exception):
+            metrics["failed"] += 1
+            return
+        if payment_details is None:
+            metrics["not_found"] += 1
+            return
+
+        try:
+            status_name = self.payment_provider_gateway.status_map(payment_details.get("payment_status")).status
+        except Exception as e:
+            logger.error(f"Status ignorado na conciliação do pagamento {payment.external_reference}: {e}")
+            metrics["failed"] += 1
+            return
+
+        if status_name == pending_status.name:
+            return
+
+        metrics["drift"] += 1
+        if status_name not in statuses:
+            statuses[status_name] = self.payment_status_gateway.get_by_name(status_name)
+        new_status = statuses[status_name]
+        if new_status is None:
+            logger.error(f"Status de pagamento não encontrado: {status_name}")
+            metrics["failed"] += 1
+            return
+
+        # Condicionada ao status pendente: um webhook aplicado durante a rodada prevalece.
+        # A notificação ao cliente entra no outbox na mesma escrita.
+        enqueue_notification = PaymentProviderWebhookHandlerUseCase.should_notify_client(payment, new_status)
+        updated_payment = self.payment_gateway.update_payment_status(
+            payment, new_status.id, expected_status_id=pending_status.id, enqueue_notification=enqueue_notification
+        )
+        if updated_payment is None:
+            return
+        metrics["corrected"] += 1
+        logger.info(f"Pagamento {payment.external_reference} conciliado: {pending_status.name} -> {status_name}")
+
+        if enqueue_notification:
+            metrics["notifications_enqueued"] += 1
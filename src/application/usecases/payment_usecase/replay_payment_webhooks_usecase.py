@@ -0,0 +1,117 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+
+from config.settings import WEBHOOK_REPLAY_MAX_CONCURRENCY
+from src.constants.payment_status import PaymentStatusEnum
+from src.core.domain.entities.payment_status import PaymentStatus
+from src.core.ports.payment.i_payment_provider_gateway import IPaymentProviderGateway
+from src.core.ports.payment.i_payment_repository import IPaymentRepository
+from src.core.ports.payment_status.i_payment_status_repository import IPaymentStatusRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ReplayPaymentWebhooksUseCase:
+    """
+    Reprocessa em lote notificações do provedor (ex.: após uma indisponibilidade).
+
+    As notificações são deduplicadas por recurso, cada recurso é consultado uma única vez no
+    provedor, os resultados são agrupados por `external_reference` e apenas o status mais recente
+    de cada pagamento é aplicado, com uma escrita por status de destino. Os pagamentos concluídos
+    entram no outbox de notificações na mesma escrita.
+    """
+
+    def __init__(
+        self,
+        payment_provider_gateway: IPaymentProviderGateway,
+        payment_gateway: IPaymentRepository,
+        payment_status_gateway: IPaymentStatusRepository,
+        max_concurrency: int = WEBHOOK_REPLAY_MAX_CONCURRENCY,
+    ):
+        self.payment_provider_gateway = payment_provider_gateway
+        self.payment_gateway = payment_gateway
+        self.payment_status_gateway = payment_status_gateway
+        self.max_concurrency = max_concurrency
+
+    @classmethod
+    def build(
+        cls,
+        payment_provider_gateway: IPaymentProviderGateway,
+        payment_gateway: IPaymentRepository,
+        payment_status_gateway: IPaymentStatusRepository
+    ) -> 'ReplayPaymentWebhooksUseCase':
+        return cls(
+            payment_provider_gateway=payment_provider_gateway,
+            payment_gateway=payment_gateway,
+            payment_status_gateway=payment_status_gateway
+        )
+
+    def execute(self, payloads: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Reprocessa as notificações informadas.
+        :param payloads: Payloads de webhook, na ordem em que foram recebidos.
+        :return: Resumo do reprocessamento.
+        """
+        received = 0
+        payloads_by_resource: Dict[str, Dict[str, Any]] = {}
+        for payload in payloads:
+            received += 1
+            resource_key = self.payment_provider_gateway.webhook_resource_key(payload) or f"payload:{received}"
+            payloads_by_resource[resource_key] = payload
+
+        details = self._verify_all(list(payloads_by_resource.values()))
+        failed = sum(1 for item in details if item is None)
+
+        latest_by_reference: Dict[str, Dict[str, Any]] = {}
+        for item in details:
+            if item is None or item.get("action") == "return" or not item.get("external_reference"):
+                continue
+            current = latest_by_reference.get(item["external_reference"])
+            if current is None or (item.get("last_modified") or "") >= (current.get("last_modified") or ""):
+                latest_by_reference[item["external_reference"]] = item
+
+        statuses: Dict[str, Optional[PaymentStatus]] = {}
+        status_by_reference: Dict[str, Any] = {}
+        for external_reference, item in latest_by_reference.items():
+            try:
+                status_name = self.payment_provider_gateway.status_map(item.get("payment_status")).status
+            except Exception as e:
+                logger.error(f"Status ignorado para o pagamento {external_reference}: {e}")
+                failed += 1
+                continue
+
+            if status_name not in statuses:
+                statuses[status_name] = self.payment_status_gateway.get_by_name(status_name)
+            if statuses[status_name] is None:
+                logger.error(f"Status de pagamento não encontrado: {status_name}")
+                failed += 1
+                continue
+            status_by_reference[external_reference] = statuses[status_name].id
+
+        completed_status = statuses.get(PaymentStatusEnum.PAYMENT_COMPLETED.status)
+        updated = self.payment_gateway.bulk_update_status_by_reference(
+            status_by_reference, notify_status_id=completed_status.id if completed_status else None
+        )
+
+        return {
+            "received": received,
+            "resources": len(payloads_by_resource),
+            "payments": len(status_by_reference),
+            "updated": updated,
+            "failed": failed,
+        }
+
+    def _verify_all(self, payloads: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        if not payloads:
+            return []
+
+        def verify(payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            try:
+                return self.payment_provider_gateway.verify_payment(payload)
+            except Exception as e:
+                logger.error(f"Falha ao consultar o recurso do webhook {payload}: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(payloads))) as executor:
+            return list(executor.map(verify, payloads))
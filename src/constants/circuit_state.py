@@ -0,0 +1,6 @@
+from enum import Enum
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"        # chamadas liberadas
+    OPEN = "open"            # chamadas bloqueadas até o fim do intervalo de abertura
+    HALF_OPEN = "half_open"  # uma única chamada de teste liberada
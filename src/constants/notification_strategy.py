@@ -0,0 +1,7 @@
+from enum import Enum
+
+class NotificationStrategy(str, Enum):
+    SEQUENTIAL = "sequential"        # serviços na ordem configurada, o próximo só após a falha do anterior
+    RACE = "race"                    # todos os serviços em paralelo, vale o primeiro sucesso
+    ENQUEUE_FIRST = "enqueue_first"  # enfileira primeiro; envio direto apenas se a fila falhar
+    WEIGHTED = "weighted"            # primeiro serviço sorteado pelos pesos, os demais como fallback
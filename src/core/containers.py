@@ -1,17 +1,36 @@
 from dependency_injector import containers, providers
 
 from src.adapters.driven.notification_providers.http_notification_service import HttpNotificationService
-from src.adapters.driven.notification_providers.celery_notification_service import CeleryNotificationService
+from src.adapters.driven.notification_providers.celery_notification_service import (
+    CeleryNotificationService, CeleryNotificationRetryScheduler
+)
 from src.adapters.driven.notification_providers.hybrid_notification_service import HybridNotificationService
-from config.database import get_db
+from src.adapters.driven.notification_providers.fanout_http_notification_service import FanoutHttpNotificationService
+from src.adapters.driven.webhook_queue.celery_webhook_queue import CeleryPaymentWebhookQueue
+from config.celery_config import REDIS_URL
+from config.database import get_db, get_async_db
+from config.settings import REFERENCE_DATA_CACHE_TTL_SECONDS, MERCADO_PAGO_VERIFY_CACHE_TTL_SECONDS
 from src.core.shared.identity_map import IdentityMap
+from src.core.shared.latency_histogram import LatencyHistogram
+from src.core.shared.reference_data_cache import ReferenceDataCache
+from src.core.shared.single_flight import SingleFlight, AsyncSingleFlight
+from src.adapters.driven.cache.redis_cache_invalidation_bus import RedisCacheInvalidationBus
+from src.adapters.driven.circuit_breaker.redis_circuit_breaker import RedisCircuitBreaker
 from src.adapters.driven.repositories.payment_status_repository import PaymentStatusRepository
 from src.adapters.driver.api.v1.controllers.payment_status_controller import PaymentStatusController
 from src.adapters.driven.repositories.payment_method_repository import PaymentMethodRepository
 from src.adapters.driver.api.v1.controllers.payment_method_controller import PaymentMethodController
 from src.adapters.driven.repositories.payment_repository import PaymentRepository
+from src.adapters.driven.repositories.webhook_idempotency_repository import WebhookIdempotencyRepository
 from src.adapters.driver.api.v1.controllers.payment_controller import PaymentController
+from src.adapters.driven.repositories.async_payment_status_repository import AsyncPaymentStatusRepository
+from src.adapters.driven.repositories.async_payment_method_repository import AsyncPaymentMethodRepository
+from src.adapters.driven.repositories.async_payment_repository import AsyncPaymentRepository
+from src.adapters.driver.api.v1.controllers.async_payment_controller import AsyncPaymentController
 from src.adapters.driven.payment_providers.mercado_pago_gateway import MercadoPagoGateway
+from src.adapters.driven.payment_providers.async_mercado_pago_gateway import (
+    AsyncMercadoPagoGateway, build_mercado_pago_http_client
+)
 
 
 class Container(containers.DeclarativeContainer):
@@ -26,10 +45,31 @@ class Container(containers.DeclarativeContainer):
         "src.adapters.driver.api.v1.routes.webhook_routes"
     ])
     
+    config = providers.Configuration()
+    # "sync" (MongoEngine) or "async" (PyMongo AsyncMongoClient) payment repositories
+    config.repository_mode.from_env("PAYMENT_REPOSITORY_MODE", default="sync")
+    # "sync" (processed in the request) or "queue" (accepted and processed by a Celery worker)
+    config.webhook_processing_mode.from_env("WEBHOOK_PROCESSING_MODE", default="sync")
+    # "redis" (per-host circuit breakers shared by all workers) or "disabled"
+    config.notification_circuit_breaker.from_env("NOTIFICATION_CIRCUIT_BREAKER", default="redis")
+
+    # Fallback identity map for code running outside a request or task scope (IdentityMap.scope)
     identity_map = providers.Singleton(IdentityMap)
 
+    # Process-wide cache for reference data (payment status and payment methods)
+    reference_data_caches = providers.Dict(
+        payment_status=providers.Singleton(
+            ReferenceDataCache, namespace="payment_status", ttl_seconds=REFERENCE_DATA_CACHE_TTL_SECONDS
+        ),
+        payment_method=providers.Singleton(
+            ReferenceDataCache, namespace="payment_method", ttl_seconds=REFERENCE_DATA_CACHE_TTL_SECONDS
+        ),
+    )
+    reference_data_cache_bus = providers.Singleton(RedisCacheInvalidationBus, redis_url=REDIS_URL)
+
     # MongoDB connection context - no longer a session but a connection context
     db_connection = providers.Resource(get_db)
+    async_db = providers.Callable(get_async_db)
 
     # Payment Status components
     payment_status_gateway = providers.Factory(PaymentStatusRepository)
@@ -43,27 +83,96 @@ class Container(containers.DeclarativeContainer):
         PaymentMethodController, payment_method_gateway=payment_method_gateway
     )
 
-    # Notification Service Provider
-    http_notification_service = providers.Factory(HttpNotificationService)
+    # Notification Service Provider (callbacks to unhealthy hosts fail fast or are deferred)
+    notification_circuit_breaker = providers.Selector(
+        config.notification_circuit_breaker,
+        redis=providers.Singleton(RedisCircuitBreaker, redis_url=REDIS_URL),
+        disabled=providers.Object(None),
+    )
+    # One inline attempt; failed callbacks are retried by Celery with exponential backoff and jitter
+    notification_retry_scheduler = providers.Factory(CeleryNotificationRetryScheduler)
+    http_notification_service = providers.Factory(
+        HttpNotificationService,
+        circuit_breaker=notification_circuit_breaker,
+        retry_scheduler=notification_retry_scheduler,
+    )
     celery_notification_service = providers.Factory(CeleryNotificationService)    
     notification_services = providers.Dict({
         "http": http_notification_service,
         "celery": celery_notification_service
     })
+    # Delivery strategy comes from NOTIFICATION_STRATEGY; latencies are aggregated per strategy
+    notification_latency_histogram = providers.Singleton(LatencyHistogram)
     notification_service = providers.Factory(
-        HybridNotificationService, services=notification_services
+        HybridNotificationService,
+        services=notification_services,
+        latency_histogram=notification_latency_histogram,
+    )
+    # Outbox dispatcher: one process-wide instance keeps per-host keep-alive pools between batches
+    notification_dispatcher = providers.Singleton(
+        FanoutHttpNotificationService, circuit_breaker=notification_circuit_breaker
     )
 
-    # Payment Provider
-    payment_provider_gateway = providers.Factory(MercadoPagoGateway)
+    # Payment Provider (concurrent lookups of the same resource share one provider call)
+    payment_provider_single_flight = providers.Singleton(
+        SingleFlight, ttl_seconds=MERCADO_PAGO_VERIFY_CACHE_TTL_SECONDS
+    )
+    payment_provider_gateway = providers.Factory(MercadoPagoGateway, single_flight=payment_provider_single_flight)
+
+    # Shared pooled HTTP client, created and closed in the app lifespan
+    mercado_pago_http_client = providers.Singleton(build_mercado_pago_http_client)
+    async_payment_provider_single_flight = providers.Singleton(
+        AsyncSingleFlight, ttl_seconds=MERCADO_PAGO_VERIFY_CACHE_TTL_SECONDS
+    )
+    async_payment_provider_gateway = providers.Factory(
+        AsyncMercadoPagoGateway, client=mercado_pago_http_client, single_flight=async_payment_provider_single_flight
+    )
+
+    # Payment webhook queue (None keeps webhook processing inside the request)
+    payment_webhook_queue = providers.Selector(
+        config.webhook_processing_mode,
+        sync=providers.Object(None),
+        queue=providers.Factory(CeleryPaymentWebhookQueue),
+    )
+
+    # Processed webhooks (deduplicates provider redeliveries)
+    webhook_idempotency_store = providers.Factory(WebhookIdempotencyRepository)
 
     # Payment components
     payment_gateway = providers.Factory(PaymentRepository)
-    payment_controller = providers.Factory(
+
+    # Async payment components
+    async_payment_status_gateway = providers.Factory(AsyncPaymentStatusRepository, db=async_db)
+    async_payment_method_gateway = providers.Factory(AsyncPaymentMethodRepository, db=async_db)
+    async_payment_gateway = providers.Factory(AsyncPaymentRepository, db=async_db)
+
+    payment_controller = providers.Selector(
+        config.repository_mode,
+        sync=providers.Factory(
+            PaymentController,
+            payment_gateway=payment_gateway,
+            payment_provider_gateway=payment_provider_gateway,
+            payment_status_gateway=payment_status_gateway,
+            payment_method_gateway=payment_method_gateway,
+            payment_webhook_queue=payment_webhook_queue,
+            webhook_idempotency_store=webhook_idempotency_store
+        ),
+        **{"async": providers.Factory(
+            AsyncPaymentController,
+            payment_gateway=async_payment_gateway,
+            payment_provider_gateway=async_payment_provider_gateway,
+            payment_status_gateway=async_payment_status_gateway,
+            payment_method_gateway=async_payment_method_gateway,
+            payment_webhook_queue=payment_webhook_queue,
+            webhook_idempotency_store=webhook_idempotency_store
+        )},
+    )
+
+    # Bulk webhook replay (endpoint and CLI) always runs on the sync repositories
+    webhook_replay_controller = providers.Factory(
         PaymentController,
         payment_gateway=payment_gateway,
         payment_provider_gateway=payment_provider_gateway,
         payment_status_gateway=payment_status_gateway,
         payment_method_gateway=payment_method_gateway,
-        notification_service=notification_service
     )
@@ -0,0 +1,13 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.core.domain.dtos.payment.create_payment_dto import CreatePaymentDTO
+
+
+class CreatePaymentsBatchDTO(BaseModel):
+    model_config = ConfigDict(extra='forbid')
+
+    payments: list[CreatePaymentDTO] = Field(
+        ...,
+        min_length=1,
+        description="Pagamentos a serem criados",
+    )
@@ -0,0 +1,49 @@
+import datetime
+from enum import Enum
+from typing import ClassVar, List, Optional
+from pydantic import BaseModel
+
+from src.core.domain.entities.payment import Payment
+
+
+class PaymentExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class PaymentExportFilterDTO(BaseModel):
+    payment_status: Optional[str] = None
+    payment_method: Optional[str] = None
+    created_from: Optional[datetime.datetime] = None
+    created_to: Optional[datetime.datetime] = None
+
+
+class PaymentExportRowDTO(BaseModel):
+    FIELDS: ClassVar[List[str]] = [
+        "payment_id", "external_reference", "transaction_id", "amount", "payment_status",
+        "payment_method", "client_notified", "created_at", "updated_at",
+    ]
+
+    payment_id: str
+    external_reference: Optional[str] = None
+    transaction_id: Optional[str] = None
+    amount: float
+    payment_status: Optional[str] = None
+    payment_method: Optional[str] = None
+    client_notified: bool = False
+    created_at: Optional[datetime.datetime] = None
+    updated_at: Optional[datetime.datetime] = None
+
+    @classmethod
+    def from_entity(cls, entity: Payment) -> 'PaymentExportRowDTO':
+        return cls(
+            payment_id=str(entity.id),
+            external_reference=entity.external_reference,
+            transaction_id=entity.transaction_id,
+            amount=entity.amount,
+            payment_status=entity.payment_status.name if entity.payment_status else None,
+            payment_method=entity.payment_method.name if entity.payment_method else None,
+            client_notified=bool(entity.client_notified),
+            created_at=entity.created_at,
+            updated_at=entity.updated_at,
+        )
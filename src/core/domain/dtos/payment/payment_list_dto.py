@@ -0,0 +1,25 @@
+from typing import List, Optional
+from pydantic import BaseModel
+
+from src.core.domain.dtos.payment.qr_code_payment_dto import QrCodePaymentDTO
+from src.core.domain.entities.payment import Payment
+
+
+class PaymentListFilterDTO(BaseModel):
+    payment_status: Optional[str] = None
+    payment_method: Optional[str] = None
+    amount_min: Optional[float] = None
+    amount_max: Optional[float] = None
+    client_notified: Optional[bool] = None
+
+
+class PaymentPageDTO(BaseModel):
+    items: List[QrCodePaymentDTO]
+    next_cursor: Optional[str] = None
+
+    @classmethod
+    def from_page(cls, payments: List[Payment], next_cursor: Optional[str]) -> 'PaymentPageDTO':
+        return cls(
+            items=[QrCodePaymentDTO.from_entity(payment) for payment in payments],
+            next_cursor=next_cursor,
+        )
@@ -0,0 +1,33 @@
+from typing import List, Optional, Tuple
+from pydantic import BaseModel
+
+from src.core.domain.dtos.payment.qr_code_payment_dto import QrCodePaymentDTO
+from src.core.domain.entities.payment import Payment
+
+
+class PaymentBatchItemResultDTO(BaseModel):
+    index: int
+    success: bool
+    payment: Optional[QrCodePaymentDTO] = None
+    error: Optional[str] = None
+
+
+class PaymentsBatchResultDTO(BaseModel):
+    total: int
+    succeeded: int
+    failed: int
+    results: List[PaymentBatchItemResultDTO]
+
+    @classmethod
+    def from_results(cls, results: List[Tuple[Optional[Payment], Optional[str]]]) -> 'PaymentsBatchResultDTO':
+        items = [
+            PaymentBatchItemResultDTO(
+                index=index,
+                success=payment is not None,
+                payment=QrCodePaymentDTO.from_entity(payment) if payment is not None else None,
+                error=error,
+            )
+            for index, (payment, error) in enumerate(results)
+        ]
+        succeeded = sum(1 for item in items if item.success)
+        return cls(total=len(items), succeeded=succeeded, failed=len(items) - succeeded, results=items)
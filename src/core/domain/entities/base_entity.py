@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, Dict, Type, TypeVar
+from typing import Any, Dict, FrozenSet, Type, TypeVar
 
 T = TypeVar("T", bound="BaseEntity")
 
@@ -10,6 +10,8 @@ class BaseEntity:
         self._created_at = created_at
         self._updated_at = updated_at
         self._inactivated_at = inactivated_at
+        # Atributos alterados desde o carregamento (ou a última persistência) da entidade
+        self._dirty_fields = set()
         
     # getters and setters
     @property
@@ -27,6 +29,7 @@ class BaseEntity:
     @created_at.setter
     def created_at(self, value: datetime) -> None:
         self._created_at = value
+        self._mark_dirty('created_at')
 
     @property
     def updated_at(self) -> datetime:
@@ -35,6 +38,7 @@ class BaseEntity:
     @updated_at.setter
     def updated_at(self, value: datetime) -> None:
         self._updated_at = value
+        self._mark_dirty('updated_at')
 
     @property
     def inactivated_at(self) -> datetime:
@@ -43,6 +47,17 @@ class BaseEntity:
     @inactivated_at.setter
     def inactivated_at(self, value: datetime) -> None:
         self._inactivated_at = value
+        self._mark_dirty('inactivated_at')
+
+    @property
+    def dirty_fields(self) -> FrozenSet[str]:
+        return frozenset(self._dirty_fields)
+
+    def _mark_dirty(self, field_name: str) -> None:
+        self._dirty_fields.add(field_name)
+
+    def clear_dirty(self) -> None:
+        self._dirty_fields.clear()
 
     @property
     def is_new(self) -> bool:
@@ -66,6 +81,7 @@ class BaseEntity:
         attributes = ", ".join(
             f"{key.lstrip('_')}={value!r}" 
             for key, value in attributes_dict.items()
+            if key != '_dirty_fields'
         )
         return f"{self.__class__.__name__}({attributes})"
 
@@ -1,6 +1,7 @@
 from src.core.domain.entities.payment_method import PaymentMethod
 from src.core.domain.entities.payment_status import PaymentStatus
 from src.core.ports.payment.i_payment_provider_gateway import IPaymentProviderGateway
+from src.core.ports.payment.i_async_payment_provider_gateway import IAsyncPaymentProviderGateway
 from src.constants.payment_status import PaymentStatusEnum
 from src.core.domain.entities.base_entity import BaseEntity
 from typing import Dict, Any, Optional
@@ -19,6 +20,7 @@ class Payment(BaseEntity):
         payment_status: PaymentStatus = None,
         notification_url: Optional[str] = None,
         client_notified: bool = False,
+        notification_pending: bool = False,
         created_at: Optional[str] = None,
         updated_at: Optional[str] = None,
         inactivated_at: Optional[str] = None
@@ -32,6 +34,7 @@ class Payment(BaseEntity):
         self._transaction_id = transaction_id
         self._notification_url = notification_url
         self._client_notified = client_notified
+        self._notification_pending = notification_pending
 
     @property
     def payment_method(self):
@@ -40,6 +43,7 @@ class Payment(BaseEntity):
     @payment_method.setter
     def payment_method(self, value):
         self._payment_method = value
+        self._mark_dirty('payment_method')
 
     @property
     def payment_status(self):
@@ -48,6 +52,7 @@ class Payment(BaseEntity):
     @payment_status.setter
     def payment_status(self, value):
         self._payment_status = value
+        self._mark_dirty('payment_status')
 
     @property
     def amount(self):
@@ -58,6 +63,7 @@ class Payment(BaseEntity):
         if value <= 0:
             raise ValueError("Amount must be greater than zero")
         self._amount = value
+        self._mark_dirty('amount')
 
     @property
     def external_reference(self):
@@ -65,7 +71,8 @@ class Payment(BaseEntity):
 
     @external_reference.setter
     def external_reference(self, value):
-        self._external_reference = value   
+        self._external_reference = value
+        self._mark_dirty('external_reference')
 
     @property
     def qr_code(self):
@@ -77,6 +84,7 @@ class Payment(BaseEntity):
         if not value:
             raise ValueError("QR code cannot be empty")
         self._qr_code = value
+        self._mark_dirty('qr_code')
 
     @property
     def transaction_id(self):
@@ -88,6 +96,7 @@ class Payment(BaseEntity):
         if not value:
             raise ValueError("Transaction ID cannot be empty")
         self._transaction_id = value
+        self._mark_dirty('transaction_id')
         
     @property
     def notification_url(self):
@@ -99,6 +108,7 @@ class Payment(BaseEntity):
         if not value:
             raise ValueError("Notification URL cannot be empty")
         self._notification_url = value
+        self._mark_dirty('notification_url')
     
     @property
     def client_notified(self) -> bool:
@@ -109,6 +119,12 @@ class Payment(BaseEntity):
             raise ValueError("Client has already been notified.")
 
         self._client_notified = True
+        self._mark_dirty('client_notified')
+
+    @property
+    def notification_pending(self) -> bool:
+        """Notificação ao cliente registrada no outbox e ainda não despachada."""
+        return self._notification_pending
 
     def is_pending(self) -> bool:
         return self._payment_status.name == PaymentStatusEnum.PAYMENT_PENDING.status
@@ -124,9 +140,17 @@ class Payment(BaseEntity):
 
     def initiate_payment(self, payment_data: Dict[str, Any], payment_provider_gateway: IPaymentProviderGateway):
         payment_provider_response = payment_provider_gateway.initiate_payment(payment_data)
+        self._apply_provider_response(payment_provider_response)
+        return payment_provider_response
+
+    async def initiate_payment_async(self, payment_data: Dict[str, Any], payment_provider_gateway: IAsyncPaymentProviderGateway):
+        payment_provider_response = await payment_provider_gateway.initiate_payment(payment_data)
+        self._apply_provider_response(payment_provider_response)
+        return payment_provider_response
+
+    def _apply_provider_response(self, payment_provider_response: Dict[str, Any]):
         self.qr_code = payment_provider_response.get("qr_data")
         self.transaction_id = payment_provider_response.get("in_store_order_id")
-        return payment_provider_response
 
 
 __all__ = ['Payment']
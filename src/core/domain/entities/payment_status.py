@@ -1,6 +1,7 @@
 
 from typing import Optional
 from src.core.domain.entities.base_entity import BaseEntity
+from src.core.shared.lazy_relation import LazyRelation
 
 
 class PaymentStatus(BaseEntity):
@@ -36,11 +37,15 @@ class PaymentStatus(BaseEntity):
         self._description = value
 
     @property
-    def payments(self) -> list:
+    def payments(self) -> list | LazyRelation:
         return self._payments
     
     @payments.setter
-    def payments(self, value: list) -> None:
+    def payments(self, value: list | LazyRelation) -> None:
+        if isinstance(value, LazyRelation):
+            self._payments = value
+            return
+
         from src.core.domain.entities.payment import Payment
         if not all(isinstance(payment, Payment) for payment in value):
             raise ValueError("All items in payments must be instances of Payment")
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from typing import Callable
+
+
+class ICacheInvalidationBus(ABC):
+    """
+    Interface para o barramento que propaga invalidações de cache entre réplicas do serviço.
+    """
+
+    @abstractmethod
+    def publish(self, namespace: str) -> None:
+        """
+        Publica uma invalidação para o namespace informado.
+
+        :param namespace: Namespace do cache que deve ser invalidado nas demais réplicas.
+        """
+        pass
+
+    @abstractmethod
+    def subscribe(self, namespace: str, callback: Callable[[], None]) -> None:
+        """
+        Registra um callback executado quando outra réplica invalida o namespace.
+
+        :param namespace: Namespace do cache observado.
+        :param callback: Função chamada ao receber a invalidação.
+        """
+        pass
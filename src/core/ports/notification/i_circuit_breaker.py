@@ -0,0 +1,49 @@
+from abc import ABC, abstractmethod
+
+from src.constants.circuit_state import CircuitState
+
+
+class ICircuitBreaker(ABC):
+    """
+    Interface para o registro de circuit breakers por destino (ex.: host de `notification_url`).
+    """
+
+    @abstractmethod
+    def acquire(self, key: str) -> CircuitState:
+        """
+        Consulta o circuito antes de uma chamada ao destino.
+
+        :param key: Destino da chamada.
+        :return: CLOSED se a chamada está liberada, HALF_OPEN se ela é a chamada de teste
+            do destino (e deve ter o resultado registrado), OPEN se deve ser evitada.
+        """
+        pass
+
+    @abstractmethod
+    def record_success(self, key: str) -> None:
+        """
+        Registra uma chamada bem-sucedida, fechando o circuito do destino.
+
+        :param key: Destino da chamada.
+        """
+        pass
+
+    @abstractmethod
+    def record_failure(self, key: str) -> None:
+        """
+        Registra uma chamada com falha; o circuito abre ao atingir o limite de falhas
+        ou quando a chamada de teste falha.
+
+        :param key: Destino da chamada.
+        """
+        pass
+
+    @abstractmethod
+    def retry_after(self, key: str) -> float:
+        """
+        Tempo, em segundos, até o destino voltar a aceitar uma chamada de teste.
+
+        :param key: Destino da chamada.
+        :return: 0 se o circuito não está aberto.
+        """
+        pass
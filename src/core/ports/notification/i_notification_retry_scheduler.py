@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict
+
+
+class INotificationRetryScheduler(ABC):
+    """
+    Interface para o agendamento de novas tentativas de notificação fora da requisição.
+    """
+
+    @abstractmethod
+    def schedule_retry(self, notification_url: str, payment_data: Dict[str, Any]) -> bool:
+        """
+        Agenda o reenvio da notificação, com backoff exponencial e jitter.
+
+        :param notification_url: URL para enviar a notificação
+        :param payment_data: Dados do pagamento
+        :return: True se o reenvio foi agendado
+        """
+        pass
@@ -1,16 +1,32 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 
 class INotificationService(ABC):
     """Interface para serviços de notificação"""
-    
+
     @abstractmethod
     def send_payment_notification(self, notification_url: str, payment_data: Dict[str, Any]) -> bool:
         """
         Envia notificação de pagamento para a URL especificada
-        
+
         :param notification_url: URL para enviar a notificação
         :param payment_data: Dados do pagamento para enviar
         :return: True se enviado com sucesso, False caso contrário
         """
         pass
+
+    def send_payment_notifications(self, notifications: List[Tuple[str, Dict[str, Any]]]) -> List[bool]:
+        """
+        Envia um lote de notificações de pagamento. Por padrão, uma de cada vez;
+        implementações com envio concorrente sobrescrevem este método.
+
+        :param notifications: Pares (URL da notificação, dados do pagamento)
+        :return: Resultado de cada envio, na ordem do lote
+        """
+        results = []
+        for notification_url, payment_data in notifications:
+            try:
+                results.append(bool(self.send_payment_notification(notification_url, payment_data)))
+            except Exception:
+                results.append(False)
+        return results
@@ -0,0 +1,60 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Optional
+
+
+class IAsyncPaymentProviderGateway(ABC):
+    """
+    Interface assíncrona para gateways de pagamento, equivalente a `IPaymentProviderGateway`
+    para uso dentro do event loop sem bloqueá-lo.
+    """
+
+    @abstractmethod
+    async def initiate_payment(self, payment_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Inicia um pagamento e retorna os dados necessários, como QR Code ou links de pagamento.
+
+        :param payment_data: Dados necessários para criar o pagamento (ex.: valor, descrição, e-mail do cliente).
+        :return: Dicionário contendo os dados do pagamento, como links ou identificadores únicos.
+        """
+        pass
+
+    @abstractmethod
+    async def verify_payment(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Verifica o status de um pagamento a partir do payload do webhook.
+
+        :param payload: Dados enviados pelo provedor no webhook.
+        :return: Dicionário contendo o status atualizado do pagamento.
+        """
+        pass
+
+    @abstractmethod
+    def status_map(self, status_name: str) -> str:
+        """
+        Mapeia o status retornado pelo gateway para o status interno do sistema.
+
+        :param status_name: Nome do status retornado pelo gateway.
+        :return: Nome do status interno correspondente.
+        """
+        pass
+
+    def webhook_resource_key(self, payload: Dict[str, Any]) -> Optional[str]:
+        """
+        Identifica o recurso do provedor ao qual o webhook se refere, para agrupar notificações repetidas.
+        Gateways que não identificam o recurso retornam None.
+
+        :param payload: Dados enviados pelo provedor no webhook.
+        :return: Chave do recurso ou None.
+        """
+        return None
+
+    def webhook_idempotency_key(self, payload: Dict[str, Any], last_modified: Optional[str] = None) -> Optional[str]:
+        """
+        Monta a chave de idempotência de um webhook (tópico, id do recurso e versão).
+        Gateways que não identificam reentregas retornam None e não são deduplicados.
+
+        :param payload: Dados enviados pelo provedor no webhook.
+        :param last_modified: Versão do recurso retornada pelo provedor, quando já consultado.
+        :return: Chave do webhook ou None.
+        """
+        return None
@@ -0,0 +1,131 @@
+from abc import ABC, abstractmethod
+import datetime
+from typing import Any, AsyncIterator, List, Optional, Tuple
+
+from src.core.domain.entities.payment import Payment
+
+
+class IAsyncPaymentRepository(ABC):
+    """
+    Interface assíncrona para o repositório de pagamentos, equivalente a `IPaymentRepository`
+    para uso dentro do event loop sem bloqueá-lo.
+    """
+
+    @abstractmethod
+    async def create_payment(self, payment: Payment) -> Payment:
+        """
+        Cria um novo pagamento na coleção `payments`.
+
+        :param payment: Instância do pagamento a ser criado.
+        :return: Instância do pagamento criado.
+        """
+        pass
+
+    @abstractmethod
+    async def create_payments(self, payments: List[Payment]) -> List[Optional[Payment]]:
+        """
+        Cria vários pagamentos na coleção `payments` em uma única operação.
+
+        :param payments: Instâncias dos pagamentos a serem criados.
+        :return: Lista alinhada à entrada com o pagamento criado, ou None para os que não puderam ser gravados.
+        """
+        pass
+
+    @abstractmethod
+    async def update_payment_status(
+        self, payment: Payment, status_id, expected_status_id=None, enqueue_notification: bool = False
+    ) -> Optional[Payment]:
+        """
+        Atualiza o status de um pagamento na coleção `payments`.
+
+        :param payment: Instância do pagamento a ser atualizado.
+        :param status_id: Novo ID do status do pagamento.
+        :param expected_status_id: Se informado, a atualização só ocorre se o status atual for este.
+        :param enqueue_notification: Se verdadeiro, registra no outbox a notificação ao cliente na mesma escrita.
+        :return: Pagamento atualizado, ou None se o status atual não for o esperado.
+        """
+        pass
+
+    @abstractmethod
+    async def get_payment_by_transaction_id(self, transaction_id: str) -> Payment:
+        """
+        Recupera os detalhes de um pagamento pelo ID da transação.
+
+        :param transaction_id: ID da transação do pagamento.
+        :return: Instância do pagamento.
+        """
+        pass
+
+    @abstractmethod
+    async def get_payment_by_id(self, payment_id: str) -> Payment:
+        """
+        Recupera os detalhes de um pagamento pelo ID.
+
+        :param payment_id: ID do pagamento.
+        :return: Instância do pagamento.
+        """
+        pass
+
+    @abstractmethod
+    async def get_payment_by_reference(self, external_reference: str) -> Payment:
+        """
+        Recupera os detalhes de um pagamento pela referência externa.
+
+        :param external_reference: Referência externa do pagamento.
+        :return: Instância do pagamento.
+        """
+        pass
+
+    @abstractmethod
+    async def list_payments(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime.datetime, Any]] = None,
+        payment_status_id=None,
+        payment_method_id=None,
+        amount_min: Optional[float] = None,
+        amount_max: Optional[float] = None,
+        client_notified: Optional[bool] = None,
+    ) -> List[Payment]:
+        """
+        Lista uma página de pagamentos, do mais recente para o mais antigo, com paginação por cursor.
+
+        :param limit: Quantidade máxima de pagamentos da página.
+        :param after: Chave (created_at, id) do último pagamento da página anterior.
+        :param payment_status_id: ID do status do pagamento.
+        :param payment_method_id: ID do método de pagamento.
+        :param amount_min: Valor mínimo (inclusivo).
+        :param amount_max: Valor máximo (inclusivo).
+        :param client_notified: Se o cliente já foi notificado.
+        :return: Pagamentos da página, com apenas os campos da listagem.
+        """
+        pass
+
+    @abstractmethod
+    def iter_payments(
+        self,
+        payment_status_id=None,
+        payment_method_id=None,
+        created_from: Optional[datetime.datetime] = None,
+        created_to: Optional[datetime.datetime] = None,
+    ) -> AsyncIterator[Payment]:
+        """
+        Percorre os pagamentos que atendem aos filtros sem carregá-los todos em memória.
+
+        :param payment_status_id: ID do status do pagamento.
+        :param payment_method_id: ID do método de pagamento.
+        :param created_from: Data de criação inicial (inclusiva).
+        :param created_to: Data de criação final (exclusiva).
+        :return: Iterador assíncrono de pagamentos.
+        """
+        pass
+
+    @abstractmethod
+    async def update_payment(self, payment: Payment) -> Payment:
+        """
+        Atualiza um pagamento existente na coleção `payments`.
+
+        :param payment: Instância do pagamento a ser atualizado.
+        :return: Instância do pagamento atualizado.
+        """
+        pass
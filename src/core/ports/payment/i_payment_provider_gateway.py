@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
 class IPaymentProviderGateway(ABC):
@@ -37,3 +37,34 @@ class IPaymentProviderGateway(ABC):
         :return: Nome do status interno correspondente.
         """
         pass
+
+    def find_payment_by_reference(self, external_reference: str) -> Optional[Dict[str, Any]]:
+        """
+        Consulta no provedor o estado atual do pagamento com a referência externa informada,
+        usado na conciliação de pagamentos que não receberam webhook.
+
+        :param external_reference: Referência externa do pagamento.
+        :return: Detalhes do pagamento no mesmo formato de `verify_payment`, ou None se o provedor não o conhecer.
+        """
+        raise NotImplementedError(f"{type(self).__name__} não suporta consulta por referência externa.")
+
+    def webhook_resource_key(self, payload: Dict[str, Any]) -> Optional[str]:
+        """
+        Identifica o recurso do provedor ao qual o webhook se refere, para agrupar notificações repetidas.
+        Gateways que não identificam o recurso retornam None.
+
+        :param payload: Dados enviados pelo provedor no webhook.
+        :return: Chave do recurso ou None.
+        """
+        return None
+
+    def webhook_idempotency_key(self, payload: Dict[str, Any], last_modified: Optional[str] = None) -> Optional[str]:
+        """
+        Monta a chave de idempotência de um webhook (tópico, id do recurso e versão).
+        Gateways que não identificam reentregas retornam None e não são deduplicados.
+
+        :param payload: Dados enviados pelo provedor no webhook.
+        :param last_modified: Versão do recurso retornada pelo provedor, quando já consultado.
+        :return: Chave do webhook ou None.
+        """
+        return None
@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from src.core.domain.entities.payment import Payment
 
@@ -19,12 +21,121 @@ class IPaymentRepository(ABC):
         pass
 
     @abstractmethod
-    def update_payment_status(self, payment: Payment, status_id: int) -> Payment:
+    def create_payments(self, payments: List[Payment]) -> List[Optional[Payment]]:
+        """
+        Cria vários pagamentos na tabela `payments` em uma única operação.
+        
+        :param payments: Instâncias dos pagamentos a serem criados.
+        :return: Lista alinhada à entrada com o pagamento criado, ou None para os que não puderam ser gravados.
+        """
+        pass
+
+    @abstractmethod
+    def update_payment_status(
+        self, payment: Payment, status_id: int, expected_status_id=None, enqueue_notification: bool = False
+    ) -> Optional[Payment]:
         """
         Atualiza o status de um pagamento na tabela `payments`.
         
         :param payment: Instância do pagamento a ser atualizado.
         :param status_id: Novo ID do status do pagamento.
+        :param expected_status_id: Se informado, a atualização só ocorre se o status atual for este.
+        :param enqueue_notification: Se verdadeiro, registra no outbox a notificação ao cliente na mesma escrita.
+        :return: Pagamento atualizado, ou None se o status atual não for o esperado.
+        """
+        pass
+
+    @abstractmethod
+    def bulk_update_status_by_reference(self, status_by_reference: Dict[str, Any], notify_status_id=None) -> int:
+        """
+        Atualiza o status de vários pagamentos, identificados pela referência externa, em lote.
+        
+        :param status_by_reference: ID do novo status para cada referência externa.
+        :param notify_status_id: Status cuja transição registra no outbox a notificação ao cliente.
+        :return: Quantidade de pagamentos efetivamente alterados.
+        """
+        pass
+
+    @abstractmethod
+    def claim_pending_notifications(self, limit: int, lease_seconds: int) -> List[Payment]:
+        """
+        Reserva um lote de pagamentos com notificação pendente no outbox.
+        
+        :param limit: Quantidade máxima de pagamentos reservados.
+        :param lease_seconds: Tempo após o qual uma reserva não concluída volta a ficar disponível.
+        :return: Pagamentos reservados.
+        """
+        pass
+
+    @abstractmethod
+    def complete_notifications(self, payment_ids: List[Any]) -> None:
+        """
+        Remove os pagamentos do outbox após o despacho, marcando o cliente como notificado.
+        
+        :param payment_ids: IDs dos pagamentos despachados.
+        """
+        pass
+
+    @abstractmethod
+    def release_notifications(self, payment_ids: List[Any]) -> None:
+        """
+        Libera a reserva dos pagamentos cujo despacho falhou.
+        
+        :param payment_ids: IDs dos pagamentos reservados.
+        """
+        pass
+
+    @abstractmethod
+    def get_payments_by_references(self, external_references: List[str]) -> List[Payment]:
+        """
+        Recupera os pagamentos com as referências externas informadas.
+        
+        :param external_references: Referências externas dos pagamentos.
+        :return: Lista de pagamentos encontrados.
+        """
+        pass
+
+    @abstractmethod
+    def list_payments(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime.datetime, Any]] = None,
+        payment_status_id=None,
+        payment_method_id=None,
+        amount_min: Optional[float] = None,
+        amount_max: Optional[float] = None,
+        client_notified: Optional[bool] = None,
+    ) -> List[Payment]:
+        """
+        Lista uma página de pagamentos, do mais recente para o mais antigo, com paginação por cursor.
+        
+        :param limit: Quantidade máxima de pagamentos da página.
+        :param after: Chave (created_at, id) do último pagamento da página anterior.
+        :param payment_status_id: ID do status do pagamento.
+        :param payment_method_id: ID do método de pagamento.
+        :param amount_min: Valor mínimo (inclusivo).
+        :param amount_max: Valor máximo (inclusivo).
+        :param client_notified: Se o cliente já foi notificado.
+        :return: Pagamentos da página, com apenas os campos da listagem.
+        """
+        pass
+
+    @abstractmethod
+    def iter_payments(
+        self,
+        payment_status_id=None,
+        payment_method_id=None,
+        created_from: Optional[datetime.datetime] = None,
+        created_to: Optional[datetime.datetime] = None,
+    ) -> Iterator[Payment]:
+        """
+        Percorre os pagamentos que atendem aos filtros sem carregá-los todos em memória.
+        
+        :param payment_status_id: ID do status do pagamento.
+        :param payment_method_id: ID do método de pagamento.
+        :param created_from: Data de criação inicial (inclusiva).
+        :param created_to: Data de criação final (exclusiva).
+        :return: Iterador de pagamentos.
         """
         pass
 
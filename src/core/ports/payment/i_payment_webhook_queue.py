@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Any
+
+
+class IPaymentWebhookQueue(ABC):
+    """
+    Interface para a fila durável que recebe os webhooks do provedor de pagamento
+    para processamento fora do ciclo da requisição.
+    """
+
+    @abstractmethod
+    def enqueue(self, payload: Dict[str, Any]) -> bool:
+        """
+        Enfileira o payload bruto do webhook para processamento assíncrono.
+
+        :param payload: Dados enviados pelo gateway no webhook.
+        :return: True se o payload foi enfileirado com sucesso, False caso contrário.
+        """
+        pass
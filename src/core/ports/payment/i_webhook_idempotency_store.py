@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+
+
+class IWebhookIdempotencyStore(ABC):
+    """
+    Interface para o registro de webhooks já processados, usado para descartar
+    reentregas do provedor sem consultar a API dele novamente.
+    """
+
+    @abstractmethod
+    def is_processed(self, key: str) -> bool:
+        """
+        Verifica se o webhook identificado pela chave já foi processado.
+
+        :param key: Chave de idempotência do webhook.
+        :return: True se a chave já foi registrada e ainda não expirou.
+        """
+        pass
+
+    @abstractmethod
+    def mark_processed(self, key: str) -> None:
+        """
+        Registra o webhook identificado pela chave como processado.
+
+        :param key: Chave de idempotência do webhook.
+        """
+        pass
@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from src.core.domain.entities.payment_status import PaymentStatus
+
+
+class IAsyncPaymentStatusRepository(ABC):
+
+    @abstractmethod
+    async def create(self, payment_status: PaymentStatus) -> PaymentStatus:
+        pass
+
+    @abstractmethod
+    async def exists_by_name(self, name: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def get_by_name(self, name: str) -> PaymentStatus:
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, payment_status_id: str) -> PaymentStatus:
+        pass
+
+    @abstractmethod
+    async def get_all(self, include_deleted: bool = False) -> List[PaymentStatus]:
+        pass
+
+    @abstractmethod
+    async def update(self, payment_status: PaymentStatus) -> PaymentStatus:
+        pass
+
+    @abstractmethod
+    async def delete(self, payment_status: PaymentStatus) -> None:
+        pass
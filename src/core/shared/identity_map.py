@@ -1,33 +1,142 @@
+import sys
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
 
+from config.settings import IDENTITY_MAP_MAX_BYTES, IDENTITY_MAP_MAX_ENTRIES, IDENTITY_MAP_WEAK_REFS
 from src.core.domain.entities.base_entity import BaseEntity
 
+_current_identity_map: ContextVar[Optional["IdentityMap"]] = ContextVar("identity_map", default=None)
+
 # pattern Identity Map - Martin Fowler
 # https://martinfowler.com/eaaCatalog/identityMap.html
 class IdentityMap:
-    
-    def __init__(self):
-        self._entities = {}
-        
+    """
+    Mapa de identidade por unidade de trabalho (requisição HTTP ou task Celery).
+
+    O mapa da unidade corrente fica em uma `ContextVar`, de modo que requisições concorrentes no mesmo
+    event loop ou threadpool não compartilham entidades. Fora de um `scope()` (scripts, testes), é
+    usada a instância do container.
+
+    O mapa é limitado: acima de `max_entries` entidades ou de `max_bytes` (tamanho raso aproximado,
+    0 desativa), as menos usadas recentemente são descartadas. Com `weak_refs`, o mapa não mantém
+    entidades vivas sozinho. Uma entidade descartada apenas deixa de ser compartilhada: a próxima
+    leitura a carrega de novo.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = IDENTITY_MAP_MAX_ENTRIES,
+        max_bytes: int = IDENTITY_MAP_MAX_BYTES,
+        weak_refs: bool = IDENTITY_MAP_WEAK_REFS,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.weak_refs = weak_refs
+        self._entities: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.peak_size = 0
+
     @classmethod
     def get_instance(cls) -> "IdentityMap":
+        identity_map = _current_identity_map.get()
+        if identity_map is not None:
+            return identity_map
         from src.core.containers import Container
         return Container.identity_map()
-        
+
+    @classmethod
+    @contextmanager
+    def scope(cls) -> Iterator["IdentityMap"]:
+        """
+        Abre um mapa novo para o contexto corrente, restaurando o anterior ao sair.
+        """
+        identity_map = cls()
+        token = _current_identity_map.set(identity_map)
+        try:
+            yield identity_map
+        finally:
+            _current_identity_map.reset(token)
+
     def add(self, entity: BaseEntity):
         key = (entity.__class__, entity.id)
-        self._entities[key] = entity
+        self._discard(key)
+        size = self._approximate_size(entity)
+        self._entities[key] = (weakref.ref(entity) if self.weak_refs else entity, size)
+        self._bytes += size
+        self._evict()
+        self.peak_size = max(self.peak_size, len(self._entities))
     
     def get(self, entity_class, entity_id):
         key = (entity_class, entity_id)
-        return self._entities.get(key)
+        entity = self._lookup(key)
+        if entity is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._entities.move_to_end(key)
+        return entity
     
     def has(self, entity: BaseEntity):
         key = (entity.__class__, entity.id)
-        return key in self._entities
+        return self._lookup(key) is not None
     
     def remove(self, entity: BaseEntity):
         key = (entity.__class__, entity.id)
-        self._entities.pop(key, None)
+        self._discard(key)
         
     def clear(self):
         self._entities.clear()
+        self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entities),
+            "bytes": self._bytes,
+            "peak_size": self.peak_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def _lookup(self, key: tuple) -> Optional[BaseEntity]:
+        item = self._entities.get(key)
+        if item is None:
+            return None
+        entity = item[0]() if self.weak_refs else item[0]
+        if entity is None:
+            # Entidade coletada: a referência fraca morta sai do mapa
+            self._discard(key)
+        return entity
+
+    def _discard(self, key: tuple) -> None:
+        item = self._entities.pop(key, None)
+        if item is not None:
+            self._bytes -= item[1]
+
+    def _evict(self) -> None:
+        while self._entities and (
+            len(self._entities) > self.max_entries or (self.max_bytes and self._bytes > self.max_bytes)
+        ):
+            _, (_, size) = self._entities.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+
+    @staticmethod
+    def _approximate_size(entity: BaseEntity) -> int:
+        attributes = vars(entity)
+        return (
+            sys.getsizeof(entity)
+            + sys.getsizeof(attributes)
+            + sum(sys.getsizeof(value) for value in attributes.values())
+        )
+
+__all__ = ["IdentityMap"]
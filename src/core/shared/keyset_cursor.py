@@ -0,0 +1,30 @@
+import base64
+import datetime
+import json
+from typing import Any, Tuple
+
+from src.core.exceptions.bad_request_exception import BadRequestException
+
+
+def encode_cursor(created_at: datetime.datetime, entity_id: Any) -> str:
+    """
+    Codifica a chave (created_at, id) do último item de uma página em um cursor opaco.
+    """
+    raw = json.dumps({"created_at": created_at.isoformat(), "id": str(entity_id)})
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime.datetime, str]:
+    """
+    Decodifica um cursor gerado por `encode_cursor`.
+    :raises BadRequestException: Se o cursor for inválido.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+        return datetime.datetime.fromisoformat(data["created_at"]), data["id"]
+    except (ValueError, KeyError, TypeError) as e:
+        raise BadRequestException("Cursor de paginação inválido.") from e
+
+
+__all__ = ["encode_cursor", "decode_cursor"]
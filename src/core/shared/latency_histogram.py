@@ -0,0 +1,63 @@
+import threading
+from typing import Any, Dict, Optional, Sequence
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class LatencyHistogram:
+    """
+    Histogramas de latência (em segundos) por chave, com buckets fixos e seguros entre threads.
+    Os percentis são estimados pelo limite superior do bucket que os contém.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self._buckets = tuple(sorted(buckets))
+        self._counts: Dict[str, list] = {}
+        self._sums: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, key: str, seconds: float) -> None:
+        index = next((i for i, bound in enumerate(self._buckets) if seconds <= bound), len(self._buckets))
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * (len(self._buckets) + 1))
+            counts[index] += 1
+            self._sums[key] = self._sums.get(key, 0.0) + seconds
+
+    def quantile(self, key: str, q: float) -> Optional[float]:
+        with self._lock:
+            counts = list(self._counts.get(key, ()))
+        return self._quantile(counts, q)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            items = {key: (list(counts), self._sums[key]) for key, counts in self._counts.items()}
+
+        snapshot = {}
+        for key, (counts, total) in items.items():
+            cumulative, buckets = 0, {}
+            for bound, count in zip(self._buckets + (float("inf"),), counts):
+                cumulative += count
+                buckets["+Inf" if bound == float("inf") else str(bound)] = cumulative
+            snapshot[key] = {
+                "count": cumulative,
+                "sum": round(total, 6),
+                "buckets": buckets,
+                "p50": self._quantile(counts, 0.5),
+                "p95": self._quantile(counts, 0.95),
+                "p99": self._quantile(counts, 0.99),
+            }
+        return snapshot
+
+    def _quantile(self, counts: list, q: float) -> Optional[float]:
+        total = sum(counts)
+        if not total:
+            return None
+        rank, cumulative = q * total, 0
+        for bound, count in zip(self._buckets + (float("inf"),), counts):
+            cumulative += count
+            if cumulative >= rank:
+                return bound
+        return float("inf")
+
+
+__all__ = ["LatencyHistogram", "DEFAULT_BUCKETS"]
@@ -0,0 +1,51 @@
+from typing import Any, Callable, Generic, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Carrega uma página de itens a partir do cursor (último id lido) e do tamanho do lote
+PageLoader = Callable[[Optional[Any], int], List[T]]
+
+
+class LazyRelation(Generic[T]):
+    """
+    Proxy para relações um-para-muitos que só consulta a fonte de dados quando iterado.
+
+    Os itens são carregados em lotes de `batch_size` usando paginação por cursor (keyset):
+    cada nova página é buscada a partir do `id` do último item lido, mantendo o custo de
+    cada consulta constante independentemente do tamanho da coleção.
+    """
+
+    DEFAULT_BATCH_SIZE = 100
+
+    def __init__(self, page_loader: PageLoader, batch_size: int = DEFAULT_BATCH_SIZE):
+        if batch_size <= 0:
+            raise ValueError("batch_size must be greater than zero")
+        self._page_loader = page_loader
+        self._batch_size = batch_size
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    def __iter__(self) -> Iterator[T]:
+        cursor = None
+        while True:
+            page = self._page_loader(cursor, self._batch_size)
+            yield from page
+
+            if len(page) < self._batch_size:
+                return
+            cursor = page[-1].id
+
+    def first(self) -> Optional[T]:
+        page = self._page_loader(None, 1)
+        return page[0] if page else None
+
+    def all(self) -> List[T]:
+        return list(self)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(batch_size={self._batch_size})"
+
+
+__all__ = ["LazyRelation", "PageLoader"]
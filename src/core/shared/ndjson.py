@@ -0,0 +1,48 @@
+import json
+import logging
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, Union
+
+logger = logging.getLogger(__name__)
+
+
+class NdjsonReader:
+    """
+    Lê objetos JSON de um fluxo NDJSON (um objeto por linha). Linhas vazias são ignoradas e
+    linhas inválidas são contadas em `invalid_lines` sem interromper a leitura.
+    """
+
+    def __init__(self, lines: Iterable[Union[str, bytes]]):
+        self._lines = lines
+        self.invalid_lines = 0
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for line_number, line in enumerate(self._lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                item = json.loads(line)
+            except ValueError:
+                item = None
+
+            if not isinstance(item, dict):
+                self.invalid_lines += 1
+                logger.warning(f"Linha {line_number} do NDJSON ignorada: não é um objeto JSON válido.")
+                continue
+            yield item
+
+
+async def aiter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    Reagrupa em linhas os blocos de bytes de um corpo recebido em streaming.
+    """
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line
+    if buffer:
+        yield buffer
+
+
+__all__ = ["NdjsonReader", "aiter_lines"]
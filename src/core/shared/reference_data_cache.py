@@ -0,0 +1,86 @@
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional
+
+from src.core.ports.cache.i_cache_invalidation_bus import ICacheInvalidationBus
+
+
+class ReferenceDataCache:
+    """
+    Cache em memória, compartilhado pelo processo, para dados de referência quase estáticos
+    (status e métodos de pagamento).
+
+    As entradas expiram após `ttl_seconds` e todo o namespace é invalidado em qualquer escrita.
+    Quando um barramento de invalidação é vinculado, a invalidação é propagada às demais réplicas.
+    """
+
+    DEFAULT_TTL_SECONDS = 300
+
+    def __init__(self, namespace: str, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self._namespace = namespace
+        self._ttl_seconds = ttl_seconds
+        self._entries: Dict[Hashable, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self._bus: Optional[ICacheInvalidationBus] = None
+
+    @classmethod
+    def get_instance(cls, namespace: str) -> "ReferenceDataCache":
+        from src.core.containers import Container
+        return Container.reference_data_caches()[namespace]
+
+    @property
+    def namespace(self) -> str:
+        return self._namespace
+
+    def bind_bus(self, bus: ICacheInvalidationBus) -> None:
+        self._bus = bus
+        bus.subscribe(self._namespace, self.clear)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        expires_at = time.monotonic() + self._ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+
+    def get_snapshot(self, field: str, value: Any) -> Optional[Dict[str, Any]]:
+        """
+        Retorna o snapshot de um registro de referência pelo campo `id` ou `name`.
+        """
+        return self.get((field, str(value)))
+
+    def set_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        """
+        Armazena o snapshot de um registro de referência indexado por `id` e por `name`.
+        """
+        self.set(('id', str(snapshot['id'])), snapshot)
+        self.set(('name', str(snapshot['name'])), snapshot)
+
+    def invalidate(self) -> None:
+        """
+        Limpa o namespace localmente e propaga a invalidação às demais réplicas.
+        """
+        self.clear()
+        if self._bus is not None:
+            self._bus.publish(self._namespace)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+__all__ = ["ReferenceDataCache"]
@@ -0,0 +1,146 @@
+import asyncio
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _ResultCache:
+    """
+    Resultados recentes por chave, válidos por `ttl_seconds`. Não é thread-safe:
+    o chamador controla o acesso.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self._ttl_seconds = ttl_seconds
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return False, None
+        return True, value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self._ttl_seconds <= 0:
+            return
+
+        now = time.monotonic()
+        # Remove as entradas vencidas para que o cache não cresça com chaves que não se repetem
+        for expired_key in [k for k, (expires_at, _) in self._entries.items() if expires_at <= now]:
+            del self._entries[expired_key]
+        self._entries[key] = (now + self._ttl_seconds, value)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Agrupa chamadas concorrentes com a mesma chave (single-flight): apenas a primeira thread
+    executa a função e as demais aguardam e recebem o mesmo resultado (ou a mesma exceção).
+
+    Resultados bem-sucedidos ficam disponíveis por `ttl_seconds`, absorvendo rajadas de
+    chamadas idênticas que chegam logo após a conclusão da primeira.
+    """
+
+    DEFAULT_TTL_SECONDS = 2
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._results = _ResultCache(ttl_seconds)
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            found, value = self._results.get(key)
+            if found:
+                return value
+
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                if call.error is None:
+                    self._results.set(key, call.result)
+            call.done.set()
+        return call.result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+
+
+class AsyncSingleFlight:
+    """
+    Versão de `SingleFlight` para o event loop: corrotinas concorrentes com a mesma chave
+    compartilham uma única execução de `fn`.
+    """
+
+    DEFAULT_TTL_SECONDS = SingleFlight.DEFAULT_TTL_SECONDS
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self._results = _ResultCache(ttl_seconds)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        found, value = self._results.get(key)
+        if found:
+            return value
+
+        in_flight = self._calls.get(key)
+        if in_flight is not None:
+            # shield: o cancelamento de quem aguarda não cancela a chamada compartilhada
+            return await asyncio.shield(in_flight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Evita o aviso de exceção não consumida quando ninguém mais aguardava
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            self._results.set(key, result)
+            return result
+        finally:
+            del self._calls[key]
+
+    def clear(self) -> None:
+        self._results.clear()
+
+
+__all__ = ["SingleFlight", "AsyncSingleFlight"]
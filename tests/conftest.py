@@ -28,6 +28,9 @@ def setup_test_environment():
     os.environ['CELERY_NOTIFICATION_MAX_RETRIES'] = '2'
     os.environ['CELERY_NOTIFICATION_RETRY_DELAY_SECONDS'] = '0'
 
+    # No Redis in tests: notification callbacks run without the shared circuit breaker
+    Container.config.notification_circuit_breaker.from_value("disabled")
+
     yield
     # Cleanup after tests
     try:
@@ -104,15 +107,22 @@ def clean_database(mongo_db):
         from src.adapters.driven.repositories.models.payment_method_model import PaymentMethodModel
         from src.adapters.driven.repositories.models.payment_status_model import PaymentStatusModel
         from src.adapters.driven.repositories.models.payment_model import PaymentModel
+        from src.adapters.driven.repositories.models.processed_webhook_model import ProcessedWebhookModel
         
         # Switch to test database
         PaymentMethodModel._get_db = lambda: mongo_db['test_payment_service']
         PaymentStatusModel._get_db = lambda: mongo_db['test_payment_service']
         PaymentModel._get_db = lambda: mongo_db['test_payment_service']
+        ProcessedWebhookModel._get_db = lambda: mongo_db['test_payment_service']
         
         PaymentMethodModel.objects.delete()
         PaymentStatusModel.objects.delete()
         PaymentModel.objects.delete()
+        ProcessedWebhookModel.objects.delete()
+
+        # The collections are wiped behind the repositories' back, so drop cached reference data too
+        for cache in Container.reference_data_caches().values():
+            cache.clear()
     except Exception as e:
         print(f"Error cleaning database: {e}")
     
@@ -123,5 +133,6 @@ def clean_database(mongo_db):
         PaymentMethodModel.objects.delete()
         PaymentStatusModel.objects.delete()  
         PaymentModel.objects.delete()
+        ProcessedWebhookModel.objects.delete()
     except Exception as e:
         print(f"Error cleaning database after test: {e}")
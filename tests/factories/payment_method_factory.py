@@ -11,5 +11,5 @@ class PaymentMethodFactory(MongoEngineFactory):
     class Meta:
         model = PaymentMethodModel
 
-    name = factory.LazyAttribute(lambda _: fake.word())
+    name = factory.LazyAttribute(lambda _: fake.unique.word())
     description = factory.LazyAttribute(lambda _: fake.sentence(nb_words=10))
@@ -0,0 +1,59 @@
+import mongomock
+
+
+class AsyncMongomockCursor:
+    """In-memory stand-in for pymongo's AsyncCursor backed by a mongomock cursor."""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def __getattr__(self, name):
+        attribute = getattr(self._cursor, name)
+        if not callable(attribute):
+            return attribute
+
+        def chain(*args, **kwargs):
+            result = attribute(*args, **kwargs)
+            return self if result is self._cursor else result
+        return chain
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._cursor)
+        except StopIteration:
+            raise StopAsyncIteration
+
+    async def to_list(self, length=None):
+        documents = list(self._cursor)
+        return documents if length is None else documents[:length]
+
+
+class AsyncMongomockCollection:
+    """In-memory stand-in for pymongo's AsyncCollection backed by a mongomock collection."""
+
+    CURSOR_METHODS = ("find", "aggregate")
+
+    def __init__(self, collection: mongomock.Collection):
+        self._collection = collection
+
+    def __getattr__(self, name):
+        attribute = getattr(self._collection, name)
+        if name in self.CURSOR_METHODS:
+            return lambda *args, **kwargs: AsyncMongomockCursor(attribute(*args, **kwargs))
+
+        async def call(*args, **kwargs):
+            return attribute(*args, **kwargs)
+        return call
+
+
+class AsyncMongomockDatabase:
+    """In-memory stand-in for pymongo's AsyncDatabase backed by a mongomock database."""
+
+    def __init__(self, database: mongomock.Database):
+        self._database = database
+
+    def __getitem__(self, name) -> AsyncMongomockCollection:
+        return AsyncMongomockCollection(self._database[name])
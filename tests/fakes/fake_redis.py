@@ -0,0 +1,49 @@
+import time
+
+
+class FakeRedis:
+    """In-memory stand-in for the subset of redis.Redis used by the circuit breaker (strings with TTL)."""
+
+    def __init__(self):
+        self._values = {}
+        self._expires_at = {}
+
+    def _alive(self, name):
+        expires_at = self._expires_at.get(name)
+        if expires_at is not None and expires_at <= time.time():
+            self._values.pop(name, None)
+            self._expires_at.pop(name, None)
+        return name in self._values
+
+    def get(self, name):
+        return self._values[name] if self._alive(name) else None
+
+    def set(self, name, value, ex=None, nx=False):
+        if nx and self._alive(name):
+            return None
+        self._values[name] = str(value).encode()
+        self._expires_at.pop(name, None)
+        if ex is not None:
+            self._expires_at[name] = time.time() + ex
+        return True
+
+    def incr(self, name):
+        value = int(self.get(name) or 0) + 1
+        self._values[name] = str(value).encode()
+        return value
+
+    def expire(self, name, seconds):
+        if not self._alive(name):
+            return False
+        self._expires_at[name] = time.time() + seconds
+        return True
+
+    def exists(self, *names):
+        return sum(1 for name in names if self._alive(name))
+
+    def delete(self, *names):
+        deleted = self.exists(*names)
+        for name in names:
+            self._values.pop(name, None)
+            self._expires_at.pop(name, None)
+        return deleted
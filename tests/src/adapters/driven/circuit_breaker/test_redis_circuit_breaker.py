@@ -0,0 +1,82 @@
+import pytest
+import redis
+from unittest.mock import MagicMock
+
+from src.adapters.driven.circuit_breaker.redis_circuit_breaker import RedisCircuitBreaker
+from src.constants.circuit_state import CircuitState
+from src.core.ports.notification.i_circuit_breaker import ICircuitBreaker
+from tests.fakes.fake_redis import FakeRedis
+
+HOST = "https://merchant.example.com:443"
+
+
+def build_breaker(client=None, **kwargs):
+    settings = {"failure_threshold": 3, "failure_window_seconds": 60, "open_seconds": 30, "probe_timeout_seconds": 30}
+    settings.update(kwargs)
+    return RedisCircuitBreaker(client=client if client is not None else FakeRedis(), **settings)
+
+
+@pytest.fixture
+def breaker():
+    return build_breaker()
+
+
+def test_redis_circuit_breaker_is_instance_of_interface(breaker):
+    assert isinstance(breaker, ICircuitBreaker)
+
+
+def test_circuit_opens_after_failure_threshold(breaker):
+    for _ in range(2):
+        breaker.record_failure(HOST)
+    assert breaker.acquire(HOST) is CircuitState.CLOSED
+
+    breaker.record_failure(HOST)
+
+    assert breaker.acquire(HOST) is CircuitState.OPEN
+    assert 0 < breaker.retry_after(HOST) <= 30
+    assert breaker.acquire("https://other.example.com:443") is CircuitState.CLOSED
+
+
+def test_success_resets_failure_count(breaker):
+    breaker.record_failure(HOST)
+    breaker.record_failure(HOST)
+    breaker.record_success(HOST)
+    breaker.record_failure(HOST)
+
+    assert breaker.acquire(HOST) is CircuitState.CLOSED
+
+
+def test_half_open_allows_a_single_probe_shared_across_workers():
+    client = FakeRedis()
+    worker_a = build_breaker(client, failure_threshold=1, open_seconds=0)
+    worker_b = build_breaker(client, failure_threshold=1, open_seconds=0)
+    worker_a.record_failure(HOST)
+
+    assert worker_a.acquire(HOST) is CircuitState.HALF_OPEN
+    assert worker_b.acquire(HOST) is CircuitState.OPEN
+
+    worker_a.record_success(HOST)
+
+    assert worker_b.acquire(HOST) is CircuitState.CLOSED
+
+
+def test_failed_probe_reopens_circuit():
+    breaker = build_breaker(failure_threshold=1, open_seconds=0)
+    breaker.record_failure(HOST)
+    assert breaker.acquire(HOST) is CircuitState.HALF_OPEN
+
+    breaker.open_seconds = 30
+    breaker.record_failure(HOST)
+
+    assert breaker.acquire(HOST) is CircuitState.OPEN
+
+
+def test_redis_errors_fail_open():
+    client = MagicMock()
+    client.get.side_effect = redis.ConnectionError("unavailable")
+    client.exists.side_effect = redis.ConnectionError("unavailable")
+    breaker = build_breaker(client)
+
+    assert breaker.acquire(HOST) is CircuitState.CLOSED
+    assert breaker.retry_after(HOST) == 0
+    breaker.record_failure(HOST)
@@ -3,6 +3,8 @@ from unittest.mock import patch, MagicMock
 import requests
 from src.adapters.driven.notification_providers.celery_notification_service import (
     CeleryNotificationService,
+    CeleryNotificationRetryScheduler,
+    NotificationTask,
     send_payment_notification_task
 )
 from src.core.ports.notification.i_notification_service import INotificationService
@@ -75,3 +77,42 @@ def test_send_payment_notification_task_http_error_raises_exception(mock_post):
 
     mock_post.assert_called_once()
     assert excinfo.value is original_exception
+
+
+@patch('requests.post')
+def test_send_payment_notification_task_defers_when_circuit_is_open(mock_post):
+    from celery.exceptions import Retry
+    from dependency_injector import providers
+    from src.constants.circuit_state import CircuitState
+    from src.core.containers import Container
+
+    circuit_breaker = MagicMock()
+    circuit_breaker.acquire.return_value = CircuitState.OPEN
+    circuit_breaker.retry_after.return_value = 12.0
+
+    with Container.notification_circuit_breaker.override(providers.Object(circuit_breaker)):
+        with pytest.raises(Retry):
+            send_payment_notification_task("https://merchant.example.com/notify", {"payment_id": "123"})
+
+    mock_post.assert_not_called()
+    circuit_breaker.record_failure.assert_not_called()
+
+
+@patch('src.adapters.driven.notification_providers.celery_notification_service.send_payment_notification_task.apply_async')
+def test_retry_scheduler_enqueues_task_with_jittered_backoff(mock_apply_async):
+    mock_apply_async.return_value = MagicMock(id="test_task_id")
+    payment_data = {"payment_id": "123"}
+
+    result = CeleryNotificationRetryScheduler().schedule_retry("http://test.com/notify", payment_data)
+
+    assert result is True
+    args, kwargs = mock_apply_async.call_args
+    assert args == (("http://test.com/notify", payment_data),)
+    assert 0 <= kwargs['countdown'] <= NotificationTask.retry_backoff
+    assert NotificationTask.retry_jitter is True
+
+@patch('src.adapters.driven.notification_providers.celery_notification_service.send_payment_notification_task.apply_async')
+def test_retry_scheduler_reports_enqueue_failure(mock_apply_async):
+    mock_apply_async.side_effect = Exception("Queueing error")
+
+    assert CeleryNotificationRetryScheduler().schedule_retry("http://test.com/notify", {"payment_id": "123"}) is False
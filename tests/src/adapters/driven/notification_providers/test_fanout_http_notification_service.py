@@ -0,0 +1,111 @@
+import asyncio
+import json
+from collections import Counter
+
+import httpx
+import pytest
+from unittest.mock import MagicMock
+
+from src.adapters.driven.notification_providers.fanout_http_notification_service import FanoutHttpNotificationService
+from src.constants.circuit_state import CircuitState
+from src.core.ports.notification.i_notification_service import INotificationService
+
+
+class RecordingTransport:
+    def __init__(self, status_by_host=None, delay=0.01):
+        self.status_by_host = status_by_host or {}
+        self.delay = delay
+        self.requests = []
+        self.in_flight = Counter()
+        self.max_in_flight = Counter()
+        self.max_total_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        self.requests.append(request)
+        self.in_flight[host] += 1
+        self.max_in_flight[host] = max(self.max_in_flight[host], self.in_flight[host])
+        self.max_total_in_flight = max(self.max_total_in_flight, sum(self.in_flight.values()))
+        await asyncio.sleep(self.delay)
+        self.in_flight[host] -= 1
+        return httpx.Response(self.status_by_host.get(host, 200))
+
+
+@pytest.fixture
+def transport():
+    return RecordingTransport(status_by_host={"down.example.com": 503})
+
+
+@pytest.fixture
+def notification_service(transport):
+    service = FanoutHttpNotificationService(
+        max_concurrency=50, max_connections_per_host=2, transport=httpx.MockTransport(transport)
+    )
+    yield service
+    service.close()
+
+
+def test_fanout_http_notification_service_is_instance_of_interface(notification_service):
+    assert isinstance(notification_service, INotificationService)
+
+
+def test_send_payment_notifications_returns_results_in_batch_order(notification_service, transport):
+    notifications = [
+        ("https://a.example.com/callback", {"payment_id": "1", "notification_id": "1:Completed"}),
+        ("https://down.example.com/callback", {"payment_id": "2"}),
+        ("not-a-url", {"payment_id": "3"}),
+        ("https://b.example.com/callback", {"payment_id": "4"}),
+    ]
+
+    results = notification_service.send_payment_notifications(notifications)
+
+    assert results == [True, False, False, True]
+    first = next(request for request in transport.requests if request.url.host == "a.example.com")
+    assert first.headers["Idempotency-Key"] == "1:Completed"
+    assert json.loads(first.content)["event"] == "payment.completed"
+
+
+def test_concurrency_is_bounded_per_host(notification_service, transport):
+    notifications = [
+        (f"https://{host}.example.com/callback/{i}", {"payment_id": str(i)})
+        for host in ("a", "b", "c") for i in range(10)
+    ]
+
+    results = notification_service.send_payment_notifications(notifications)
+
+    assert all(results)
+    assert max(transport.max_in_flight.values()) == 2
+    assert transport.max_total_in_flight > 2
+
+
+def test_pools_are_kept_only_for_most_recent_hosts(transport):
+    service = FanoutHttpNotificationService(max_hosts=1, transport=httpx.MockTransport(transport))
+
+    service.send_payment_notification("https://a.example.com/callback", {"payment_id": "1"})
+    service.send_payment_notification("https://b.example.com/callback", {"payment_id": "2"})
+
+    assert list(service._clients) == ["https://b.example.com:443"]
+    service.close()
+
+
+def test_circuit_breaker_skips_open_hosts_and_probes_half_open_hosts(transport):
+    states = {
+        "https://open.example.com:443": CircuitState.OPEN,
+        "https://down.example.com:443": CircuitState.HALF_OPEN,
+    }
+    circuit_breaker = MagicMock()
+    circuit_breaker.acquire.side_effect = lambda host: states.get(host, CircuitState.CLOSED)
+    service = FanoutHttpNotificationService(circuit_breaker=circuit_breaker, transport=httpx.MockTransport(transport))
+
+    results = service.send_payment_notifications([
+        ("https://open.example.com/callback", {"payment_id": "1"}),
+        ("https://down.example.com/callback", {"payment_id": "2"}),
+        ("https://down.example.com/callback", {"payment_id": "3"}),
+        ("https://a.example.com/callback", {"payment_id": "4"}),
+    ])
+
+    assert results == [False, False, False, True]
+    assert sorted(request.url.host for request in transport.requests) == ["a.example.com", "down.example.com"]
+    circuit_breaker.record_failure.assert_called_once_with("https://down.example.com:443")
+    circuit_breaker.record_success.assert_called_once_with("https://a.example.com:443")
+    service.close()
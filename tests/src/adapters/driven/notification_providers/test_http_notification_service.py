@@ -3,32 +3,16 @@ import requests
 from unittest.mock import patch, MagicMock
 from src.adapters.driven.notification_providers.http_notification_service import HttpNotificationService
 from src.core.ports.notification.i_notification_service import INotificationService
-from tenacity import retry, stop_after_attempt, wait_fixed
 
 @pytest.fixture
-def notification_service():
-    service = HttpNotificationService(timeout=1)
-    service.max_retries = 3
-    service.retry_delay = 0
-
-    service._send_http_request_with_retry = retry(
-        stop=stop_after_attempt(service.max_retries),
-        wait=wait_fixed(service.retry_delay),
-        reraise=True
-    )(service._execute_http_request)
-    
-    return service
-
-@pytest.fixture(autouse=True)
-def mock_tenacity_retry():
-    def no_retry_decorator(func):
-        return func
-
-    dummy_retry = MagicMock()
-    dummy_retry.side_effect = lambda *args, **kwargs: no_retry_decorator
-
-    with patch('src.adapters.driven.notification_providers.http_notification_service.retry', dummy_retry):
-        yield
+def retry_scheduler():
+    scheduler = MagicMock()
+    scheduler.schedule_retry.return_value = True
+    return scheduler
+
+@pytest.fixture
+def notification_service(retry_scheduler):
+    return HttpNotificationService(timeout=1, retry_scheduler=retry_scheduler)
 
 def test_http_notification_service_is_instance_of_interface(notification_service):
     assert isinstance(notification_service, INotificationService)
@@ -59,52 +43,64 @@ def test_send_payment_notification_success(mock_post, notification_service):
     assert call_args.kwargs['json']['payment_id'] == payment_data['payment_id']
 
 @patch('requests.post')
-def test_send_payment_notification_http_error_with_retries(mock_post, notification_service):
+def test_failed_attempt_is_scheduled_for_retry_instead_of_retried_inline(mock_post, notification_service, retry_scheduler):
     mock_response = mock_post.return_value
     mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("HTTP Error")
-    
+
     notification_url = "http://test.com/notify"
     payment_data = {"payment_id": "123"}
 
-    with pytest.raises(requests.exceptions.HTTPError):
-        notification_service.send_payment_notification(notification_url, payment_data)
+    result = notification_service.send_payment_notification(notification_url, payment_data)
 
-    assert mock_post.call_count == notification_service.max_retries
+    assert result is True
+    mock_post.assert_called_once()
+    retry_scheduler.schedule_retry.assert_called_once_with(notification_url, payment_data)
 
 @patch('requests.post')
-def test_send_payment_notification_timeout_with_retries(mock_post, notification_service):
+def test_failed_attempt_raises_when_retry_cannot_be_scheduled(mock_post, notification_service, retry_scheduler):
     mock_post.side_effect = requests.exceptions.ConnectTimeout("Timeout")
-
-    notification_url = "http://test.com/notify"
-    payment_data = {"payment_id": "123"}
+    retry_scheduler.schedule_retry.return_value = False
 
     with pytest.raises(requests.exceptions.ConnectTimeout):
-        notification_service.send_payment_notification(notification_url, payment_data)
+        notification_service.send_payment_notification("http://test.com/notify", {"payment_id": "123"})
 
-    assert mock_post.call_count == notification_service.max_retries
+    mock_post.assert_called_once()
 
 @patch('requests.post')
-def test_send_payment_notification_success_after_retry(mock_post, notification_service):
-    mock_response_fail = requests.Response()
-    mock_response_fail.status_code = 500
-    mock_response_fail.reason = "Internal Server Error"
-    mock_response_fail.raise_for_status = lambda: mock_response_fail.reason
+def test_failed_attempt_raises_without_retry_scheduler(mock_post):
+    mock_post.side_effect = requests.exceptions.ConnectTimeout("Timeout")
 
-    mock_response_success = requests.Response()
-    mock_response_success.status_code = 200
-    mock_response_success.reason = "OK"
-    mock_response_success.raise_for_status = lambda: None
+    with pytest.raises(requests.exceptions.ConnectTimeout):
+        HttpNotificationService(timeout=1).send_payment_notification("http://test.com/notify", {"payment_id": "123"})
 
+    mock_post.assert_called_once()
 
-    mock_post.side_effect = [
-        requests.exceptions.RequestException("Error"),
-        mock_response_success
-    ]
+@patch('requests.post')
+def test_open_circuit_skips_inline_attempt(mock_post, retry_scheduler):
+    from src.constants.circuit_state import CircuitState
 
-    notification_url = "http://test.com/notify"
-    payment_data = {"payment_id": "123"}
+    circuit_breaker = MagicMock()
+    circuit_breaker.acquire.return_value = CircuitState.OPEN
+    service = HttpNotificationService(timeout=1, circuit_breaker=circuit_breaker, retry_scheduler=retry_scheduler)
 
-    result = notification_service.send_payment_notification(notification_url, payment_data)
+    result = service.send_payment_notification("https://merchant.example.com/notify", {"payment_id": "123"})
 
     assert result is True
-    assert mock_post.call_count == 2
+    mock_post.assert_not_called()
+    circuit_breaker.acquire.assert_called_once_with("https://merchant.example.com:443")
+    retry_scheduler.schedule_retry.assert_called_once()
+
+@patch('requests.post')
+def test_failed_attempt_is_recorded_in_circuit_breaker(mock_post):
+    from src.constants.circuit_state import CircuitState
+
+    mock_post.side_effect = requests.exceptions.ConnectTimeout("Timeout")
+    circuit_breaker = MagicMock()
+    circuit_breaker.acquire.return_value = CircuitState.HALF_OPEN
+    service = HttpNotificationService(timeout=1, circuit_breaker=circuit_breaker)
+
+    with pytest.raises(requests.exceptions.ConnectTimeout):
+        service.send_payment_notification("https://merchant.example.com/notify", {"payment_id": "123"})
+
+    mock_post.assert_called_once()
+    circuit_breaker.record_failure.assert_called_once_with("https://merchant.example.com:443")
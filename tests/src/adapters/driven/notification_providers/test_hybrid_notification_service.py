@@ -1,7 +1,11 @@
+import threading
+
 import pytest
 from unittest.mock import MagicMock
 from src.adapters.driven.notification_providers.hybrid_notification_service import HybridNotificationService
+from src.constants.notification_strategy import NotificationStrategy
 from src.core.ports.notification.i_notification_service import INotificationService
+from src.core.shared.latency_histogram import LatencyHistogram
 
 @pytest.fixture
 def mock_service_one():
@@ -73,3 +77,67 @@ def test_send_notification_with_no_services():
     hybrid_service = HybridNotificationService(services={})
     result = hybrid_service.send_payment_notification("url", {})
     assert result is False
+
+def test_race_returns_on_first_success_without_waiting_for_slower_services(mock_service_one, mock_service_two):
+    release = threading.Event()
+    mock_service_one.send_payment_notification.side_effect = lambda url, data: release.wait(5)
+    mock_service_two.send_payment_notification.return_value = True
+
+    services = {"one": mock_service_one, "two": mock_service_two}
+    hybrid_service = HybridNotificationService(services=services, strategy=NotificationStrategy.RACE)
+
+    result = hybrid_service.send_payment_notification("url", {})
+
+    assert result is True
+    assert not release.is_set()
+    mock_service_two.send_payment_notification.assert_called_once_with("url", {})
+    release.set()
+
+def test_race_returns_false_when_all_services_fail(mock_service_one, mock_service_two):
+    mock_service_one.send_payment_notification.return_value = False
+    mock_service_two.send_payment_notification.side_effect = Exception("boom")
+
+    services = {"one": mock_service_one, "two": mock_service_two}
+    hybrid_service = HybridNotificationService(services=services, strategy="race")
+
+    assert hybrid_service.send_payment_notification("url", {}) is False
+
+def test_enqueue_first_uses_queue_before_inline_delivery(mock_service_one, mock_service_two):
+    mock_service_two.send_payment_notification.return_value = True
+
+    services = {"http": mock_service_one, "celery": mock_service_two}
+    hybrid_service = HybridNotificationService(services=services, strategy=NotificationStrategy.ENQUEUE_FIRST)
+
+    assert hybrid_service.send_payment_notification("url", {}) is True
+    mock_service_one.send_payment_notification.assert_not_called()
+
+def test_weighted_picks_first_service_by_weight_and_falls_back_in_order(mock_service_one, mock_service_two):
+    mock_service_two.send_payment_notification.return_value = False
+    mock_service_one.send_payment_notification.return_value = True
+    rng = MagicMock()
+    rng.choices.return_value = ["two"]
+
+    services = {"one": mock_service_one, "two": mock_service_two}
+    hybrid_service = HybridNotificationService(
+        services=services, strategy=NotificationStrategy.WEIGHTED, weights={"one": 1, "two": 3}, rng=rng
+    )
+
+    assert hybrid_service.send_payment_notification("url", {}) is True
+    rng.choices.assert_called_once_with(("one", "two"), weights=(1, 3))
+    mock_service_two.send_payment_notification.assert_called_once_with("url", {})
+    mock_service_one.send_payment_notification.assert_called_once_with("url", {})
+
+def test_latency_is_recorded_per_strategy(mock_service_one):
+    mock_service_one.send_payment_notification.return_value = True
+    histogram = LatencyHistogram(buckets=(0.5, 1.0))
+
+    hybrid_service = HybridNotificationService(
+        services={"one": mock_service_one}, strategy=NotificationStrategy.SEQUENTIAL, latency_histogram=histogram
+    )
+    hybrid_service.send_payment_notification("url", {})
+    hybrid_service.send_payment_notification("url", {})
+
+    snapshot = histogram.snapshot()["sequential"]
+    assert snapshot["count"] == 2
+    assert snapshot["buckets"] == {"0.5": 2, "1.0": 2, "+Inf": 2}
+    assert snapshot["p99"] == 0.5
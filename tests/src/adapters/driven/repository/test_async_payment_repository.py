@@ -0,0 +1,188 @@
+import asyncio
+import pytest
+
+from bson import ObjectId
+from mongoengine.errors import ValidationError
+
+from src.adapters.driven.repositories.async_payment_method_repository import AsyncPaymentMethodRepository
+from src.adapters.driven.repositories.async_payment_repository import AsyncPaymentRepository
+from src.adapters.driven.repositories.async_payment_status_repository import AsyncPaymentStatusRepository
+from src.adapters.driven.repositories.models.payment_model import PaymentModel
+from src.core.domain.entities.payment import Payment
+from src.core.domain.entities.payment_status import PaymentStatus
+from src.core.exceptions.bad_request_exception import BadRequestException
+from src.core.ports.payment.i_async_payment_repository import IAsyncPaymentRepository
+from tests.factories.payment_factory import PaymentFactory
+from tests.factories.payment_method_factory import PaymentMethodFactory
+from tests.factories.payment_status_factory import PaymentStatusFactory
+from tests.fakes.async_mongomock import AsyncMongomockDatabase
+
+
+class TestAsyncPaymentRepository:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        # Same in-memory database the MongoEngine models (and factories) write to
+        db = AsyncMongomockDatabase(PaymentModel._get_collection().database)
+        self.payment_gateway: IAsyncPaymentRepository = AsyncPaymentRepository(db)
+        self.payment_status_gateway = AsyncPaymentStatusRepository(db)
+        self.payment_method_gateway = AsyncPaymentMethodRepository(db)
+
+    def test_create_payment_success(self):
+        payment_method = PaymentMethodFactory()
+        payment_status = PaymentStatusFactory()
+
+        payment = Payment(
+            payment_method=payment_method.to_entity(),
+            payment_status=payment_status.to_entity(),
+            amount=100.0,
+            external_reference="123456",
+            qr_code="QrCode",
+            transaction_id="1234"
+        )
+
+        created_payment = asyncio.run(self.payment_gateway.create_payment(payment))
+
+        assert created_payment.id is not None
+        assert created_payment.payment_method.id == payment_method.id
+        assert created_payment.payment_status.id == payment_status.id
+        assert PaymentModel.objects(id=created_payment.id).first().external_reference == "123456"
+
+    def test_create_payment_invalid_data_raises_error(self):
+        payment = Payment(
+            payment_method=PaymentMethodFactory().to_entity(),
+            payment_status=PaymentStatusFactory().to_entity(),
+            amount=100.0,
+            external_reference=None,
+        )
+
+        with pytest.raises(ValidationError):
+            asyncio.run(self.payment_gateway.create_payment(payment))
+
+    def test_get_payment_by_id_success(self):
+        payment = PaymentFactory()
+
+        data = asyncio.run(self.payment_gateway.get_payment_by_id(str(payment.id)))
+
+        assert data.id == payment.id
+        assert data.external_reference == payment.external_reference
+        assert data.payment_method.id == payment.payment_method.id
+        assert data.payment_status.id == payment.payment_status.id
+
+    def test_get_payment_by_id_invalid_id(self):
+        with pytest.raises(BadRequestException):
+            asyncio.run(self.payment_gateway.get_payment_by_id(123))
+
+    def test_get_payment_by_transaction_id_and_reference(self):
+        payment = PaymentFactory()
+
+        by_transaction = asyncio.run(self.payment_gateway.get_payment_by_transaction_id(payment.transaction_id))
+        by_reference = asyncio.run(self.payment_gateway.get_payment_by_reference(payment.external_reference))
+        missing = asyncio.run(self.payment_gateway.get_payment_by_reference(payment.external_reference + "1"))
+
+        assert by_transaction.id == payment.id
+        assert by_reference.id == payment.id
+        assert missing is None
+
+    def test_update_payment_status_success(self):
+        payment = PaymentFactory()
+        payment_status = PaymentStatusFactory()
+
+        updated_payment = asyncio.run(self.payment_gateway.update_payment_status(payment, payment_status.id))
+
+        assert updated_payment.payment_status.id == payment_status.id
+        assert PaymentModel.objects(id=payment.id).as_pymongo().first()['payment_status'] == payment_status.id
+
+    def test_update_payment_status_with_stale_expected_status_returns_none(self):
+        payment_model = PaymentFactory()
+        payment = asyncio.run(self.payment_gateway.get_payment_by_id(str(payment_model.id)))
+        new_status = PaymentStatusFactory()
+
+        result = asyncio.run(self.payment_gateway.update_payment_status(payment, new_status.id, expected_status_id=ObjectId()))
+
+        assert result is None
+        assert PaymentModel.objects(id=payment_model.id).as_pymongo().first()['payment_status'] == payment_model.payment_status.id
+
+    def test_update_payment_status_unregistered_id(self):
+        payment = PaymentFactory()
+        fake_status_id = ObjectId()
+
+        with pytest.raises(ValueError) as exc_info:
+            asyncio.run(self.payment_gateway.update_payment_status(payment, fake_status_id))
+
+        assert str(exc_info.value) == f"Payment status with ID {fake_status_id} does not exist."
+
+    def test_update_payment_success(self):
+        payment = asyncio.run(self.payment_gateway.get_payment_by_id(str(PaymentFactory().id)))
+        payment.mark_client_notified()
+
+        result = asyncio.run(self.payment_gateway.update_payment(payment))
+
+        assert result.client_notified is True
+        assert PaymentModel.objects(id=payment.id).first().client_notified is True
+
+    def test_update_payment_writes_only_dirty_fields(self):
+        payment_model = PaymentFactory()
+        payment = asyncio.run(self.payment_gateway.get_payment_by_id(str(payment_model.id)))
+        payment.mark_client_notified()
+
+        result = asyncio.run(self.payment_gateway.update_payment(payment))
+
+        assert result.client_notified is True
+        assert payment.dirty_fields == frozenset()
+        assert PaymentModel.objects(id=payment_model.id).as_pymongo().first()['client_notified'] is True
+
+    def test_iter_payments_filters_by_status_and_creation_date(self):
+        import datetime
+        payment_status = PaymentStatusFactory()
+        old = datetime.datetime(2026, 1, 1)
+        recent = datetime.datetime(2026, 2, 1)
+        expected = PaymentFactory(payment_status=payment_status.id, created_at=recent)
+        PaymentFactory(payment_status=payment_status.id, created_at=old)
+        PaymentFactory(created_at=recent)
+
+        async def collect():
+            return [
+                payment async for payment in self.payment_gateway.iter_payments(
+                    payment_status_id=payment_status.id, created_from=datetime.datetime(2026, 1, 15)
+                )
+            ]
+        payments = asyncio.run(collect())
+
+        assert [payment.id for payment in payments] == [expected.id]
+        assert payments[0].payment_status.name == payment_status.name
+
+    def test_list_payments_filters_and_pages_by_keyset(self):
+        cheap = PaymentFactory(amount=10.0)
+        expensive = [PaymentFactory(amount=500.0) for _ in range(2)]
+
+        first_page = asyncio.run(self.payment_gateway.list_payments(limit=1, amount_min=100.0))
+        last = first_page[-1]
+        second_page = asyncio.run(self.payment_gateway.list_payments(
+            limit=1, after=(last.created_at, last.id), amount_min=100.0
+        ))
+
+        assert {first_page[0].id, second_page[0].id} == {payment.id for payment in expensive}
+        assert cheap.id not in {first_page[0].id, second_page[0].id}
+
+    def test_payment_status_crud(self):
+        created = asyncio.run(self.payment_status_gateway.create(PaymentStatus(name="Paid", description="Payment status paid")))
+
+        assert asyncio.run(self.payment_status_gateway.exists_by_name("Paid")) is True
+        assert asyncio.run(self.payment_status_gateway.get_by_name("Paid")).id == created.id
+
+        created.name = "Pending"
+        asyncio.run(self.payment_status_gateway.update(created))
+
+        assert asyncio.run(self.payment_status_gateway.get_by_name("Paid")) is None
+        assert [status.name for status in asyncio.run(self.payment_status_gateway.get_all())] == ["Pending"]
+
+        asyncio.run(self.payment_status_gateway.delete(created))
+
+        assert asyncio.run(self.payment_status_gateway.get_by_id(created.id)) is None
+
+    def test_get_payment_method_by_name(self):
+        payment_method = PaymentMethodFactory(name="qr_code")
+
+        data = asyncio.run(self.payment_method_gateway.get_by_name("qr_code"))
+
+        assert data.id == payment_method.id
@@ -1,4 +1,5 @@
 import pytest
+from unittest.mock import patch
 
 from mongoengine.errors import ValidationError
 
@@ -10,6 +11,7 @@ from src.constants.payment_status import PaymentStatusEnum
 from src.core.ports.payment.i_payment_repository import IPaymentRepository
 from src.adapters.driven.repositories.payment_repository import PaymentRepository
 from src.core.domain.entities.payment import Payment
+from src.core.shared.lazy_relation import LazyRelation
 from tests.factories.payment_factory import PaymentFactory
 from tests.factories.payment_method_factory import PaymentMethodFactory
 from tests.factories.payment_status_factory import PaymentStatusFactory
@@ -48,6 +50,108 @@ class TestPaymentRepository:
         assert created_payment.payment_method.id == payment_method.id
         assert created_payment.payment_status.id == payment_status.id
     
+    def test_create_payments_inserts_batch_and_reports_failures(self):
+        PaymentModel.ensure_indexes()
+        existing = PaymentFactory()
+        payment_method = PaymentMethodFactory().to_entity()
+        payment_status = PaymentStatusFactory().to_entity()
+
+        def build(external_reference):
+            return Payment(
+                payment_method=payment_method,
+                payment_status=payment_status,
+                amount=100.0,
+                external_reference=external_reference,
+            )
+
+        created = self.payment_gateway.create_payments([build("ref-1"), build(existing.external_reference), build(None), build("ref-2")])
+
+        assert [payment is not None for payment in created] == [True, False, False, True]
+        assert created[0].external_reference == "ref-1"
+        assert PaymentModel.objects.count() == 3
+
+    def test_bulk_update_status_by_reference_updates_only_changed_payments(self):
+        new_status = PaymentStatusFactory()
+        changed = PaymentFactory()
+        unchanged = PaymentFactory(payment_status=new_status.id)
+
+        updated = self.payment_gateway.bulk_update_status_by_reference({
+            changed.external_reference: new_status.id,
+            unchanged.external_reference: new_status.id,
+            "unknown-reference": new_status.id,
+        })
+
+        assert updated == 1
+        assert PaymentModel.objects(id=changed.id).as_pymongo().first()['payment_status'] == new_status.id
+        assert self.payment_gateway.bulk_update_status_by_reference({}) == 0
+
+    def test_bulk_update_status_by_reference_enqueues_notifications_for_notify_status(self):
+        completed = PaymentStatusFactory()
+        cancelled = PaymentStatusFactory()
+        approved = PaymentFactory()
+        expired = PaymentFactory()
+
+        self.payment_gateway.bulk_update_status_by_reference(
+            {approved.external_reference: completed.id, expired.external_reference: cancelled.id},
+            notify_status_id=completed.id,
+        )
+
+        assert PaymentModel.objects(id=approved.id).as_pymongo().first()['notification_pending'] is True
+        assert PaymentModel.objects(id=expired.id).as_pymongo().first().get('notification_pending') is not True
+
+    def test_update_payment_status_enqueues_notification_in_the_same_write(self):
+        payment = PaymentFactory()
+        new_status = PaymentStatusFactory()
+
+        updated = self.payment_gateway.update_payment_status(
+            payment.to_entity(), new_status.id, enqueue_notification=True
+        )
+
+        assert updated.notification_pending is True
+        assert PaymentModel.objects(id=payment.id).as_pymongo().first()['notification_pending'] is True
+
+    def test_claim_pending_notifications_leases_and_completes_outbox_entries(self):
+        first = PaymentFactory(notification_pending=True)
+        second = PaymentFactory(notification_pending=True)
+        PaymentFactory()
+
+        claimed = self.payment_gateway.claim_pending_notifications(limit=10, lease_seconds=60)
+
+        assert sorted(payment.id for payment in claimed) == sorted([first.id, second.id])
+        assert self.payment_gateway.claim_pending_notifications(limit=10, lease_seconds=60) == []
+
+        self.payment_gateway.complete_notifications([str(first.id)])
+        self.payment_gateway.release_notifications([str(second.id)])
+
+        document = PaymentModel.objects(id=first.id).as_pymongo().first()
+        assert (document['client_notified'], document['notification_pending']) == (True, False)
+        assert 'notification_claim' not in document
+        assert [payment.id for payment in self.payment_gateway.claim_pending_notifications(10, 60)] == [second.id]
+
+    def test_claim_pending_notifications_reclaims_expired_leases(self):
+        payment = PaymentFactory(notification_pending=True)
+        assert len(self.payment_gateway.claim_pending_notifications(limit=10, lease_seconds=60)) == 1
+
+        reclaimed = self.payment_gateway.claim_pending_notifications(limit=10, lease_seconds=-1)
+
+        assert [item.id for item in reclaimed] == [payment.id]
+
+    def test_iter_payments_streams_untracked_entities(self):
+        import datetime
+        from src.core.shared.identity_map import IdentityMap
+        payment_method = PaymentMethodFactory()
+        expected = PaymentFactory(payment_method=payment_method.id, created_at=datetime.datetime(2026, 2, 1))
+        PaymentFactory(payment_method=payment_method.id, created_at=datetime.datetime(2026, 3, 1))
+        PaymentFactory(created_at=datetime.datetime(2026, 2, 1))
+
+        payments = list(self.payment_gateway.iter_payments(
+            payment_method_id=payment_method.id, created_to=datetime.datetime(2026, 3, 1)
+        ))
+
+        assert [payment.id for payment in payments] == [expected.id]
+        assert payments[0].payment_method.name == payment_method.name
+        assert IdentityMap.get_instance().get(Payment, expected.id) is None
+
     def test_create_payment_invalid_data_raises_error(self):
         payment_method = PaymentMethodFactory()
         payment_status = PaymentStatusFactory()
@@ -110,6 +214,39 @@ class TestPaymentRepository:
         
         assert updated_payment.payment_status.id == payment_status.id
     
+    def test_update_payment_status_with_expected_status(self):
+        payment_model = PaymentFactory()
+        payment = self.payment_gateway.get_payment_by_id(payment_model.id)
+        new_status = PaymentStatusFactory()
+
+        updated_payment = self.payment_gateway.update_payment_status(
+            payment, new_status.id, expected_status_id=payment_model.payment_status.id
+        )
+
+        assert updated_payment.payment_status.id == new_status.id
+        assert PaymentModel.objects(id=payment_model.id).as_pymongo().first()['payment_status'] == new_status.id
+
+    def test_update_payment_status_with_stale_expected_status_returns_none(self):
+        from bson import ObjectId
+        payment_model = PaymentFactory()
+        payment = self.payment_gateway.get_payment_by_id(payment_model.id)
+        new_status = PaymentStatusFactory()
+
+        result = self.payment_gateway.update_payment_status(payment, new_status.id, expected_status_id=ObjectId())
+
+        assert result is None
+        assert PaymentModel.objects(id=payment_model.id).as_pymongo().first()['payment_status'] == payment_model.payment_status.id
+
+    def test_update_payment_status_is_a_single_write(self):
+        payment = self.payment_gateway.get_payment_by_id(PaymentFactory().id)
+        new_status = PaymentStatusFactory()
+        PaymentStatusModel.get_cached(id=new_status.id)
+
+        with patch.object(PaymentModel, 'save') as save_spy:
+            self.payment_gateway.update_payment_status(payment, new_status.id)
+
+        save_spy.assert_not_called()
+
     def test_update_payments_payment_status_unregistered_id(self):
         payment = PaymentFactory()
         
@@ -191,9 +328,148 @@ class TestPaymentRepository:
         assert result.payment_method.id == payment.payment_method.id
         assert result.payment_status.id == payment.payment_status.id
         
+    def test_update_payment_writes_only_dirty_fields(self):
+        payment_model = PaymentFactory()
+        payment = self.payment_gateway.get_payment_by_id(payment_model.id)
+        payment.mark_client_notified()
+
+        assert payment.dirty_fields == {'client_notified'}
+        assert set(PaymentModel.dirty_update(payment)['$set']) == {'client_notified', 'updated_at'}
+
+        with patch.object(PaymentModel, 'save') as save_spy:
+            result = self.payment_gateway.update_payment(payment)
+
+        save_spy.assert_not_called()
+        assert result.client_notified is True
+        assert payment.dirty_fields == frozenset()
+        stored = PaymentModel.objects(id=payment_model.id).as_pymongo().first()
+        assert stored['client_notified'] is True
+        assert stored['external_reference'] == payment_model.external_reference
+
+    def test_update_payment_unsets_cleared_fields(self):
+        payment_model = PaymentFactory()
+        payment = self.payment_gateway.get_payment_by_id(payment_model.id)
+        payment.soft_delete()
+        self.payment_gateway.update_payment(payment)
+
+        payment = self.payment_gateway.get_payment_by_id(payment_model.id)
+        payment.reactivate()
+
+        assert PaymentModel.dirty_update(payment)['$unset'] == {'inactivated_at': ''}
+        self.payment_gateway.update_payment(payment)
+        assert 'inactivated_at' not in PaymentModel.objects(id=payment_model.id).as_pymongo().first()
+
     def test_update_payment_invalid_data_raises_error(self):
         payment = PaymentFactory()
         payment.external_reference=None
         
         with pytest.raises(ValidationError):
             self.payment_gateway.update_payment(payment)
+
+    def test_payment_status_payments_are_loaded_lazily(self):
+        payment_status = PaymentStatusFactory()
+        payment_models = [PaymentFactory(payment_status=payment_status) for _ in range(5)]
+
+        with patch.object(PaymentModel, 'objects', wraps=PaymentModel.objects) as objects_spy:
+            status_entity = payment_status.to_entity()
+            assert isinstance(status_entity.payments, LazyRelation)
+            objects_spy.assert_not_called()
+
+        payments = status_entity.payments
+        payments._batch_size = 2
+
+        assert [payment.id for payment in payments] == sorted(model.id for model in payment_models)
+
+    def test_payment_method_payments_are_loaded_lazily(self):
+        payment_method = PaymentMethodFactory()
+        payment_model = PaymentFactory(payment_method=payment_method)
+
+        method_entity = payment_method.to_entity()
+
+        assert isinstance(method_entity.payments, LazyRelation)
+        assert method_entity.payments.first().id == payment_model.id
+
+    def test_payment_indexes_migration_creates_missing_indexes(self):
+        import os
+        from mongoengine.errors import NotUniqueError
+        from config.init_db import run_migrations
+
+        migrations_dir = os.path.join(os.path.dirname(run_migrations.__file__), 'migrations')
+        migration = run_migrations.load_migration_module(os.path.join(migrations_dir, '003_create_payment_indexes.py'))
+        assert PaymentModel.missing_indexes() != []
+
+        with patch.object(migration, 'connect_db'):
+            migration.upgrade()
+
+        assert PaymentModel.missing_indexes() == []
+        payment = PaymentFactory()
+        with pytest.raises(NotUniqueError):
+            PaymentFactory(external_reference=payment.external_reference)
+
+        with patch.object(migration, 'connect_db'):
+            migration.downgrade()
+
+        assert PaymentModel.missing_indexes() != []
+
+    def test_payment_listing_indexes_migration_replaces_status_index(self):
+        import os
+        from config.init_db import run_migrations
+
+        migrations_dir = os.path.join(os.path.dirname(run_migrations.__file__), 'migrations')
+        migration = run_migrations.load_migration_module(os.path.join(migrations_dir, '004_create_payment_listing_indexes.py'))
+        collection = PaymentModel._get_collection()
+        collection.create_index([('payment_status', 1), ('created_at', 1)], name='payment_status_created_at')
+
+        with patch.object(migration, 'connect_db'):
+            migration.upgrade()
+
+        indexes = collection.index_information()
+        assert 'payment_status_created_at' not in indexes
+        assert {'created_at_id', 'payment_status_created_at_id', 'payment_method_created_at_id'} <= set(indexes)
+
+        with patch.object(migration, 'connect_db'):
+            migration.downgrade()
+
+        indexes = collection.index_information()
+        assert 'payment_status_created_at' in indexes
+        assert 'created_at_id' not in indexes
+
+    def test_notification_outbox_index_migration(self):
+        import os
+        from config.init_db import run_migrations
+
+        migrations_dir = os.path.join(os.path.dirname(run_migrations.__file__), 'migrations')
+        migration = run_migrations.load_migration_module(os.path.join(migrations_dir, '005_create_notification_outbox_index.py'))
+        collection = PaymentModel._get_collection()
+
+        with patch.object(migration, 'connect_db'):
+            migration.upgrade()
+
+        assert collection.index_information()['notification_pending_partial']['partialFilterExpression'] == {
+            'notification_pending': True
+        }
+
+        with patch.object(migration, 'connect_db'):
+            migration.downgrade()
+
+        assert 'notification_pending_partial' not in collection.index_information()
+
+    def test_list_payments_pages_by_created_at_and_id(self):
+        import datetime
+        created_at = datetime.datetime(2026, 1, 1)
+        payment_status = PaymentStatusFactory()
+        payments = [PaymentFactory(payment_status=payment_status.id, created_at=created_at) for _ in range(3)]
+        newest = PaymentFactory(payment_status=payment_status.id, created_at=created_at + datetime.timedelta(days=1))
+        PaymentFactory(created_at=created_at + datetime.timedelta(days=2))
+        expected = [newest.id] + sorted((payment.id for payment in payments), reverse=True)
+
+        first_page = self.payment_gateway.list_payments(limit=2, payment_status_id=payment_status.id)
+        last = first_page[-1]
+        second_page = self.payment_gateway.list_payments(
+            limit=2, after=(last.created_at, last.id), payment_status_id=payment_status.id
+        )
+
+        assert [payment.id for payment in first_page + second_page] == expected
+        assert first_page[0].qr_code == newest.qr_code
+        assert first_page[0].payment_status is None
+
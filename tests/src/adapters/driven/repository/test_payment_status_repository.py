@@ -1,5 +1,7 @@
 
+import time
 import pytest
+from unittest.mock import patch
 from mongoengine.errors import NotUniqueError
 
 from src.adapters.driven.repositories.models.payment_status_model import PaymentStatusModel
@@ -90,3 +92,31 @@ class TestPaymentStatusRepository:
         self.repository.delete(payment_status)
 
         assert len(self.repository.get_all()) == 0
+
+    def test_get_payment_status_by_name_is_served_from_cache(self):
+        PaymentStatusFactory(name="Paid", description="Payment status paid")
+        self.repository.get_by_name("Paid")
+
+        with patch.object(PaymentStatusModel, 'objects', wraps=PaymentStatusModel.objects) as objects_spy:
+            payment_status = self.repository.get_by_name("Paid")
+
+        objects_spy.assert_not_called()
+        assert payment_status.name == "Paid"
+
+    def test_update_payment_status_invalidates_cache(self):
+        payment_status = PaymentStatusFactory(name="Paid", description="Payment status paid")
+        self.repository.get_by_name("Paid")
+
+        payment_status.name = "Pending"
+        self.repository.update(payment_status)
+
+        assert self.repository.get_by_name("Paid") is None
+        assert self.repository.get_by_name("Pending").id == payment_status.id
+
+    def test_cached_payment_status_expires_after_ttl(self):
+        payment_status = PaymentStatusFactory(name="Paid", description="Payment status paid")
+        cache = PaymentStatusModel.get_cache()
+        self.repository.get_by_id(payment_status.id)
+
+        with patch('src.core.shared.reference_data_cache.time.monotonic', return_value=time.monotonic() + cache._ttl_seconds + 1):
+            assert cache.get(('id', str(payment_status.id))) is None
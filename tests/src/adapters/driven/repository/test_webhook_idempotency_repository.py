@@ -0,0 +1,36 @@
+import datetime
+import pytest
+
+from src.adapters.driven.repositories.models.processed_webhook_model import ProcessedWebhookModel
+from src.adapters.driven.repositories.webhook_idempotency_repository import WebhookIdempotencyRepository
+from src.core.ports.payment.i_webhook_idempotency_store import IWebhookIdempotencyStore
+
+
+class TestWebhookIdempotencyRepository:
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.repository: IWebhookIdempotencyStore = WebhookIdempotencyRepository(ttl_seconds=60)
+
+    def test_unknown_key_is_not_processed(self):
+        assert self.repository.is_processed("mercado_pago:payment:123:v1") is False
+
+    def test_mark_processed_registers_key(self):
+        self.repository.mark_processed("mercado_pago:payment:123:v1")
+
+        assert self.repository.is_processed("mercado_pago:payment:123:v1") is True
+        assert self.repository.is_processed("mercado_pago:payment:123:v2") is False
+
+    def test_mark_processed_twice_keeps_a_single_record(self):
+        self.repository.mark_processed("mercado_pago:payment:123:v1")
+        self.repository.mark_processed("mercado_pago:payment:123:v1")
+
+        assert ProcessedWebhookModel.objects(key="mercado_pago:payment:123:v1").count() == 1
+
+    def test_expired_key_is_not_processed(self):
+        ProcessedWebhookModel(
+            key="mercado_pago:payment:123:v1",
+            expires_at=datetime.datetime.now(datetime.UTC) - datetime.timedelta(seconds=1)
+        ).save()
+
+        assert self.repository.is_processed("mercado_pago:payment:123:v1") is False
@@ -0,0 +1,58 @@
+import pytest
+from unittest.mock import patch, MagicMock
+from src.adapters.driven.webhook_queue.celery_webhook_queue import (
+    CeleryPaymentWebhookQueue,
+    process_payment_webhook_task
+)
+from src.adapters.driver.api.v1.controllers.payment_controller import PaymentController
+from src.core.ports.payment.i_payment_webhook_queue import IPaymentWebhookQueue
+
+@pytest.fixture
+def celery_webhook_queue():
+    return CeleryPaymentWebhookQueue()
+
+def test_celery_webhook_queue_is_instance_of_interface(celery_webhook_queue):
+    assert isinstance(celery_webhook_queue, IPaymentWebhookQueue)
+
+@patch('src.adapters.driven.webhook_queue.celery_webhook_queue.process_payment_webhook_task.delay')
+def test_enqueue_webhook_success(mock_delay, celery_webhook_queue):
+    mock_delay.return_value = MagicMock(id="test_task_id")
+    payload = {"type": "payment", "data": {"id": "123"}}
+
+    result = celery_webhook_queue.enqueue(payload)
+
+    assert result is True
+    mock_delay.assert_called_once_with(payload)
+
+@patch('src.adapters.driven.webhook_queue.celery_webhook_queue.process_payment_webhook_task.delay')
+def test_enqueue_webhook_failure(mock_delay, celery_webhook_queue):
+    mock_delay.side_effect = Exception("Queueing error")
+    payload = {"type": "payment", "data": {"id": "123"}}
+
+    result = celery_webhook_queue.enqueue(payload)
+
+    assert result is False
+    mock_delay.assert_called_once_with(payload)
+
+@patch('src.application.usecases.payment_usecase.payment_provider_webhook_handler_use_case.PaymentProviderWebhookHandlerUseCase.build')
+def test_process_payment_webhook_task_runs_handler(mock_build):
+    mock_build.return_value.execute.return_value = {"action": "updated"}
+    payload = {"type": "payment", "data": {"id": "123"}}
+
+    result = process_payment_webhook_task(payload)
+
+    assert result == {"action": "updated"}
+    mock_build.return_value.execute.assert_called_once_with(payload)
+
+def test_controller_enqueues_webhook_without_processing_inline():
+    webhook_queue = MagicMock(spec=IPaymentWebhookQueue)
+    webhook_queue.enqueue.return_value = True
+    payment_provider_gateway = MagicMock()
+    controller = PaymentController(payment_provider_gateway, MagicMock(), MagicMock(), MagicMock(), webhook_queue)
+    payload = {"type": "payment", "data": {"id": "123"}}
+
+    result = controller.payment_provider_webhook(payload)
+
+    assert result == {"action": "enqueued"}
+    webhook_queue.enqueue.assert_called_once_with(payload)
+    payment_provider_gateway.verify_payment.assert_not_called()
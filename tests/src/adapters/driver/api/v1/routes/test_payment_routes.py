@@ -0,0 +1,121 @@
+import csv
+import io
+import json
+from unittest.mock import patch, MagicMock
+from fastapi import status
+
+from src.adapters.driven.repositories.models.payment_model import PaymentModel
+from src.constants.payment_status import PaymentStatusEnum
+from tests.factories.payment_factory import PaymentFactory
+from tests.factories.payment_method_factory import PaymentMethodFactory
+from tests.factories.payment_status_factory import PaymentStatusFactory
+
+
+def build_payment_payload(title="Pedido #1", payment_method="qr_code"):
+    return {
+        "title": title,
+        "payment_method": payment_method,
+        "total_amount": 100.0,
+        "currency": "BRL",
+        "notification_url": "https://example.com/callback",
+        "items": [
+            {"name": "item1", "description": "Item 1", "category": "hamburgers", "quantity": 2, "unit_price": 50.0}
+        ],
+        "customer": {"name": "João da Silva", "email": "joao@example.com"},
+    }
+
+
+@patch('requests.post')
+def test_create_payments_batch_returns_per_item_results(mock_post, client):
+    PaymentMethodFactory(name="qr_code")
+    PaymentStatusFactory(name=PaymentStatusEnum.PAYMENT_PENDING.status)
+
+    def provider_response(url, json, headers):
+        if json["title"] == "Pedido #3":
+            return MagicMock(status_code=400, text="Erro no provedor")
+        return MagicMock(
+            status_code=201,
+            json=MagicMock(return_value={"qr_data": f"qr-{json['title']}", "in_store_order_id": f"txn-{json['title']}"})
+        )
+    mock_post.side_effect = provider_response
+
+    payload = {"payments": [
+        build_payment_payload("Pedido #1"),
+        build_payment_payload("Pedido #2", payment_method="unknown"),
+        build_payment_payload("Pedido #3"),
+        build_payment_payload("Pedido #4"),
+    ]}
+    response = client.post("/api/v1/payments/batch", json=payload)
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert (data["total"], data["succeeded"], data["failed"]) == (4, 2, 2)
+    assert [item["success"] for item in data["results"]] == [True, False, False, True]
+    assert data["results"][0]["payment"]["qr_code_link"] == "qr-Pedido #1"
+    assert data["results"][1]["error"] == "Não foi possível encontrar o método de pagamento informado."
+    assert "Erro no provedor" in data["results"][2]["error"]
+    assert mock_post.call_count == 3
+    assert PaymentModel.objects.count() == 2
+
+
+def test_create_payments_batch_rejects_empty_batch(client):
+    response = client.post("/api/v1/payments/batch", json={"payments": []})
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_export_payments_streams_ndjson_filtered_by_status(client):
+    pending = PaymentStatusFactory(name=PaymentStatusEnum.PAYMENT_PENDING.status)
+    completed = PaymentStatusFactory(name=PaymentStatusEnum.PAYMENT_COMPLETED.status)
+    exported = [PaymentFactory(payment_status=completed.id) for _ in range(3)]
+    PaymentFactory(payment_status=pending.id)
+
+    with patch("src.adapters.driver.api.v1.presenters.export_presenter.ExportPresenter.CHUNK_ROWS", 2):
+        response = client.get("/api/v1/payments/export", params={"payment_status": completed.name})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(row["payment_id"] for row in rows) == sorted(str(payment.id) for payment in exported)
+    assert {row["payment_status"] for row in rows} == {completed.name}
+
+
+def test_export_payments_streams_csv(client):
+    payment = PaymentFactory()
+
+    response = client.get("/api/v1/payments/export", params={"format": "csv"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 1
+    assert rows[0]["payment_id"] == str(payment.id)
+    assert rows[0]["external_reference"] == payment.external_reference
+
+
+def test_export_payments_unknown_status_returns_not_found(client):
+    response = client.get("/api/v1/payments/export", params={"payment_status": "UNKNOWN"})
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_list_payments_follows_cursor_until_last_page(client):
+    notified = [PaymentFactory(client_notified=True, amount=100.0) for _ in range(3)]
+    PaymentFactory(client_notified=False, amount=100.0)
+    PaymentFactory(client_notified=True, amount=5.0)
+
+    params = {"client_notified": "true", "amount_min": 50, "limit": 2}
+    first = client.get("/api/v1/payments", params=params).json()
+    second = client.get("/api/v1/payments", params={**params, "cursor": first["next_cursor"]}).json()
+
+    assert len(first["items"]) == 2 and first["next_cursor"]
+    assert len(second["items"]) == 1 and second["next_cursor"] is None
+    listed = [item["payment_id"] for item in first["items"] + second["items"]]
+    assert sorted(listed) == sorted(str(payment.id) for payment in notified)
+
+
+def test_list_payments_rejects_invalid_cursor(client):
+    response = client.get("/api/v1/payments", params={"cursor": "invalid"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
@@ -0,0 +1,51 @@
+import json
+from unittest.mock import patch, MagicMock
+from fastapi import status
+
+from src.adapters.driven.repositories.models.payment_model import PaymentModel
+from src.constants.payment_status import PaymentStatusEnum
+from tests.factories.payment_factory import PaymentFactory
+from tests.factories.payment_status_factory import PaymentStatusFactory
+
+
+def build_ndjson(*payloads):
+    return "\n".join(json.dumps(payload) for payload in payloads) + "\n"
+
+
+@patch('requests.get')
+def test_replay_webhooks_deduplicates_resources_and_applies_latest_status(mock_get, client):
+    pending = PaymentStatusFactory(name=PaymentStatusEnum.PAYMENT_PENDING.status)
+    completed = PaymentStatusFactory(name=PaymentStatusEnum.PAYMENT_COMPLETED.status)
+    payment = PaymentFactory(payment_status=pending.id, notification_url=None)
+
+    resources = {
+        "1": {"status": "pending", "date_last_updated": "2026-01-01T10:00:00"},
+        "2": {"status": "approved", "date_last_updated": "2026-01-01T10:05:00"},
+    }
+
+    def provider_response(url, headers):
+        data = resources[url.rsplit('/', 1)[-1]]
+        return MagicMock(status_code=200, json=MagicMock(return_value={**data, "external_reference": payment.external_reference}))
+    mock_get.side_effect = provider_response
+
+    body = build_ndjson(
+        {"topic": "payment", "resource": "1"},
+        {"topic": "payment", "resource": "2"},
+        {"topic": "payment", "resource": "2"},
+    ) + "not json\n"
+    response = client.post(
+        "/api/v1/webhook/payment/replay", content=body, headers={"Content-Type": "application/x-ndjson"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "received": 3, "resources": 2, "payments": 1, "updated": 1, "failed": 0, "invalid_lines": 1,
+    }
+    assert mock_get.call_count == 2
+    assert PaymentModel.objects(id=payment.id).as_pymongo().first()['payment_status'] == completed.id
+
+
+def test_replay_webhooks_requires_api_key(client):
+    response = client.post("/api/v1/webhook/payment/replay", content="{}\n", headers={"x-api-key": "invalid"})
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,58 @@
+import pytest
+from unittest.mock import MagicMock
+
+from src.adapters.driven.repositories.models.payment_model import PaymentModel
+from src.adapters.driven.repositories.payment_repository import PaymentRepository
+from src.application.usecases.payment_usecase.dispatch_payment_notifications_usecase import DispatchPaymentNotificationsUseCase
+from src.constants.payment_status import PaymentStatusEnum
+from tests.factories.payment_factory import PaymentFactory
+from tests.factories.payment_status_factory import PaymentStatusFactory
+
+
+class TestDispatchPaymentNotificationsUseCase:
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        PaymentModel.drop_collection()
+        self.completed = PaymentStatusFactory(name=PaymentStatusEnum.PAYMENT_COMPLETED.status)
+        self.notification_service = MagicMock()
+        self.use_case = DispatchPaymentNotificationsUseCase(
+            payment_gateway=PaymentRepository(),
+            notification_service=self.notification_service,
+            batch_size=2,
+        )
+
+    def outbox_payment(self, **kwargs):
+        return PaymentFactory(
+            payment_status=self.completed.id, client_notified=False, notification_pending=True, **kwargs
+        )
+
+    def document(self, payment):
+        return PaymentModel.objects(id=payment.id).as_pymongo().first()
+
+    def test_drains_outbox_in_batches(self):
+        payments = [self.outbox_payment(notification_url=f"https://example.com/callback/{i}") for i in range(3)]
+        without_url = self.outbox_payment()
+        self.notification_service.send_payment_notifications.side_effect = lambda batch: [True] * len(batch)
+
+        metrics = self.use_case.execute()
+
+        assert metrics == {"dispatched": 3, "skipped": 1, "failed": 0}
+        batches = [call.args[0] for call in self.notification_service.send_payment_notifications.call_args_list]
+        assert sorted(len(batch) for batch in batches) == [1, 2]
+        notification_data = batches[0][0][1]
+        assert notification_data["notification_id"].endswith(f":{self.completed.name}")
+        for payment in payments + [without_url]:
+            assert self.document(payment)["notification_pending"] is False
+        assert self.document(payments[0])["client_notified"] is True
+
+    def test_failed_dispatch_stays_in_outbox(self):
+        payment = self.outbox_payment(notification_url="https://example.com/callback")
+        self.notification_service.send_payment_notifications.side_effect = RuntimeError("connection refused")
+
+        metrics = self.use_case.execute()
+
+        assert metrics == {"dispatched": 0, "skipped": 0, "failed": 1}
+        document = self.document(payment)
+        assert (document["notification_pending"], document["client_notified"]) == (True, False)
+        assert "notification_claim" not in document
@@ -0,0 +1,93 @@
+import pytest
+from unittest.mock import MagicMock
+
+from src.adapters.driven.payment_providers.mercado_pago_gateway import MercadoPagoGateway
+from src.application.usecases.payment_usecase.payment_provider_webhook_handler_use_case import PaymentProviderWebhookHandlerUseCase
+from src.constants.payment_status import PaymentStatusEnum
+
+
+class InMemoryWebhookIdempotencyStore:
+    def __init__(self):
+        self.keys = set()
+
+    def is_processed(self, key):
+        return key in self.keys
+
+    def mark_processed(self, key):
+        self.keys.add(key)
+
+
+class TestPaymentProviderWebhookHandlerUseCase:
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.payment_provider_gateway = MagicMock()
+        self.payment_provider_gateway.webhook_idempotency_key.side_effect = MercadoPagoGateway().webhook_idempotency_key
+        self.payment_provider_gateway.verify_payment.return_value = {
+            "external_reference": "ref-1",
+            "payment_status": "approved",
+            "last_modified": "2025-07-11T12:00:00Z",
+            "action": "process",
+        }
+        self.payment_provider_gateway.status_map.return_value = PaymentStatusEnum.PAYMENT_COMPLETED
+        self.payment_gateway = MagicMock()
+        self.payment_status_gateway = MagicMock()
+        self.idempotency_store = InMemoryWebhookIdempotencyStore()
+        self.use_case = PaymentProviderWebhookHandlerUseCase.build(
+            self.payment_provider_gateway,
+            self.payment_gateway,
+            self.payment_status_gateway,
+            webhook_idempotency_store=self.idempotency_store,
+        )
+
+    def test_redelivered_notification_skips_provider(self):
+        payload = {"id": 987, "type": "payment", "action": "payment.updated", "data": {"id": "123"}, "resource": "123"}
+
+        self.use_case.execute(payload)
+        result = self.use_case.execute(payload)
+
+        assert result["action"] == "return"
+        self.payment_provider_gateway.verify_payment.assert_called_once()
+        self.payment_gateway.update_payment_status.assert_called_once()
+
+    def test_same_resource_version_skips_update(self):
+        payload = {"resource": "https://api.mercadopago.com/v1/payments/123", "topic": "payment"}
+
+        self.use_case.execute(payload)
+        result = self.use_case.execute(payload)
+
+        assert result["action"] == "return"
+        assert self.payment_provider_gateway.verify_payment.call_count == 2
+        self.payment_gateway.update_payment_status.assert_called_once()
+
+    def test_new_resource_version_is_processed(self):
+        payload = {"resource": "https://api.mercadopago.com/v1/payments/123", "topic": "payment"}
+        self.use_case.execute(payload)
+
+        self.payment_provider_gateway.verify_payment.return_value = {
+            **self.payment_provider_gateway.verify_payment.return_value,
+            "last_modified": "2025-07-11T12:05:00Z",
+        }
+        self.use_case.execute(payload)
+
+        assert self.payment_gateway.update_payment_status.call_count == 2
+
+    def test_failed_processing_is_not_marked(self):
+        payload = {"resource": "https://api.mercadopago.com/v1/payments/123", "topic": "payment"}
+        self.payment_gateway.get_payment_by_reference.return_value = None
+
+        with pytest.raises(Exception):
+            self.use_case.execute(payload)
+
+        assert self.idempotency_store.keys == set()
+
+    def test_completed_payment_is_enqueued_in_the_notification_outbox(self):
+        payload = {"resource": "https://api.mercadopago.com/v1/payments/123", "topic": "payment"}
+        payment = self.payment_gateway.get_payment_by_reference.return_value
+        payment.notification_url = "https://example.com/callback"
+        payment.client_notified = False
+        self.payment_status_gateway.get_by_name.return_value.name = PaymentStatusEnum.PAYMENT_COMPLETED.status
+
+        self.use_case.execute(payload)
+
+        assert self.payment_gateway.update_payment_status.call_args.kwargs["enqueue_notification"] is True
@@ -0,0 +1,66 @@
+import datetime
+import pytest
+from unittest.mock import MagicMock
+
+from src.adapters.driven.payment_providers.mercado_pago_gateway import MercadoPagoGateway
+from src.adapters.driven.repositories.models.payment_model import PaymentModel
+from src.adapters.driven.repositories.payment_repository import PaymentRepository
+from src.adapters.driven.repositories.payment_status_repository import PaymentStatusRepository
+from src.application.usecases.payment_usecase.reconcile_pending_payments_usecase import ReconcilePendingPaymentsUseCase
+from src.constants.payment_status import PaymentStatusEnum
+from tests.factories.payment_factory import PaymentFactory
+from tests.factories.payment_status_factory import PaymentStatusFactory
+
+
+class TestReconcilePendingPaymentsUseCase:
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.pending = PaymentStatusFactory(name=PaymentStatusEnum.PAYMENT_PENDING.status)
+        self.completed = PaymentStatusFactory(name=PaymentStatusEnum.PAYMENT_COMPLETED.status)
+        self.payment_provider_gateway = MagicMock()
+        self.payment_provider_gateway.status_map.side_effect = MercadoPagoGateway().status_map
+        self.use_case = ReconcilePendingPaymentsUseCase(
+            payment_provider_gateway=self.payment_provider_gateway,
+            payment_gateway=PaymentRepository(),
+            payment_status_gateway=PaymentStatusRepository(),
+            batch_size=2,
+            rate_limit_per_second=1000,
+        )
+
+    def stale_payment(self, **kwargs):
+        created_at = datetime.datetime.now(datetime.UTC) - datetime.timedelta(hours=1)
+        return PaymentFactory(payment_status=self.pending.id, created_at=created_at, client_notified=False, **kwargs)
+
+    def test_corrects_drifted_payments_and_reports_metrics(self):
+        approved = self.stale_payment(notification_url="https://example.com/callback")
+        still_pending = self.stale_payment()
+        unknown = self.stale_payment()
+        PaymentFactory(payment_status=self.pending.id)  # recente: ainda dentro da janela do webhook
+
+        provider_state = {
+            approved.external_reference: {"payment_status": "approved"},
+            still_pending.external_reference: {"payment_status": "pending"},
+            unknown.external_reference: None,
+        }
+        self.payment_provider_gateway.find_payment_by_reference.side_effect = provider_state.__getitem__
+
+        metrics = self.use_case.execute()
+
+        assert {key: metrics[key] for key in ("checked", "drift", "corrected", "not_found", "failed", "notifications_enqueued")} == {
+            "checked": 3, "drift": 1, "corrected": 1, "not_found": 1, "failed": 0, "notifications_enqueued": 1,
+        }
+        assert metrics["throughput_per_second"] > 0
+        approved_document = PaymentModel.objects(id=approved.id).as_pymongo().first()
+        assert approved_document["payment_status"] == self.completed.id
+        assert approved_document["notification_pending"] is True
+        assert PaymentModel.objects(id=still_pending.id).as_pymongo().first()["payment_status"] == self.pending.id
+
+    def test_provider_errors_are_counted_as_failures(self):
+        payment = self.stale_payment()
+        self.payment_provider_gateway.find_payment_by_reference.side_effect = RuntimeError("timeout")
+
+        metrics = self.use_case.execute()
+
+        assert (metrics["checked"], metrics["failed"], metrics["corrected"]) == (1, 1, 0)
+        assert PaymentModel.objects(id=payment.id).as_pymongo().first()["payment_status"] == self.pending.id
@@ -0,0 +1,71 @@
+import asyncio
+
+from src.core.domain.entities.payment_status import PaymentStatus
+from src.core.shared.identity_map import IdentityMap
+
+
+def _status(status_id: str) -> PaymentStatus:
+    return PaymentStatus(id=status_id, name="Completed", description="Completed")
+
+
+def test_scope_isolates_concurrent_async_requests():
+    async def request(status_id: str):
+        with IdentityMap.scope():
+            IdentityMap.get_instance().add(_status(status_id))
+            await asyncio.sleep(0.01)
+            identity_map = IdentityMap.get_instance()
+            return identity_map.get(PaymentStatus, "a"), identity_map.get(PaymentStatus, "b")
+
+    async def main():
+        return await asyncio.gather(request("a"), request("b"))
+
+    (a_seen, b_unseen), (a_unseen, b_seen) = asyncio.run(main())
+
+    assert a_seen.id == "a" and b_seen.id == "b"
+    assert a_unseen is None and b_unseen is None
+
+
+def test_scope_restores_previous_map_and_counts_hits_and_misses():
+    outer = IdentityMap.get_instance()
+
+    with IdentityMap.scope() as identity_map:
+        assert IdentityMap.get_instance() is identity_map
+        identity_map.add(_status("a"))
+        identity_map.get(PaymentStatus, "a")
+        identity_map.get(PaymentStatus, "missing")
+
+    assert identity_map.stats()["hits"] == 1 and identity_map.stats()["misses"] == 1
+    assert IdentityMap.get_instance() is outer
+
+
+def test_least_recently_used_entities_are_evicted_above_max_entries():
+    identity_map = IdentityMap(max_entries=2, max_bytes=0)
+    identity_map.add(_status("a"))
+    identity_map.add(_status("b"))
+    identity_map.get(PaymentStatus, "a")
+    identity_map.add(_status("c"))
+
+    assert identity_map.get(PaymentStatus, "b") is None
+    assert identity_map.get(PaymentStatus, "a") is not None
+    assert identity_map.stats()["evictions"] == 1
+    assert identity_map.stats()["peak_size"] == 2
+
+
+def test_max_bytes_bounds_the_approximate_size():
+    identity_map = IdentityMap(max_entries=100, max_bytes=1)
+    identity_map.add(_status("a"))
+
+    assert len(identity_map) == 0
+    assert identity_map.stats()["bytes"] == 0
+
+
+def test_weak_refs_drop_entities_no_longer_referenced():
+    identity_map = IdentityMap(weak_refs=True)
+    status = _status("a")
+    identity_map.add(status)
+    assert identity_map.get(PaymentStatus, "a") is status
+
+    del status
+
+    assert identity_map.get(PaymentStatus, "a") is None
+    assert len(identity_map) == 0
@@ -0,0 +1,139 @@
+import asyncio
+import json
+import unittest
+import httpx
+from src.constants.payment_status import PaymentStatusEnum
+from src.adapters.driven.payment_providers.async_mercado_pago_gateway import AsyncMercadoPagoGateway
+from src.core.exceptions.bad_request_exception import BadRequestException
+from src.core.shared.single_flight import AsyncSingleFlight
+
+class TestAsyncMercadoPagoGateway(unittest.IsolatedAsyncioTestCase):
+
+    def build_gateway(self, handler, single_flight=None):
+        self.requests = []
+
+        def recording_handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            return handler(request)
+
+        self.client = httpx.AsyncClient(transport=httpx.MockTransport(recording_handler))
+        return AsyncMercadoPagoGateway(client=self.client, single_flight=single_flight)
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+    async def test_initiate_payment_success(self):
+        gateway = self.build_gateway(
+            lambda request: httpx.Response(201, json={"qr_data": "qr_code_link", "in_store_order_id": "transaction_id"})
+        )
+
+        result = await gateway.initiate_payment({
+            "external_reference": "order-1-uuid",
+            "payment_notification_url": "http://example.com/webhook",
+            "total_amount": 100.0,
+            "items": [],
+            "title": "Order 1",
+            "description": "Order 1 description"
+        })
+
+        self.assertEqual(result["qr_data"], "qr_code_link")
+        self.assertEqual(result["in_store_order_id"], "transaction_id")
+        self.assertEqual(self.requests[0].method, "POST")
+        self.assertEqual(json.loads(self.requests[0].content)["external_reference"], "order-1-uuid")
+        self.assertTrue(self.requests[0].headers["Authorization"].startswith("Bearer "))
+
+    async def test_initiate_payment_failure(self):
+        gateway = self.build_gateway(lambda request: httpx.Response(400, text="Error"))
+
+        with self.assertRaises(BadRequestException):
+            await gateway.initiate_payment({"external_reference": "order-1-uuid"})
+
+    async def test_verify_payment_success(self):
+        gateway = self.build_gateway(lambda request: httpx.Response(200, json={
+            "external_reference": "order-1-uuid",
+            "status": "approved",
+            "date_last_updated": "2023-01-01T00:00:00Z"
+        }))
+
+        result = await gateway.verify_payment({"resource": "https://api.mercadopago.com/v1/payments/12345"})
+
+        self.assertEqual(result["external_reference"], "order-1-uuid")
+        self.assertEqual(result["payment_status"], "approved")
+        self.assertEqual(str(self.requests[0].url), "https://api.mercadopago.com/v1/payments/12345")
+
+    async def test_verify_payment_merchant_order_topic(self):
+        gateway = self.build_gateway(lambda request: httpx.Response(200, json={"status": "closed"}))
+
+        await gateway.verify_payment({"resource": "12345", "topic": "merchant_order"})
+
+        self.assertEqual(str(self.requests[0].url), "https://api.mercadopago.com/merchant_orders/12345")
+
+    async def test_verify_payment_failure(self):
+        gateway = self.build_gateway(lambda request: httpx.Response(404, text="Not found"))
+
+        with self.assertRaises(BadRequestException):
+            await gateway.verify_payment({"resource": "https://api.mercadopago.com/v1/payments/12345"})
+
+    async def test_verify_payment_no_resource(self):
+        gateway = self.build_gateway(lambda request: httpx.Response(200, json={}))
+
+        with self.assertRaises(BadRequestException):
+            await gateway.verify_payment({})
+        self.assertEqual(self.requests, [])
+
+    async def test_verify_payment_created_action_is_ignored(self):
+        gateway = self.build_gateway(lambda request: httpx.Response(200, json={}))
+
+        result = await gateway.verify_payment({"action": "payment.created"})
+
+        self.assertEqual(result["action"], "return")
+        self.assertEqual(self.requests, [])
+
+    async def test_status_map(self):
+        gateway = self.build_gateway(lambda request: httpx.Response(200, json={}))
+
+        self.assertEqual(gateway.status_map("approved"), PaymentStatusEnum.PAYMENT_COMPLETED)
+        with self.assertRaises(BadRequestException):
+            gateway.status_map("unknown_status")
+
+    async def test_verify_payment_concurrent_lookups_share_one_request(self):
+        self.requests = []
+
+        async def slow_handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"external_reference": "order-1-uuid", "status": "approved"})
+
+        self.client = httpx.AsyncClient(transport=httpx.MockTransport(slow_handler))
+        gateway = AsyncMercadoPagoGateway(client=self.client, single_flight=AsyncSingleFlight(ttl_seconds=0))
+        payload = {"resource": "https://api.mercadopago.com/v1/payments/12345"}
+
+        results = await asyncio.gather(*(gateway.verify_payment(payload) for _ in range(5)))
+
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual([result["payment_status"] for result in results], ["approved"] * 5)
+
+    async def test_verify_payment_reuses_recent_result(self):
+        gateway = self.build_gateway(
+            lambda request: httpx.Response(200, json={"status": "approved"}),
+            single_flight=AsyncSingleFlight(ttl_seconds=60)
+        )
+        payload = {"resource": "https://api.mercadopago.com/v1/payments/12345"}
+
+        await gateway.verify_payment(payload)
+        await gateway.verify_payment(payload)
+
+        self.assertEqual(len(self.requests), 1)
+
+    async def test_verify_payment_failures_are_not_cached(self):
+        gateway = self.build_gateway(
+            lambda request: httpx.Response(500, text="Error"),
+            single_flight=AsyncSingleFlight(ttl_seconds=60)
+        )
+        payload = {"resource": "https://api.mercadopago.com/v1/payments/12345"}
+
+        for _ in range(2):
+            with self.assertRaises(BadRequestException):
+                await gateway.verify_payment(payload)
+
+        self.assertEqual(len(self.requests), 2)
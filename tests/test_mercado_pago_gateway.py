@@ -1,8 +1,11 @@
+import threading
+import time
 import unittest
 from unittest.mock import patch, MagicMock
 from src.constants.payment_status import PaymentStatusEnum
 from src.adapters.driven.payment_providers.mercado_pago_gateway import MercadoPagoGateway
 from src.core.exceptions.bad_request_exception import BadRequestException
+from src.core.shared.single_flight import SingleFlight
 
 class TestMercadoPagoGateway(unittest.TestCase):
 
@@ -105,3 +108,62 @@ class TestMercadoPagoGateway(unittest.TestCase):
         with self.assertRaises(BadRequestException):
             self.gateway.status_map("unknown_status")
 
+    @patch('requests.get')
+    def test_verify_payment_concurrent_lookups_share_one_request(self, mock_get):
+        def slow_get(*args, **kwargs):
+            time.sleep(0.05)
+            return MagicMock(status_code=200, json=MagicMock(return_value={"external_reference": "order-1-uuid", "status": "approved"}))
+        mock_get.side_effect = slow_get
+        gateway = MercadoPagoGateway(single_flight=SingleFlight(ttl_seconds=0))
+        payload = {"resource": "https://api.mercadopago.com/v1/payments/12345"}
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(gateway.verify_payment(payload))) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual([result["payment_status"] for result in results], ["approved"] * 5)
+
+    @patch('requests.get')
+    def test_verify_payment_reuses_recent_result(self, mock_get):
+        mock_get.return_value = MagicMock(status_code=200, json=MagicMock(return_value={"status": "approved"}))
+        gateway = MercadoPagoGateway(single_flight=SingleFlight(ttl_seconds=60))
+        payload = {"resource": "https://api.mercadopago.com/v1/payments/12345"}
+
+        gateway.verify_payment(payload)
+        gateway.verify_payment(payload)
+        gateway.verify_payment({"resource": "https://api.mercadopago.com/v1/payments/67890"})
+
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch('requests.get')
+    def test_verify_payment_failures_are_not_cached(self, mock_get):
+        mock_get.return_value = MagicMock(status_code=500, text="Error")
+        gateway = MercadoPagoGateway(single_flight=SingleFlight(ttl_seconds=60))
+        payload = {"resource": "https://api.mercadopago.com/v1/payments/12345"}
+
+        for _ in range(2):
+            with self.assertRaises(BadRequestException):
+                gateway.verify_payment(payload)
+
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch('requests.get')
+    def test_find_payment_by_reference_returns_latest_payment(self, mock_get):
+        mock_get.return_value = MagicMock(status_code=200, json=MagicMock(return_value={
+            "results": [{"external_reference": "order-1", "status": "approved", "date_last_updated": "2026-01-01"}]
+        }))
+
+        result = self.gateway.find_payment_by_reference("order-1")
+
+        self.assertEqual(result["payment_status"], "approved")
+        self.assertEqual(mock_get.call_args.kwargs["params"]["external_reference"], "order-1")
+
+    @patch('requests.get')
+    def test_find_payment_by_reference_without_results_returns_none(self, mock_get):
+        mock_get.return_value = MagicMock(status_code=200, json=MagicMock(return_value={"results": []}))
+
+        self.assertIsNone(self.gateway.find_payment_by_reference("order-1"))